@@ -17,14 +17,19 @@
 from PySide6.QtWidgets import (
     QWidget, QPlainTextEdit, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QComboBox, QPushButton, QFrame, QGridLayout, 
-    QSpacerItem, QSizePolicy, QListWidget, QListWidgetItem,
-    QCheckBox, QFormLayout, QScrollArea, QFileDialog
+    QSpacerItem, QSizePolicy, QListView,
+    QCheckBox, QFormLayout, QScrollArea, QFileDialog, QStackedWidget,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
 )
 from PySide6.QtGui import QFont, QFontMetrics
-from PySide6.QtCore import Qt
-import importlib.util
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, Signal, QTimer,
+    QAbstractListModel, QAbstractProxyModel, QModelIndex
+)
 import os
 import sys
+import time
+from collections import OrderedDict, deque
 
 # Define the version number at the top
 VERSION = "1.0.0"
@@ -32,6 +37,208 @@ VERSION = "1.0.0"
 # Define the tab label for the tab widget
 TAB_LABEL = f"AuthCheck v{VERSION}"
 
+# Maximum number of authentication checks running at the same time
+MAX_CONCURRENT_CHECKS = 32
+
+# Seconds one check may take, all of its requests included
+CHECK_DEADLINE = 60.0
+
+# Milliseconds between refreshes of the timings panel while results arrive
+TIMINGS_REFRESH_MS = 500
+
+# Every check result is appended to this SQLite database
+RESULTS_DB = os.path.join('modules', 'AuthCheck_results.db')
+
+# Milliseconds of typing pause before the module filter is applied
+FILTER_DEBOUNCE_MS = 120
+
+# Built form pages kept for recently used modules
+FORM_CACHE_SIZE = 16
+
+# Status window: lines kept on screen, flush interval, and the spill file
+# that keeps the full (rotated) history for searching
+STATUS_MAX_BLOCKS = 5000
+STATUS_FLUSH_MS = 100
+STATUS_LOG = os.path.join('modules', 'AuthCheck_status.log')
+
+
+class AuthWorkerSignals(QObject):
+    """Signals emitted by AuthWorker back to the GUI thread."""
+    finished = Signal(int, bool, str, float, object)  # check_id, success, message, latency, phases
+    error = Signal(int, str, float, object)    # check_id, exception text, latency, phases
+
+
+class AuthWorker(QRunnable):
+    """Run a module's authenticate() on a QThreadPool thread."""
+
+    def __init__(self, check_id, module, form_data, session_pool=None, deadline=CHECK_DEADLINE):
+        super().__init__()
+        self.check_id = check_id
+        self.module = module
+        self.form_data = form_data
+        self.session_pool = session_pool
+        self.deadline = deadline
+        self.signals = AuthWorkerSignals()
+
+    def authenticate(self, trace):
+        with trace.activate():
+            if self.session_pool is not None:
+                # Reuse keep-alive HTTP connections across checks
+                with self.session_pool.activate():
+                    return self.module.authenticate(self.form_data)
+            return self.module.authenticate(self.form_data)
+
+    def run(self):
+        from auth_utils import DeadlineExceeded, call_with_deadline
+        from tracing import Trace
+        
+        start = time.perf_counter()
+        trace = Trace()
+        try:
+            success, message = call_with_deadline(self.authenticate, (trace,), self.deadline)
+        except DeadlineExceeded as e:
+            self.signals.finished.emit(self.check_id, False, str(e), time.perf_counter() - start,
+                                       trace.phases())
+        except Exception as e:
+            self.signals.error.emit(self.check_id, str(e), time.perf_counter() - start, trace.phases())
+        else:
+            self.signals.finished.emit(self.check_id, bool(success), str(message),
+                                       time.perf_counter() - start, trace.phases())
+
+
+class StatusLogSink(QObject):
+    """
+    Batch status lines into a QPlainTextEdit.
+
+    write() may be called from any thread. Queued lines are appended to the
+    widget in one call per flush interval, the widget keeps only the last
+    max_blocks lines, and everything is also written to a spill file.
+    """
+
+    def __init__(self, text_edit, spill=None, interval_ms=STATUS_FLUSH_MS,
+                 max_blocks=STATUS_MAX_BLOCKS, parent=None):
+        super().__init__(parent)
+        self.text_edit = text_edit
+        self.text_edit.setMaximumBlockCount(max_blocks)
+        self.spill = spill
+        self._queue = deque()  # (text, spill) - deque appends are thread-safe
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start()
+
+    def write(self, text, spill=True):
+        """Queue text (one or more lines) for the status window."""
+        self._queue.append((text, spill))
+
+    def flush(self):
+        """Append all queued lines to the widget and the spill file."""
+        if not self._queue:
+            return
+        lines = []
+        spilled = []
+        while self._queue:
+            text, spill = self._queue.popleft()
+            lines.append(text)
+            if spill:
+                spilled.append(text)
+        self.text_edit.appendPlainText('\n'.join(lines))
+        if spilled and self.spill is not None:
+            try:
+                self.spill.write('\n'.join(spilled))
+            except OSError:
+                self.spill = None  # Keep the GUI working if the disk is full
+
+    def close(self):
+        """Flush remaining lines and close the spill file."""
+        self.timer.stop()
+        self.flush()
+        if self.spill is not None:
+            self.spill.close()
+
+
+class ModuleListModel(QAbstractListModel):
+    """All modules as (display_name, module_name) rows, in display order."""
+
+    def __init__(self, rows, parent=None):
+        super().__init__(parent)
+        self.rows = rows
+        self.row_of = {module_name: row for row, (_, module_name) in enumerate(rows)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        display_name, module_name = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return display_name
+        if role == Qt.UserRole:
+            return module_name
+        return None
+
+
+class ModuleFilterProxy(QAbstractProxyModel):
+    """
+    Show only the source rows given to set_rows().
+
+    The row list comes from a ModuleIndex search, so applying a filter
+    costs time proportional to the number of matches, not the number of
+    modules.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = None       # Source rows shown, or None for all
+        self._positions = {}    # {source row: proxy row}
+
+    def setSourceModel(self, model):
+        self.beginResetModel()
+        super().setSourceModel(model)
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        """Show these source rows (sorted), or every row if rows is None."""
+        self.beginResetModel()
+        self._rows = rows
+        self._positions = {} if rows is None else {row: i for i, row in enumerate(rows)}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().rowCount() if self._rows is None else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        if parent.isValid() or column != 0 or not 0 <= row < self.rowCount():
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        row = proxy_index.row()
+        if self._rows is not None:
+            row = self._rows[row]
+        return self.sourceModel().index(row, 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._rows is not None:
+            row = self._positions.get(row)
+            if row is None:
+                return QModelIndex()
+        return self.index(row, 0)
+
 
 class Ui_TabContent:
     def setupUi(self, widget):
@@ -80,7 +287,25 @@ class Ui_TabContent:
 
         self.verticalLayout_list.addWidget(self.frame_filter)
 
-        self.ModulesList = QListWidget(self.frame_list)
+        # Facet row: Category + Protocol
+        self.frame_facets = QFrame(self.frame_list)
+        self.frame_facets.setFrameShape(QFrame.NoFrame)
+        self.horizontalLayout_facets = QHBoxLayout(self.frame_facets)
+        self.horizontalLayout_facets.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_facets.setSpacing(5)
+
+        self.CategoryCombo = QComboBox(self.frame_facets)
+        self.CategoryCombo.setToolTip("Only show modules in this category")
+        self.horizontalLayout_facets.addWidget(self.CategoryCombo, stretch=1)
+
+        self.ProtocolCombo = QComboBox(self.frame_facets)
+        self.ProtocolCombo.setToolTip("Only show modules using this protocol or client library")
+        self.horizontalLayout_facets.addWidget(self.ProtocolCombo, stretch=1)
+
+        self.verticalLayout_list.addWidget(self.frame_facets)
+
+        self.ModulesList = QListView(self.frame_list)
+        self.ModulesList.setUniformItemSizes(True)
         self.verticalLayout_list.addWidget(self.ModulesList)
 
         self.gridLayout.addWidget(self.frame_list, 0, 0, 1, 1)
@@ -98,18 +323,10 @@ class Ui_TabContent:
         self.label_form_title.setFont(form_title_font)
         self.verticalLayout_form.addWidget(self.label_form_title)
 
-        # Scroll area for the form
-        self.scrollArea = QScrollArea(self.frame_form)
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setFrameShape(QFrame.NoFrame)
-        
-        self.scrollAreaWidget = QWidget()
-        self.formLayout = QFormLayout(self.scrollAreaWidget)
-        self.formLayout.setContentsMargins(10, 10, 10, 10)
-        self.formLayout.setSpacing(10)
-        
-        self.scrollArea.setWidget(self.scrollAreaWidget)
-        self.verticalLayout_form.addWidget(self.scrollArea)
+        # One scrollable form page per recently used module
+        self.FormStack = QStackedWidget(self.frame_form)
+        self.FormStack.addWidget(QWidget())  # Empty page until a module is selected
+        self.verticalLayout_form.addWidget(self.FormStack)
 
         # Button frame at bottom of form
         self.frame_buttons = QFrame(self.frame_form)
@@ -125,6 +342,23 @@ class Ui_TabContent:
         self.horizontalSpacer_buttons = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
         self.horizontalLayout_buttons.addItem(self.horizontalSpacer_buttons)
 
+        self.DepthCombo = QComboBox(self.frame_buttons)
+        self.DepthCombo.addItem("Full check", "full")
+        self.DepthCombo.addItem("Identity only", "identity")
+        self.DepthCombo.addItem("Auth only", "auth-only")
+        self.DepthCombo.setToolTip("How much to do after a successful login, for modules that support it")
+        self.horizontalLayout_buttons.addWidget(self.DepthCombo)
+
+        self.CancelButton = QPushButton(self.frame_buttons)
+        self.CancelButton.setText("Cancel")
+        self.CancelButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.horizontalLayout_buttons.addWidget(self.CancelButton)
+
+        self.TryDefaultsButton = QPushButton(self.frame_buttons)
+        self.TryDefaultsButton.setText("Try Defaults")
+        self.TryDefaultsButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.horizontalLayout_buttons.addWidget(self.TryDefaultsButton)
+
         self.CheckButton = QPushButton(self.frame_buttons)
         self.CheckButton.setText("Check")
         font_bold = QFont()
@@ -157,6 +391,44 @@ class Ui_TabContent:
         self.StatusTextBox.setFont(status_font)
         self.verticalLayout_status.addWidget(self.StatusTextBox)
 
+        # Search row for the status history
+        self.frame_log_search = QFrame(self.frame_status)
+        self.frame_log_search.setFrameShape(QFrame.NoFrame)
+        self.horizontalLayout_log_search = QHBoxLayout(self.frame_log_search)
+        self.horizontalLayout_log_search.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_log_search.setSpacing(5)
+
+        self.LogSearchEdit = QLineEdit(self.frame_log_search)
+        self.LogSearchEdit.setPlaceholderText("Search status history...")
+        self.horizontalLayout_log_search.addWidget(self.LogSearchEdit)
+
+        self.LogSearchButton = QPushButton(self.frame_log_search)
+        self.LogSearchButton.setText("Search")
+        self.LogSearchButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.horizontalLayout_log_search.addWidget(self.LogSearchButton)
+
+        # Per-phase latency percentiles, shown on demand
+        self.TimingsGroupCombo = QComboBox(self.frame_log_search)
+        self.TimingsGroupCombo.addItem("By module", "module")
+        self.TimingsGroupCombo.addItem("By host", "host")
+        self.TimingsGroupCombo.setVisible(False)
+        self.horizontalLayout_log_search.addWidget(self.TimingsGroupCombo)
+
+        self.TimingsButton = QPushButton(self.frame_log_search)
+        self.TimingsButton.setText("Timings")
+        self.TimingsButton.setCheckable(True)
+        self.TimingsButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.horizontalLayout_log_search.addWidget(self.TimingsButton)
+
+        self.verticalLayout_status.addWidget(self.frame_log_search)
+
+        self.TimingsTable = QTableWidget(self.frame_status)
+        self.TimingsTable.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.TimingsTable.setSelectionMode(QAbstractItemView.NoSelection)
+        self.TimingsTable.verticalHeader().setVisible(False)
+        self.TimingsTable.setVisible(False)
+        self.verticalLayout_status.addWidget(self.TimingsTable)
+
         self.verticalLayout_main.addWidget(self.frame_status, stretch=1)
 
 
@@ -167,37 +439,150 @@ class TabContent(QWidget):
         self.ui = Ui_TabContent()
         self.ui.setupUi(self)
 
-        # Track loaded modules and form widgets
-        self.modules = {}
+        # Track module metadata, imported modules and form widgets
+        self.manifest = None
+        self.module_info = {}   # {module_name: manifest entry}
+        self.modules = {}       # {module_name: module} - imported on demand
         self.current_module = None
-        self.form_widgets = {}  # {module_name: {field_name: widget}}
+        self.form_widgets = {}  # {module_name: {field_name: widget}} - cached pages only
         self.form_values = {}   # {module_name: {field_name: value}} - persisted values
+        self.form_pages = OrderedDict()  # {module_name: page} - LRU order, newest last
+        self.form_cache_size = FORM_CACHE_SIZE
         self.port_toggle_map = {}  # {module_name: {port_field: {checkbox_field, tls_port, non_tls_port}}}
 
+        # Background authentication checks
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(MAX_CONCURRENT_CHECKS)
+        self.next_check_id = 1
+        self.pending_checks = {}  # {check_id: (module_name, display_name, target, username)}
+        self.active_workers = {}  # {check_id: worker} - kept alive until run() returns
+        self.session_pool = None  # Created on the first check
+        self.result_store = None  # Opened on the first result
+        self.default_creds = None  # Default credentials from module hints, compiled on first use
+        self.process_lane = None  # Worker processes for native-driver modules, started on first use
+        self.latency = None       # Per-phase timings of finished checks (tracing.LatencyStats)
+
         # Add module_libs to sys.path
         module_libs_path = os.path.join('modules', 'AuthCheck_module_libs')
         if module_libs_path not in sys.path:
             sys.path.insert(0, module_libs_path)
 
+        # Sockets opened during a check stop at its deadline; connects,
+        # handshakes and lookups are timed per check
+        from auth_utils import install_socket_deadlines
+        from tracing import LatencyStats, install as install_tracing
+        install_socket_deadlines()
+        install_tracing()
+        self.latency = LatencyStats()
+        self.timings_timer = QTimer(self)
+        self.timings_timer.setSingleShot(True)
+        self.timings_timer.setInterval(TIMINGS_REFRESH_MS)
+
+        # Status window output is batched and spilled to a rotating file
+        from status_log import RotatingLog
+        self.status = StatusLogSink(self.ui.StatusTextBox, RotatingLog(STATUS_LOG), parent=self)
+
+        # Module list model, filter proxy and search index
+        self.module_model = None
+        self.module_proxy = ModuleFilterProxy(self)
+        self.module_index = None
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+
         # Load authentication modules
         self.load_auth_modules()
 
         # Connect signals
-        self.ui.ModulesList.itemClicked.connect(self.on_module_selected)
-        self.ui.ModulesList.currentItemChanged.connect(self.on_module_selected)
+        self.ui.ModulesList.clicked.connect(self.on_module_selected)
+        self.ui.ModulesList.selectionModel().currentChanged.connect(self.on_module_selected)
         self.ui.ClearButton.clicked.connect(self.clear_form)
         self.ui.CheckButton.clicked.connect(self.check_authentication)
+        self.ui.TryDefaultsButton.clicked.connect(self.try_defaults)
+        self.ui.CancelButton.clicked.connect(self.cancel_checks)
         
-        # Filter signals
-        self.ui.FilterEdit.textChanged.connect(self.filter_modules)
+        # Filter signals - typing is debounced, facets apply at once
+        self.ui.FilterEdit.textChanged.connect(self.schedule_filter)
+        self.filter_timer.timeout.connect(self.filter_modules)
+        self.ui.CategoryCombo.currentIndexChanged.connect(self.filter_modules)
+        self.ui.ProtocolCombo.currentIndexChanged.connect(self.filter_modules)
         self.ui.FilterClearButton.clicked.connect(self.clear_filter)
+        
+        # Status history search
+        self.ui.LogSearchButton.clicked.connect(self.search_log)
+        self.ui.LogSearchEdit.returnPressed.connect(self.search_log)
+        
+        # Timings panel
+        self.ui.TimingsButton.toggled.connect(self.toggle_timings)
+        self.ui.TimingsGroupCombo.currentIndexChanged.connect(self.refresh_timings)
+        self.timings_timer.timeout.connect(self.refresh_timings)
 
         # Initially disable buttons until a module is selected
         self.ui.ClearButton.setEnabled(False)
         self.ui.CheckButton.setEnabled(False)
+        self.ui.TryDefaultsButton.setEnabled(False)
+        self.ui.CancelButton.setEnabled(False)
+        self.ui.DepthCombo.setEnabled(False)
+
+    def log(self, text):
+        """Write text to the status window (batched; safe from any thread)."""
+        self.status.write(text)
+
+    def search_log(self):
+        """Show status history lines matching the search text."""
+        text = self.ui.LogSearchEdit.text().strip()
+        if not text:
+            return
+        self.status.flush()
+        if self.status.spill is None:
+            self.status.write("[SEARCH] Status history is not being saved", spill=False)
+            return
+        matches, total = self.status.spill.search(text)
+        # Search output is shown but not added to the history it searches
+        lines = [f"\n[SEARCH] '{text}': {total} match(es)"
+                 + (f", showing the last {len(matches)}" if total > len(matches) else "")]
+        lines.extend(matches)
+        self.status.write('\n'.join(lines), spill=False)
+
+    def toggle_timings(self, checked):
+        """Show or hide the per-phase latency panel."""
+        self.ui.TimingsTable.setVisible(checked)
+        self.ui.TimingsGroupCombo.setVisible(checked)
+        self.refresh_timings()
+
+    def refresh_timings(self):
+        """Fill the timings panel with p50/p95/p99 per module or host, slowest first."""
+        if not self.ui.TimingsButton.isChecked():
+            return
+        from tracing import PERCENTILES, PHASES
+        
+        group = self.ui.TimingsGroupCombo.currentData()
+        summary = self.latency.summary(group)
+        keys = sorted(summary, key=lambda key: summary[key]['total'][95], reverse=True)
+        
+        table = self.ui.TimingsTable
+        headers = [group.capitalize(), "Checks"] + [f"{phase} p50/p95/p99 ms" for phase in PHASES]
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setRowCount(len(keys))
+        for row, key in enumerate(keys):
+            stats = summary[key]
+            cells = [str(key), str(stats['count'])] + [
+                '/'.join(f"{stats[phase][pct] * 1000:.0f}" for pct in PERCENTILES) for phase in PHASES
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, column, item)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
 
     def load_auth_modules(self):
-        """Load all authentication modules from the AuthCheck_modules directory."""
+        """Load authentication module metadata from the AuthCheck_modules directory."""
+        from default_creds import DefaultCredentials
+        from module_index import ModuleIndex
+        from module_manifest import ModuleManifest
+
         modules_dir = os.path.join('modules', 'AuthCheck_modules')
         
         # Create directory if it doesn't exist
@@ -206,99 +591,174 @@ class TabContent(QWidget):
         # Temporary list to hold module info for sorting
         module_list = []
         
-        if os.path.isdir(modules_dir):
-            for filename in os.listdir(modules_dir):
-                if filename.endswith('.py') and filename != '__init__.py':
-                    module_name = filename[:-3]
-                    file_path = os.path.join(modules_dir, filename)
-                    spec = importlib.util.spec_from_file_location(module_name, file_path)
-                    if spec is None:
-                        self.ui.StatusTextBox.appendPlainText(f"Error: Could not create spec for {filename}")
-                        continue
-                    module = importlib.util.module_from_spec(spec)
-                    try:
-                        spec.loader.exec_module(module)
-                        # Verify module has required attributes
-                        if hasattr(module, 'form_fields') and hasattr(module, 'authenticate'):
-                            self.modules[module_name] = module
-                            display_name = getattr(module, 'module_description', module_name)
-                            module_list.append((display_name, module_name))
-                            # Initialize form values storage
-                            self.form_values[module_name] = {}
-                        else:
-                            self.ui.StatusTextBox.appendPlainText(
-                                f"Warning: {filename} missing 'form_fields' or 'authenticate'"
-                            )
-                    except Exception as e:
-                        self.ui.StatusTextBox.appendPlainText(f"Error loading {filename}: {e}")
-        
-        # Sort by display name (case-insensitive) and add to list widget
-        for display_name, module_name in sorted(module_list, key=lambda x: x[0].lower()):
-            item = QListWidgetItem(display_name)
-            item.setData(Qt.UserRole, module_name)
-            self.ui.ModulesList.addItem(item)
-        
-        if not self.modules:
-            self.ui.StatusTextBox.appendPlainText("No authentication modules found in 'modules/AuthCheck_modules/'")
+        # Metadata comes from the manifest; module code is only run on demand
+        self.manifest = ModuleManifest(modules_dir)
+        for message in self.manifest.refresh():
+            self.log(message)
+        self.default_creds = DefaultCredentials(self.manifest)
+        
+        for module_name, info in self.manifest.available():
+            self.module_info[module_name] = info
+            display_name = info.get('module_description', module_name)
+            module_list.append((display_name, module_name))
+            # Initialize form values storage
+            self.form_values[module_name] = {}
+        
+        # Sort by display name (case-insensitive) and show in the list
+        module_list.sort(key=lambda x: x[0].lower())
+        self.module_model = ModuleListModel(module_list, self)
+        self.module_proxy.setSourceModel(self.module_model)
+        self.ui.ModulesList.setModel(self.module_proxy)
+        
+        # Index names, categories and protocols once for filtering
+        self.module_index = ModuleIndex([
+            (module_name, display_name, self.module_info[module_name].get('imports', []))
+            for display_name, module_name in module_list
+        ])
+        self.fill_facet_combo(self.ui.CategoryCombo, "All categories", self.module_index.categories)
+        self.fill_facet_combo(self.ui.ProtocolCombo, "All protocols", self.module_index.protocols)
+        
+        if not self.module_info:
+            self.log("No authentication modules found in 'modules/AuthCheck_modules/'")
         else:
-            self.ui.StatusTextBox.appendPlainText(f"Loaded {len(self.modules)} authentication modules.")
+            self.log(f"Loaded {len(self.module_info)} authentication modules.")
 
-    def filter_modules(self, filter_text):
-        """Filter the modules list based on the filter text."""
-        filter_text = filter_text.lower()
+    def get_module(self, module_name):
+        """
+        Import a module on first use and cache it.
         
-        for i in range(self.ui.ModulesList.count()):
-            item = self.ui.ModulesList.item(i)
-            display_name = item.text().lower()
-            module_name = item.data(Qt.UserRole).lower()
-            
-            # Show item if filter text is found in display name or module name
-            if filter_text in display_name or filter_text in module_name:
-                item.setHidden(False)
+        Modules using native drivers are not imported into the GUI process;
+        their checks run in worker processes so a driver crash cannot take
+        the GUI down.
+        """
+        module = self.modules.get(module_name)
+        if module is not None:
+            return module
+        from process_lane import LANE_PROCESS, ProcessLane, module_lane
+        try:
+            if module_lane(self.module_info[module_name]) == LANE_PROCESS:
+                if self.process_lane is None:
+                    self.process_lane = ProcessLane(self.manifest.modules_dir)
+                module = self.process_lane.module(module_name)
             else:
-                item.setHidden(True)
+                module = self.manifest.load_module(module_name)
+        except Exception as e:
+            self.log(f"Error loading {module_name}.py: {e}")
+            return None
+        self.modules[module_name] = module
+        return module
+
+    def fill_facet_combo(self, combo, all_label, facets):
+        """Fill a facet combo with 'All' plus each value and its module count."""
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItem(all_label, '')
+        for value in sorted(facets, key=str.lower):
+            combo.addItem(f"{value} ({len(facets[value])})", value)
+        combo.blockSignals(False)
+
+    def schedule_filter(self, filter_text=None):
+        """Restart the debounce timer on each keystroke."""
+        self.filter_timer.start()
+
+    def filter_modules(self):
+        """Filter the modules list by the filter text and facets."""
+        self.filter_timer.stop()
+        rows = self.module_index.search(
+            self.ui.FilterEdit.text(),
+            category=self.ui.CategoryCombo.currentData(),
+            protocol=self.ui.ProtocolCombo.currentData(),
+        )
+        self.module_proxy.set_rows(rows)
+        
+        # Keep the current module highlighted if it is still listed
+        if self.current_module:
+            row = self.module_model.row_of[self.current_module]
+            index = self.module_proxy.mapFromSource(self.module_model.index(row))
+            if index.isValid():
+                self.ui.ModulesList.setCurrentIndex(index)
 
     def clear_filter(self):
-        """Clear the filter text and show all modules."""
+        """Clear the filter text and facets and show all modules."""
+        for combo in (self.ui.CategoryCombo, self.ui.ProtocolCombo):
+            combo.blockSignals(True)
+            combo.setCurrentIndex(0)
+            combo.blockSignals(False)
         self.ui.FilterEdit.clear()
+        self.filter_modules()
 
-    def on_module_selected(self, item, previous=None):
+    def on_module_selected(self, index, previous=None):
         """Handle module selection from the list."""
-        if item is None:
+        if index is None or not index.isValid():
             return
-        module_name = item.data(Qt.UserRole)
+        module_name = index.data(Qt.UserRole)
         if module_name == self.current_module:
             return  # Already selected
         
-        # Save current form values before switching
-        if self.current_module:
-            self.save_form_values()
-        
         self.current_module = module_name
-        module = self.modules[module_name]
+        info = self.module_info[module_name]
         
         # Update form title
-        display_name = getattr(module, 'module_description', module_name)
+        display_name = info.get('module_description', module_name)
         self.ui.label_form_title.setText(display_name)
         
-        # Build the form
-        self.build_form(module_name, module)
+        # Show the cached form page, building it if needed
+        self.show_form(module_name, info)
         
         # Enable buttons
         self.ui.ClearButton.setEnabled(True)
         self.ui.CheckButton.setEnabled(True)
+        defaults = self.default_creds.get(module_name)
+        self.ui.TryDefaultsButton.setEnabled(bool(defaults))
+        self.ui.TryDefaultsButton.setToolTip(
+            ', '.join(f"{u} / {p or '(blank)'}" for u, p in defaults) if defaults
+            else "No default credentials known for this module")
+        self.ui.DepthCombo.setEnabled(bool(info.get('verification_depths')))
 
-    def build_form(self, module_name, module):
-        """Build the dynamic form based on module's form_fields."""
-        # Clear existing form widgets
-        while self.ui.formLayout.count():
-            item = self.ui.formLayout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def show_form(self, module_name, info):
+        """Switch to a module's form page, reusing it if it is cached."""
+        page = self.form_pages.get(module_name)
+        if page is not None:
+            self.form_pages.move_to_end(module_name)
+        else:
+            page = self.build_form(module_name, info)
+            self.ui.FormStack.addWidget(page)
+            self.form_pages[module_name] = page
+        self.ui.FormStack.setCurrentWidget(page)
+        
+        # Drop the least recently used pages beyond the cache size
+        while len(self.form_pages) > max(self.form_cache_size, 1):
+            self.evict_form(next(iter(self.form_pages)))
+
+    def evict_form(self, module_name):
+        """Save a cached page's values and destroy its widgets."""
+        self.save_form_values(module_name)
+        page = self.form_pages.pop(module_name)
+        self.ui.FormStack.removeWidget(page)
+        page.deleteLater()
+        self.form_widgets.pop(module_name, None)
+        self.port_toggle_map.pop(module_name, None)
+
+    def build_form(self, module_name, info):
+        """
+        Build a form page based on the module's form_fields.
+
+        Returns:
+            QScrollArea: The page, to be added to the form stack
+        """
+        page = QScrollArea()
+        page.setWidgetResizable(True)
+        page.setFrameShape(QFrame.NoFrame)
+        
+        form_widget = QWidget()
+        form_layout = QFormLayout(form_widget)
+        form_layout.setContentsMargins(10, 10, 10, 10)
+        form_layout.setSpacing(10)
+        page.setWidget(form_widget)
         
         self.form_widgets[module_name] = {}
         self.port_toggle_map[module_name] = {}
-        form_fields = getattr(module, 'form_fields', [])
+        form_fields = info.get('form_fields', [])
         
         # Get saved values for this module
         saved_values = self.form_values.get(module_name, {})
@@ -409,7 +869,7 @@ class TabContent(QWidget):
                 elif field_default:
                     widget.setText(str(field_default))
             
-            self.ui.formLayout.addRow(label, widget)
+            form_layout.addRow(label, widget)
             self.form_widgets[module_name][field_name] = widget
         
         # Store port toggle info for this module
@@ -431,6 +891,8 @@ class TabContent(QWidget):
                         lambda state, pw=port_widget, tp=tls_port, ntp=non_tls_port: 
                             self.on_tls_toggle(state, pw, tp, ntp)
                     )
+        
+        return page
 
     def browse_file(self, line_edit, file_filter):
         """Open file dialog and set the path in the line edit."""
@@ -450,12 +912,12 @@ class TabContent(QWidget):
             if non_tls_port:
                 port_widget.setText(str(non_tls_port))
 
-    def save_form_values(self):
-        """Save current form values for the current module."""
-        if not self.current_module:
+    def save_form_values(self, module_name=None):
+        """Save form values for a module (default: the current module)."""
+        module_name = module_name or self.current_module
+        if not module_name:
             return
         
-        module_name = self.current_module
         if module_name not in self.form_widgets:
             return
         
@@ -503,12 +965,12 @@ class TabContent(QWidget):
         if module_name not in self.form_widgets:
             return
         
-        module = self.modules.get(module_name)
-        if not module:
+        info = self.module_info.get(module_name)
+        if not info:
             return
         
         # Build a dict of field defaults
-        form_fields = getattr(module, 'form_fields', [])
+        form_fields = info.get('form_fields', [])
         defaults = {}
         for field in form_fields:
             field_name = field.get('name', '')
@@ -536,17 +998,17 @@ class TabContent(QWidget):
         # Clear saved values too
         self.form_values[module_name] = {}
         
-        self.ui.StatusTextBox.appendPlainText("Form reset to defaults")
+        self.log("Form reset to defaults")
 
     def check_authentication(self):
         """Attempt authentication using the current module and form data."""
         if not self.current_module:
-            self.ui.StatusTextBox.appendPlainText("Error: No authentication system selected")
+            self.log("Error: No authentication system selected")
             return
         
-        module = self.modules.get(self.current_module)
+        module = self.get_module(self.current_module)
         if not module:
-            self.ui.StatusTextBox.appendPlainText("Error: Module not found")
+            self.log("Error: Module not found")
             return
         
         # Get form data
@@ -555,22 +1017,151 @@ class TabContent(QWidget):
         # Save form values
         self.save_form_values()
         
-        display_name = getattr(module, 'module_description', self.current_module)
-        self.ui.StatusTextBox.appendPlainText(f"\n{'='*60}")
-        self.ui.StatusTextBox.appendPlainText(f"Checking authentication for: {display_name}")
-        self.ui.StatusTextBox.appendPlainText(f"{'='*60}")
+        display_name = self.module_info[self.current_module].get('module_description', self.current_module)
+        check_id = self.start_check(module, form_data, display_name)
+        self.log(f"\n{'='*60}\nChecking authentication for: {display_name} (#{check_id})\n{'='*60}")
+
+    def try_defaults(self):
+        """Check every default credential of the current module against the form's target."""
+        if not self.current_module:
+            return
         
-        try:
-            # Call the module's authenticate function
-            success, message = module.authenticate(form_data)
-            
-            if success:
-                self.ui.StatusTextBox.appendPlainText(f"[SUCCESS] {message}")
-            else:
-                self.ui.StatusTextBox.appendPlainText(f"[FAILED] {message}")
-                
-        except Exception as e:
-            self.ui.StatusTextBox.appendPlainText(f"[ERROR] Exception during authentication: {e}")
+        module_name = self.current_module
+        defaults = self.default_creds.get(module_name)
+        if not defaults:
+            self.log("No default credentials known for this module")
+            return
+        
+        module = self.get_module(module_name)
+        if not module:
+            self.log("Error: Module not found")
+            return
+        
+        form_data = self.get_form_data()
+        self.save_form_values()
+        
+        from batch_runner import apply_credential
+        form_fields = self.module_info[module_name].get('form_fields', [])
+        display_name = self.module_info[module_name].get('module_description', module_name)
+        self.log(f"\n{'='*60}\nTrying {len(defaults)} default credential(s) for: {display_name}\n{'='*60}")
+        for username, password in defaults:
+            check_data = dict(form_data)
+            if not apply_credential(form_fields, check_data, username, password):
+                self.log("Error: This module has no password field to fill")
+                return
+            check_id = self.start_check(module, check_data, f"{display_name} [{username}]")
+            self.log(f"Queued {username} / {password or '(blank)'} (#{check_id})")
+
+    def start_check(self, module, form_data, display_name):
+        """
+        Queue a check of the current module on the thread pool.
+        
+        Returns:
+            int: The check id used in its result messages
+        """
+        from auth_utils import module_depth
+        from results import form_identity
+        
+        depth = module_depth(self.module_info[self.current_module], self.ui.DepthCombo.currentData())
+        if depth is not None:
+            form_data = dict(form_data, verification_depth=depth)
+        
+        check_id = self.next_check_id
+        self.next_check_id += 1
+        target, username = form_identity(form_data)
+        
+        # Run the module's authenticate function off the GUI thread
+        worker = AuthWorker(check_id, module, form_data, self.get_session_pool())
+        worker.setAutoDelete(False)
+        worker.signals.finished.connect(self.on_check_finished)
+        worker.signals.error.connect(self.on_check_error)
+        self.pending_checks[check_id] = (self.current_module, display_name, target, username)
+        self.active_workers[check_id] = worker
+        self.ui.CancelButton.setEnabled(True)
+        self.thread_pool.start(worker)
+        return check_id
+
+    def get_session_pool(self):
+        """Return the shared HTTP connection pool, or None without requests."""
+        if self.session_pool is None:
+            import http_pool
+            if http_pool.install():
+                self.session_pool = http_pool.SessionPool()
+        return self.session_pool
+
+    def get_result_store(self):
+        """Return the result database, or None if it cannot be opened."""
+        if self.result_store is None:
+            from results import ResultStore
+            try:
+                # GUI results trickle in - commit each one
+                self.result_store = ResultStore(RESULTS_DB, batch_size=1)
+            except Exception as e:
+                self.log(f"Results will not be saved: {e}")
+                self.result_store = False
+        return self.result_store or None
+
+    def record_result(self, check, success, message, latency, raised=False, phases=None):
+        """Append a finished check to the result database and the timings."""
+        from results import AuthResult, classify
+        module_name, _, target, username = check
+        if phases:
+            from urllib.parse import urlsplit
+            parts = urlsplit(target if '://' in target else '//' + target)
+            self.latency.add(module_name, (parts.hostname or target).lower(), phases)
+            if self.ui.TimingsButton.isChecked() and not self.timings_timer.isActive():
+                self.timings_timer.start()
+        store = self.get_result_store()
+        if store is None:
+            return
+        store.add(AuthResult(module_name, target, username, classify(success, message, raised),
+                             round(latency, 4), message, phases=phases or None))
+
+    def on_check_finished(self, check_id, success, message, latency, phases):
+        """Report the result of a background check."""
+        self.active_workers.pop(check_id, None)
+        check = self.pending_checks.pop(check_id, None)
+        if check is None:
+            return  # Cancelled - result abandoned
+        
+        display_name = check[1]
+        self.record_result(check, success, message, latency, phases=phases)
+        if success:
+            self.log(f"[SUCCESS] {display_name} (#{check_id}): {message}")
+        else:
+            self.log(f"[FAILED] {display_name} (#{check_id}): {message}")
+        self.ui.CancelButton.setEnabled(bool(self.pending_checks))
+
+    def on_check_error(self, check_id, error, latency, phases):
+        """Report an exception raised by a background check."""
+        self.active_workers.pop(check_id, None)
+        check = self.pending_checks.pop(check_id, None)
+        if check is None:
+            return  # Cancelled - result abandoned
+        
+        display_name = check[1]
+        self.record_result(check, False, f"Exception during authentication: {error}", latency,
+                           phases=phases, raised=True)
+        self.log(
+            f"[ERROR] {display_name} (#{check_id}): Exception during authentication: {error}"
+        )
+        self.ui.CancelButton.setEnabled(bool(self.pending_checks))
+
+    def cancel_checks(self):
+        """Abandon all checks that are still queued or running."""
+        if not self.pending_checks:
+            return
+        
+        # Queued checks never start; running ones finish in the background
+        # and their results are ignored
+        for check_id in self.pending_checks:
+            worker = self.active_workers.get(check_id)
+            if worker is not None and self.thread_pool.tryTake(worker):
+                del self.active_workers[check_id]
+        count = len(self.pending_checks)
+        self.pending_checks.clear()
+        self.ui.CancelButton.setEnabled(False)
+        self.log(f"[CANCELLED] {count} check(s) abandoned")
 
     def showEvent(self, event):
         """Set focus when the tab is shown."""
@@ -579,5 +1170,20 @@ class TabContent(QWidget):
 
     def cleanup(self):
         """Clean up resources before closing."""
-        # Save current form values
-        self.save_form_values()
+        # Save form values of every cached page
+        for module_name in self.form_pages:
+            self.save_form_values(module_name)
+        
+        # Drop queued checks and ignore any still running
+        self.cancel_checks()
+        
+        if self.session_pool is not None:
+            self.session_pool.close()
+        
+        if self.process_lane is not None:
+            self.process_lane.close()
+        
+        if self.result_store:
+            self.result_store.close()
+        
+        self.status.close()
@@ -0,0 +1,136 @@
+# AuthCheck benchmark - module metadata loading
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Compares the startup cost of reading module_description/form_fields by
+# executing every module (exec_module) against static AST extraction.
+# Each path runs in a fresh interpreter so peak RSS is not shared, on a
+# temporary copy of the modules directory so bytecode left in __pycache__
+# by earlier runs cannot skew the result. exec_module is measured both
+# cold (no bytecode, as on a fresh checkout or after an update) and warm
+# (bytecode already compiled).
+#
+# Usage: python bench_module_metadata.py [--modules-dir DIR] [--runs N]
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBS_DIR = os.path.join(BASE_DIR, 'AuthCheck_module_libs')
+DEFAULT_MODULES_DIR = os.path.join(BASE_DIR, 'AuthCheck_modules')
+
+
+def _peak_rss_kb():
+    """Return this process's peak RSS in KiB."""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _child(path, modules_dir):
+    """Load every module's metadata using one path and print the stats."""
+    sys.path.insert(0, LIBS_DIR)
+    from module_manifest import import_module_file
+    from module_metadata import extract_metadata
+
+    filenames = sorted(f for f in os.listdir(modules_dir)
+                       if f.endswith('.py') and f != '__init__.py')
+    loaded = 0
+    fallbacks = 0
+    start = time.perf_counter()
+    for filename in filenames:
+        file_path = os.path.join(modules_dir, filename)
+        if path == 'ast':
+            metadata = extract_metadata(file_path)
+            if metadata is None:
+                fallbacks += 1
+                try:
+                    import_module_file(filename[:-3], file_path)
+                except Exception:
+                    continue
+            loaded += 1
+        else:
+            try:
+                import_module_file(filename[:-3], file_path)
+            except Exception:
+                continue
+            loaded += 1
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        'path': path,
+        'modules': loaded,
+        'fallbacks': fallbacks,
+        'seconds': elapsed,
+        'peak_rss_kb': _peak_rss_kb(),
+    }))
+
+
+def _run_path(path, modules_dir, write_bytecode=False):
+    """Run one path in a fresh interpreter and return its stats."""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    if not write_bytecode:
+        env['PYTHONDONTWRITEBYTECODE'] = '1'
+    output = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), '--child', path, '--modules-dir', modules_dir],
+        text=True, env=env,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _best(runs):
+    """Return the fastest run, with the highest peak RSS of all runs."""
+    best = min(runs, key=lambda r: r['seconds'])
+    best['peak_rss_kb'] = max(r['peak_rss_kb'] for r in runs)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark AuthCheck module metadata loading")
+    parser.add_argument('--modules-dir', default=DEFAULT_MODULES_DIR)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--child', choices=['exec', 'ast'], help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child, args.modules_dir)
+        return 0
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='authcheck-bench-') as tmp:
+        modules_dir = os.path.join(tmp, 'AuthCheck_modules')
+        shutil.copytree(args.modules_dir, modules_dir, ignore=shutil.ignore_patterns('__pycache__'))
+
+        # No bytecode is written, so every run compiles every module
+        results['exec-cold'] = _best([_run_path('exec', modules_dir) for _ in range(args.runs)])
+        results['ast'] = _best([_run_path('ast', modules_dir) for _ in range(args.runs)])
+
+        # One run that writes __pycache__, then runs that reuse it
+        _run_path('exec', modules_dir, write_bytecode=True)
+        results['exec-warm'] = _best([_run_path('exec', modules_dir) for _ in range(args.runs)])
+
+    print(f"{'path':<10} {'modules':>8} {'fallbacks':>10} {'best (s)':>10} {'peak RSS (MiB)':>15}")
+    for path, r in results.items():
+        print(f"{path:<10} {r['modules']:>8} {r['fallbacks']:>10} {r['seconds']:>10.3f} {r['peak_rss_kb'] / 1024:>15.1f}")
+
+    if results['ast']['seconds'] > 0:
+        print()
+        for path in ('exec-cold', 'exec-warm'):
+            print(f"ast vs {path}: {results[path]['seconds'] / results['ast']['seconds']:.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,272 @@
+# AuthCheck benchmark - modules against local stand-in servers
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Runs representative modules through the batch runner's job path (HTTP
+# pool, deadlines, tracing) against the stand-in servers in
+# standin_servers.py and reports attempts/sec, latency percentiles and peak
+# RSS per scenario. Every tenth attempt uses the valid credentials, so the
+# number of successes also checks that the module still works. Each
+# scenario runs in a fresh interpreter; the servers run in another process
+# so they share neither the GIL nor the RSS figure.
+#
+# Results can be saved as a baseline and later runs compared against it;
+# a scenario that got slower, grew, or returned wrong results is flagged
+# and the exit status is 1.
+#
+# Usage:
+#   python bench_modules.py [--attempts N] [--workers W] [--only ssh-password,ldap-simple]
+#   python bench_modules.py --only ssh-password --sweep 32   # credentials per connection
+#   python bench_modules.py --only http-json,ldap-simple --depth auth-only
+#   python bench_modules.py --save-baseline baseline.json
+#   python bench_modules.py --baseline baseline.json [--tolerance 0.2]
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBS_DIR = os.path.join(BASE_DIR, 'AuthCheck_module_libs')
+DEFAULT_MODULES_DIR = os.path.join(BASE_DIR, 'AuthCheck_modules')
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.insert(0, BENCH_DIR)
+from standin_servers import VALID_BIND_DN, VALID_PASSWORD, VALID_USERNAME  # noqa: E402
+
+
+BASELINE_VERSION = 1
+DEFAULT_ATTEMPTS = 200
+DEFAULT_WORKERS = 16
+DEFAULT_TOLERANCE = 0.2   # Relative change that counts as a regression
+VALID_EVERY = 10          # Every Nth attempt uses the valid credentials
+
+# name: (module, stand-in server, form field overrides, username, valid_only)
+SCENARIOS = {
+    'http-json': ('Synology_DSM', 'http', {'use_https': False}, VALID_USERNAME, False),
+    'https-json': ('Synology_DSM', 'https', {'use_https': True}, VALID_USERNAME, False),
+    'http-basic': ('Jetty', 'http', {'auth_type': 'Basic'}, VALID_USERNAME, False),
+    'http-form': ('Jetty', 'http', {'auth_type': 'Form'}, VALID_USERNAME, False),
+    'ldap-simple': ('LDAP', 'ldap', {}, VALID_BIND_DN, False),
+    'ssh-password': ('SSH', 'ssh', {'auth_type': 'Password'}, VALID_USERNAME, False),
+    'ftp': ('FTP', 'ftp', {'protocol': 'FTP'}, VALID_USERNAME, False),
+    'redis-auth': ('Redis', 'redis', {'use_acl': False}, None, False),
+    'sip-digest': ('SIP', 'sip', {'transport': 'UDP'}, VALID_USERNAME, False),
+    'fix-logon': ('FIX_Protocol', 'fix', {}, VALID_USERNAME, False),
+    # Agents silently drop wrong communities; a failed attempt only measures
+    # the module's retry timeout, so every attempt uses the valid one
+    'snmp-community': ('SNMP', 'snmp', {'version': 'v2c'}, None, True),
+}
+
+# Metrics compared against a baseline: (key, higher_is_better)
+COMPARED = (('attempts_per_sec', True), ('p95_ms', False), ('peak_rss_kb', False))
+
+
+def _peak_rss_kb():
+    """Return this process's peak RSS in KiB."""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _credentials(username, attempts, valid_only):
+    """Yield attempt credentials, every VALID_EVERY-th one valid."""
+    for i in range(attempts):
+        if valid_only or i % VALID_EVERY == 0:
+            yield username, VALID_PASSWORD
+        else:
+            yield username, f'wrong-password-{i}'
+
+
+def _child(name, port, attempts, workers, modules_dir, sweep=0, depth=None):
+    """Run one scenario against a running stand-in and print its stats."""
+    import warnings
+    warnings.filterwarnings('ignore', message='Unverified HTTPS request')  # Self-signed stand-ins
+    sys.path.insert(0, LIBS_DIR)
+    import auth_utils
+    import batch_runner
+    import http_pool
+    import tracing
+    from module_manifest import ModuleManifest
+
+    module_name, _, overrides, username, valid_only = SCENARIOS[name]
+    manifest = ModuleManifest(modules_dir)
+    manifest.refresh()
+    target = f'127.0.0.1:{port}'
+
+    auth_utils.install_socket_deadlines()
+    tracing.install()
+    session_pool = http_pool.SessionPool() if http_pool.install() else None
+
+    # Warm-up: imports, SSL contexts, first connection; also detects a
+    # module whose client library is not installed
+    warmup = next(batch_runner.plan_jobs(manifest, [module_name], [target],
+                                         [(username, VALID_PASSWORD)], overrides, depth=depth))
+    result = batch_runner.run_job(manifest, warmup, session_pool, deadline=batch_runner.DEFAULT_DEADLINE)
+    if result['outcome'] == 'missing_dependency':
+        print(json.dumps({'scenario': name, 'skipped': result['message']}))
+        return
+
+    latencies = []
+    outcomes = {}
+
+    def on_result(job, result):
+        latencies.append(result['elapsed'])
+        outcomes[result['outcome']] = outcomes.get(result['outcome'], 0) + 1
+
+    jobs = batch_runner.plan_jobs(manifest, [module_name], [target],
+                                  list(_credentials(username, attempts, valid_only)), overrides, depth=depth)
+    if sweep > 1:
+        jobs = batch_runner.sweep_jobs(manifest, jobs, sweep)
+    start = time.perf_counter()
+    batch_runner.run_jobs(manifest, jobs, workers, on_result, session_pool,
+                          deadline=batch_runner.DEFAULT_DEADLINE)
+    elapsed = time.perf_counter() - start
+    if session_pool is not None:
+        session_pool.close()
+
+    latencies.sort()
+    expected = sum(1 for _, password in _credentials(username, attempts, valid_only)
+                   if password == VALID_PASSWORD)
+    print(json.dumps({
+        'scenario': name,
+        'module': module_name,
+        'attempts': len(latencies),
+        'success': outcomes.get('success', 0),
+        'expected_success': expected,
+        'outcomes': outcomes,
+        'attempts_per_sec': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': tracing.percentile(latencies, 50) * 1000,
+        'p95_ms': tracing.percentile(latencies, 95) * 1000,
+        'p99_ms': tracing.percentile(latencies, 99) * 1000,
+        'peak_rss_kb': _peak_rss_kb(),
+    }))
+
+
+def _run_scenario(name, port, args):
+    """Run one scenario in a fresh interpreter and return its stats."""
+    # requests lets a CA bundle from the environment override a session's
+    # verify=False, which would reject the stand-ins' self-signed certificate
+    env = {k: v for k, v in os.environ.items() if k not in ('REQUESTS_CA_BUNDLE', 'CURL_CA_BUNDLE')}
+    output = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), '--child', name, '--port', str(port),
+         '--attempts', str(args.attempts), '--workers', str(args.workers), '--sweep', str(args.sweep),
+         '--modules-dir', args.modules_dir] + (['--depth', args.depth] if args.depth else []),
+        text=True, env=env,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _start_servers(names):
+    """Start the stand-in servers in a separate process."""
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(BENCH_DIR, 'standin_servers.py'), '--only', ','.join(names)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+    )
+    ports = json.loads(process.stdout.readline())
+    return process, ports
+
+
+def compare(result, baseline, tolerance):
+    """
+    Compare a scenario's stats with its baseline.
+
+    Args:
+        result (dict): Stats from this run
+        baseline (dict): Stats from the baseline, or None
+        tolerance (float): Relative change allowed before a metric regresses
+
+    Returns:
+        list: Human-readable regressions (empty if none)
+    """
+    problems = []
+    if result['success'] != result['expected_success']:
+        problems.append(f"{result['success']} successes, expected {result['expected_success']}")
+    if baseline is None:
+        return problems
+    for key, higher_is_better in COMPARED:
+        old, new = baseline.get(key), result.get(key)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        if (-change if higher_is_better else change) > tolerance:
+            problems.append(f"{key} {old:.1f} -> {new:.1f} ({change:+.0%})")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark AuthCheck modules against local stand-in servers")
+    parser.add_argument('--attempts', type=int, default=DEFAULT_ATTEMPTS, help="Attempts per scenario")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Concurrent checks")
+    parser.add_argument('--only', help=f"Comma-separated scenarios (default all: {', '.join(SCENARIOS)})")
+    parser.add_argument('--sweep', type=int, default=0, metavar='N',
+                        help="Group N credentials per connection for modules with authenticate_sweep()")
+    parser.add_argument('--depth', choices=['auth-only', 'identity', 'full'],
+                        help="Verification depth for modules that support it (default: full check)")
+    parser.add_argument('--baseline', metavar='FILE', help="Compare with a saved baseline")
+    parser.add_argument('--save-baseline', metavar='FILE', help="Save this run as the baseline")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Relative change flagged as a regression (default {DEFAULT_TOLERANCE:g})")
+    parser.add_argument('--modules-dir', default=DEFAULT_MODULES_DIR)
+    parser.add_argument('--child', choices=list(SCENARIOS), help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child, args.port, args.attempts, args.workers, args.modules_dir, args.sweep, args.depth)
+        return 0
+
+    names = [n.strip() for n in args.only.split(',')] if args.only else list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('scenarios', {})
+
+    servers, ports = _start_servers(sorted({SCENARIOS[n][1] for n in names}))
+    results = {}
+    try:
+        print(f"{'scenario':<16} {'module':<14} {'attempts':>8} {'ok':>5} {'att/s':>8} "
+              f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'RSS MiB':>8}  notes")
+        regressions = 0
+        for name in names:
+            result = _run_scenario(name, ports[SCENARIOS[name][1]], args)
+            if 'skipped' in result:
+                print(f"{name:<16} {SCENARIOS[name][0]:<14} skipped: {result['skipped']}")
+                continue
+            results[name] = result
+            problems = compare(result, baseline.get(name), args.tolerance)
+            regressions += bool(problems)
+            print(f"{name:<16} {result['module']:<14} {result['attempts']:>8} {result['success']:>5} "
+                  f"{result['attempts_per_sec']:>8.1f} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+                  f"{result['p99_ms']:>8.1f} {result['peak_rss_kb'] / 1024:>8.1f}  "
+                  f"{'REGRESSION: ' + '; '.join(problems) if problems else ''}")
+    finally:
+        servers.stdin.close()
+        servers.wait()
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({'version': BASELINE_VERSION, 'created': time.time(),
+                       'python': platform.python_version(), 'platform': platform.platform(),
+                       'attempts': args.attempts, 'workers': args.workers, 'scenarios': results}, f, indent=2)
+        print(f"\nBaseline saved to {args.save_baseline}")
+    if regressions:
+        print(f"\n{regressions} scenario(s) regressed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
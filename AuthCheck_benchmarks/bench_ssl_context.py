@@ -0,0 +1,76 @@
+# AuthCheck benchmark - SSL context creation
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Measures how many "attempts" per second can set up their SSL context when
+# every attempt builds a fresh context (the old inline pattern) versus the
+# cached auth_utils.create_ssl_context().
+#
+# Usage: python bench_ssl_context.py [--seconds S] [--ca-file PEM]
+
+import argparse
+import os
+import ssl
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, 'AuthCheck_module_libs'))
+
+from auth_utils import clear_ssl_context_cache, create_ssl_context  # noqa: E402
+
+
+def _uncached(verify_cert, ca_file):
+    """Build a context the way modules used to, once per attempt."""
+    context = ssl.create_default_context()
+    if not verify_cert:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    if ca_file:
+        context.load_verify_locations(ca_file)
+    return context
+
+
+def _cached(verify_cert, ca_file):
+    return create_ssl_context(verify_cert=verify_cert, ca_file=ca_file)
+
+
+def _rate(func, seconds, verify_cert, ca_file):
+    """Return attempts per second for func over roughly `seconds`."""
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        func(verify_cert, ca_file)
+        count += 1
+        if count % 16 == 0 and time.perf_counter() >= deadline:
+            break
+    return count / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark SSL context creation per attempt")
+    parser.add_argument('--seconds', type=float, default=2.0, help="Time per measurement")
+    parser.add_argument('--ca-file', default=ssl.get_default_verify_paths().cafile,
+                        help="CA bundle to load (default: system bundle)")
+    args = parser.parse_args(argv)
+
+    cases = [('verify, system CAs', True, None), ('no verify', False, None)]
+    if args.ca_file and os.path.exists(args.ca_file):
+        cases.append((f'verify, CA file {os.path.basename(args.ca_file)}', True, args.ca_file))
+
+    print(f"{'case':<40} {'uncached/s':>12} {'cached/s':>12} {'speedup':>9}")
+    for name, verify_cert, ca_file in cases:
+        clear_ssl_context_cache()
+        before = _rate(_uncached, args.seconds, verify_cert, ca_file)
+        after = _rate(_cached, args.seconds, verify_cert, ca_file)
+        print(f"{name:<40} {before:>12.0f} {after:>12.0f} {after / before:>8.0f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
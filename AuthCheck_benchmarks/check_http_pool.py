@@ -0,0 +1,78 @@
+# AuthCheck check - HTTP pool SSL context isolation
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# urllib3 loads a request's client certificate into the SSLContext it is
+# given, so a context shared between endpoints with different certificates
+# would present one module's certificate to every other host. Checks that
+# SessionPool hands such endpoints separate contexts, and that endpoints
+# with the same verify/cert settings still share one for TLS resumption.
+#
+# Usage: python check_http_pool.py
+
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, 'AuthCheck_module_libs'))
+
+import http_pool  # noqa: E402
+
+
+def _pool_context(pool, url, verify=True, cert=None):
+    """Return the SSL context the pool would use for a request."""
+    import requests
+
+    request = requests.Request('GET', url).prepare()
+    adapter = pool._checkout(http_pool.endpoint_key(url, verify, cert))
+    try:
+        _, pool_kwargs = adapter.build_connection_pool_key_attributes(request, verify, cert)
+    finally:
+        pool._checkin(http_pool.endpoint_key(url, verify, cert))
+    return pool_kwargs.get('ssl_context')
+
+
+def main():
+    try:
+        import requests  # noqa: F401
+    except ImportError:
+        print("requests is not installed - nothing to check")
+        return 0
+
+    pool = http_pool.SessionPool()
+    try:
+        plain_a = _pool_context(pool, 'https://a.example/', verify=False)
+        plain_b = _pool_context(pool, 'https://b.example/', verify=False)
+        cert_a = _pool_context(pool, 'https://a.example/', verify=False, cert='/tmp/a.pem')
+        cert_b = _pool_context(pool, 'https://b.example/', verify=False, cert=('/tmp/b.crt', '/tmp/b.key'))
+        cert_b2 = _pool_context(pool, 'https://c.example/', verify=False, cert=['/tmp/b.crt', '/tmp/b.key'])
+    finally:
+        pool.close()
+
+    if plain_a is None:
+        print("requests < 2.32 - adapters cannot choose an SSL context, nothing to check")
+        return 0
+
+    failures = []
+    if plain_a is not plain_b:
+        failures.append("endpoints without a client certificate do not share a context")
+    if cert_a is plain_a or cert_b is plain_a:
+        failures.append("an endpoint with a client certificate shares the no-certificate context")
+    if cert_a is cert_b:
+        failures.append("endpoints with different client certificates share a context")
+    if cert_b is not cert_b2:
+        failures.append("endpoints with the same client certificate do not share a context")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK: SSL contexts are separated by client certificate")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
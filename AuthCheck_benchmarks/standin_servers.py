@@ -0,0 +1,706 @@
+# AuthCheck benchmark - local stand-in servers
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Minimal servers that speak just enough of each protocol for the matching
+# modules to log in against localhost: HTTP(S) with a Synology-style JSON
+# API, Basic auth and a form login; LDAP simple bind with a rootDSE and a
+# synthetic schema; SSH password auth with exec; FTP; Redis AUTH; SIP
+# REGISTER with digest auth; FIX logon; SNMP v2c GET. Every server accepts
+# VALID_USERNAME / VALID_PASSWORD (LDAP: VALID_BIND_DN) and rejects the
+# rest the way the real product does.
+#
+# Usage: python standin_servers.py [--only http,ldap,...]
+#   Prints {"server": port, ...} as one JSON line, then serves until stdin
+#   is closed.
+
+import argparse
+import base64
+import hashlib
+import http.server
+import json
+import os
+import secrets
+import socket
+import socketserver
+import ssl
+import sys
+import tempfile
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+
+VALID_USERNAME = 'admin'
+VALID_PASSWORD = 'authcheck-bench'
+VALID_BIND_DN = 'cn=admin,dc=example,dc=com'
+VALID_COMMUNITY = VALID_PASSWORD
+
+SSH_MAX_AUTH_TRIES = 6      # OpenSSH MaxAuthTries
+FTP_MAX_LOGIN_FAILS = 3     # vsftpd max_login_fails
+LDAP_SCHEMA_ATTRIBUTES = 400
+LDAP_SCHEMA_CLASSES = 100
+SIP_REALM = 'authcheck'
+
+SERVERS = ('http', 'https', 'ldap', 'ssh', 'ftp', 'redis', 'sip', 'fix', 'snmp')
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
+class _UDPServer(socketserver.ThreadingUDPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+# --- BER (LDAP, SNMP) ---
+
+def _ber_length(length):
+    if length < 0x80:
+        return bytes([length])
+    raw = length.to_bytes((length.bit_length() + 7) // 8, 'big')
+    return bytes([0x80 | len(raw)]) + raw
+
+
+def ber(tag, content):
+    """Encode one BER TLV."""
+    return bytes([tag]) + _ber_length(len(content)) + content
+
+
+def ber_int(value, tag=0x02):
+    return ber(tag, value.to_bytes(max(1, (value.bit_length() + 8) // 8), 'big', signed=True))
+
+
+def ber_str(value, tag=0x04):
+    return ber(tag, value if isinstance(value, bytes) else value.encode('utf-8'))
+
+
+def ber_oid(text):
+    parts = [int(p) for p in text.split('.')]
+    body = bytearray([parts[0] * 40 + parts[1]])
+    for part in parts[2:]:
+        chunk = [part & 0x7f]
+        part >>= 7
+        while part:
+            chunk.append(0x80 | (part & 0x7f))
+            part >>= 7
+        body.extend(reversed(chunk))
+    return ber(0x06, bytes(body))
+
+
+def ber_items(data):
+    """Yield (tag, content) for each TLV in data."""
+    pos = 0
+    while pos < len(data):
+        tag = data[pos]
+        length = data[pos + 1]
+        pos += 2
+        if length & 0x80:
+            count = length & 0x7f
+            length = int.from_bytes(data[pos:pos + count], 'big')
+            pos += count
+        yield tag, data[pos:pos + length]
+        pos += length
+
+
+def ber_decode_int(content):
+    return int.from_bytes(content, 'big', signed=True)
+
+
+def _recv_exact(sock, count):
+    data = b''
+    while len(data) < count:
+        chunk = sock.recv(count - len(data))
+        if not chunk:
+            raise EOFError
+        data += chunk
+    return data
+
+
+def recv_ber(sock):
+    """Read one complete BER element from a stream socket."""
+    head = _recv_exact(sock, 2)
+    length = head[1]
+    extra = b''
+    if length & 0x80:
+        extra = _recv_exact(sock, length & 0x7f)
+        length = int.from_bytes(extra, 'big')
+    return head + extra + _recv_exact(sock, length)
+
+
+# --- HTTP / HTTPS ---
+
+class _HTTPHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like the appliances
+    server_version = 'Jetty(stand-in)'
+    sessions = set()
+    sessions_lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body=b'', content_type='application/json', headers=()):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _new_session(self):
+        sid = secrets.token_hex(16)
+        with self.sessions_lock:
+            self.sessions.add(sid)
+        return sid
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        if url.path == '/webapi/auth.cgi':
+            if query.get('method') == 'logout':
+                return self._reply(200, {'success': True})
+            if query.get('account') == VALID_USERNAME and query.get('passwd') == VALID_PASSWORD:
+                return self._reply(200, {'success': True, 'data': {'sid': self._new_session()}})
+            return self._reply(200, {'success': False, 'error': {'code': 400}})
+        if url.path == '/webapi/entry.cgi':
+            with self.sessions_lock:
+                known = query.get('_sid') in self.sessions
+            if not known:
+                return self._reply(200, {'success': False, 'error': {'code': 119}})
+            return self._reply(200, {'success': True, 'data': {'model': 'DS920+', 'version_string': 'DSM 7.2-64570'}})
+        if url.path == '/home':
+            cookie = self.headers.get('Cookie', '')
+            with self.sessions_lock:
+                known = any(part.strip()[len('JSESSIONID='):] in self.sessions
+                            for part in cookie.split(';') if part.strip().startswith('JSESSIONID='))
+            if known:
+                return self._reply(200, b'<html>Welcome</html>', 'text/html')
+            return self._reply(403, b'<html>Forbidden</html>', 'text/html')
+        # Basic auth everywhere else
+        expected = 'Basic ' + base64.b64encode(f"{VALID_USERNAME}:{VALID_PASSWORD}".encode()).decode()
+        if self.headers.get('Authorization') == expected:
+            return self._reply(200, b'<html>OK</html>', 'text/html')
+        return self._reply(401, b'<html>Unauthorized</html>', 'text/html',
+                           [('WWW-Authenticate', 'Basic realm="stand-in"')])
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if url.path == '/j_security_check':
+            form = {k: v[0] for k, v in parse_qs(body.decode('utf-8', 'replace')).items()}
+            if form.get('j_username') == VALID_USERNAME and form.get('j_password') == VALID_PASSWORD:
+                return self._reply(302, headers=[('Location', '/home'),
+                                                 ('Set-Cookie', f'JSESSIONID={self._new_session()}; Path=/')])
+            return self._reply(403, b'<html>Login failed</html>', 'text/html')
+        return self._reply(404, b'', 'text/html')
+
+
+class _HTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
+def _self_signed_context():
+    """Return a server SSLContext with a throwaway certificate for 127.0.0.1."""
+    import datetime
+    import ipaddress
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'authcheck-standin')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (x509.CertificateBuilder().subject_name(name).issuer_name(name)
+            .public_key(key.public_key()).serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=30))
+            .add_extension(x509.SubjectAlternativeName([
+                x509.DNSName('localhost'), x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]),
+                critical=False)
+            .sign(key, hashes.SHA256()))
+    with tempfile.TemporaryDirectory() as tmp:
+        cert_path = os.path.join(tmp, 'cert.pem')
+        key_path = os.path.join(tmp, 'key.pem')
+        with open(cert_path, 'wb') as f:
+            f.write(cert.public_bytes(serialization.Encoding.PEM))
+        with open(key_path, 'wb') as f:
+            f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                      serialization.NoEncryption()))
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+class _HTTPSServer(_HTTPServer):
+    context = None
+
+    def get_request(self):
+        sock, address = super().get_request()
+        return self.context.wrap_socket(sock, server_side=True, do_handshake_on_connect=False), address
+
+
+def _handle_https(server):
+    # Handshake in the request thread, not the accept loop
+    original = server.finish_request
+
+    def finish_request(request, client_address):
+        try:
+            request.do_handshake()
+        except (ssl.SSLError, OSError):
+            return
+        original(request, client_address)
+    server.finish_request = finish_request
+    return server
+
+
+# --- LDAP ---
+
+def _ldap_result(message_id, op_tag, code, diagnostic='', extra=b''):
+    return ber(0x30, ber_int(message_id) + ber(op_tag, ber_int(code, 0x0a) + ber_str('') + ber_str(diagnostic) + extra))
+
+
+def _ldap_entry(message_id, dn, attributes):
+    attrs = b''.join(ber(0x30, ber_str(name) + ber(0x31, b''.join(ber_str(v) for v in values)))
+                     for name, values in attributes.items())
+    return ber(0x30, ber_int(message_id) + ber(0x64, ber_str(dn) + ber(0x30, attrs)))
+
+
+_ROOT_DSE = {
+    'objectClass': ['top'],
+    'namingContexts': ['dc=example,dc=com'],
+    'supportedLDAPVersion': ['3'],
+    'supportedSASLMechanisms': ['DIGEST-MD5', 'GSSAPI'],
+    'supportedExtension': ['1.3.6.1.4.1.1466.20037', '1.3.6.1.4.1.4203.1.11.3'],
+    'subschemaSubentry': ['cn=Subschema'],
+    'vendorName': ['AuthCheck'],
+    'vendorVersion': ['stand-in 1.0'],
+}
+
+
+def _ldap_schema():
+    """A synthetic subschema about the size of a stock directory's."""
+    syntax = '1.3.6.1.4.1.1466.115.121.1.15'
+    attribute_types = [
+        "( 2.5.4.0 NAME 'objectClass' EQUALITY objectIdentifierMatch SYNTAX 1.3.6.1.4.1.1466.115.121.1.38 )",
+        f"( 2.5.4.41 NAME 'name' EQUALITY caseIgnoreMatch SUBSTR caseIgnoreSubstringsMatch SYNTAX {syntax}{{32768}} )",
+        "( 2.5.4.3 NAME ( 'cn' 'commonName' ) SUP name )",
+        "( 2.5.4.4 NAME ( 'sn' 'surname' ) SUP name )",
+    ]
+    for i in range(LDAP_SCHEMA_ATTRIBUTES):
+        attribute_types.append(
+            f"( 1.3.6.1.4.1.99999.1.{i} NAME 'benchAttribute{i}' DESC 'Stand-in attribute {i}' "
+            f"EQUALITY caseIgnoreMatch SUBSTR caseIgnoreSubstringsMatch SYNTAX {syntax} )")
+    object_classes = [
+        "( 2.5.6.0 NAME 'top' ABSTRACT MUST objectClass )",
+        "( 2.5.6.6 NAME 'person' SUP top STRUCTURAL MUST ( sn $ cn ) )",
+    ]
+    for i in range(LDAP_SCHEMA_CLASSES):
+        may = ' $ '.join(f'benchAttribute{(i * 4 + j) % LDAP_SCHEMA_ATTRIBUTES}' for j in range(4))
+        object_classes.append(
+            f"( 1.3.6.1.4.1.99999.2.{i} NAME 'benchClass{i}' SUP top AUXILIARY MAY ( {may} ) )")
+    return {
+        'objectClass': ['top', 'subschema'],
+        'cn': ['Subschema'],
+        'attributeTypes': attribute_types,
+        'objectClasses': object_classes,
+        'ldapSyntaxes': [f"( {syntax} DESC 'Directory String' )",
+                         "( 1.3.6.1.4.1.1466.115.121.1.38 DESC 'OID' )"],
+        'matchingRules': ["( 2.5.13.2 NAME 'caseIgnoreMatch' SYNTAX 1.3.6.1.4.1.1466.115.121.1.15 )"],
+    }
+
+
+class _LDAPHandler(socketserver.BaseRequestHandler):
+    schema = None
+
+    def handle(self):
+        bound_dn = ''
+        while True:
+            try:
+                message = recv_ber(self.request)
+            except (EOFError, OSError):
+                return
+            (_, body), = ber_items(message)
+            items = list(ber_items(body))
+            message_id = ber_decode_int(items[0][1])
+            op_tag, op = items[1]
+            if op_tag == 0x42:  # unbind
+                return
+            if op_tag == 0x60:  # bind
+                fields = list(ber_items(op))
+                dn = fields[1][1].decode('utf-8', 'replace')
+                auth_tag, password = fields[2]
+                if auth_tag == 0x80 and dn == VALID_BIND_DN and password == VALID_PASSWORD.encode():
+                    bound_dn = dn
+                    reply = _ldap_result(message_id, 0x61, 0)
+                else:
+                    bound_dn = ''
+                    reply = _ldap_result(message_id, 0x61, 49, '80090308: LdapErr: DSID-0C09044E, data 52e')
+            elif op_tag == 0x63:  # search
+                base = next(ber_items(op))[1].decode('utf-8', 'replace')
+                if base == '':
+                    entry = _ldap_entry(message_id, '', _ROOT_DSE)
+                elif base.lower() == 'cn=subschema':
+                    entry = _ldap_entry(message_id, 'cn=Subschema', self.schema)
+                else:
+                    entry = _ldap_entry(message_id, base, {'objectClass': ['top', 'domain']})
+                reply = entry + _ldap_result(message_id, 0x65, 0)
+            elif op_tag == 0x77:  # extended: only "Who am I?" (RFC 4532)
+                name = next(ber_items(op))[1]
+                if name == b'1.3.6.1.4.1.4203.1.11.3':
+                    identity = f'dn:{bound_dn}' if bound_dn else ''
+                    reply = _ldap_result(message_id, 0x78, 0, extra=ber(0x8b, identity.encode()))
+                else:
+                    reply = _ldap_result(message_id, 0x78, 2, 'Unsupported extended operation')
+            elif op_tag == 0x50:  # abandon
+                continue
+            else:
+                reply = _ldap_result(message_id, 0x78, 2, 'Unsupported operation')
+            self.request.sendall(reply)
+
+
+# --- SSH ---
+
+def _disconnect(sock):
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+class _SSHHandler(socketserver.BaseRequestHandler):
+    host_key = None
+
+    def handle(self):
+        import paramiko
+
+        class Interface(paramiko.ServerInterface):
+            def __init__(self):
+                self.failures = 0
+                self.command = threading.Event()
+                self.command_text = b''
+
+            def get_allowed_auths(self, username):
+                return 'password,publickey'
+
+            def check_auth_password(self, username, password):
+                if username == VALID_USERNAME and password == VALID_PASSWORD:
+                    return paramiko.AUTH_SUCCESSFUL
+                self.failures += 1
+                if self.failures >= SSH_MAX_AUTH_TRIES:
+                    # Like OpenSSH: disconnect ("Too many authentication
+                    # failures") instead of answering the last attempt
+                    _disconnect(transport.sock)
+                return paramiko.AUTH_FAILED
+
+            def check_auth_publickey(self, username, key):
+                return paramiko.AUTH_FAILED
+
+            def check_channel_request(self, kind, chanid):
+                if kind == 'session':
+                    return paramiko.OPEN_SUCCEEDED
+                return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+            def check_channel_exec_request(self, channel, command):
+                self.command_text = command
+                self.command.set()
+                return True
+
+        transport = paramiko.Transport(self.request)
+        transport.add_server_key(self.host_key)
+        interface = Interface()
+        try:
+            transport.start_server(server=interface)
+            channel = transport.accept(30)
+            if channel is None:
+                return
+            if interface.command.wait(10):
+                command = interface.command_text.decode('utf-8', 'replace')
+                output = command[5:].strip().strip('"\'') + '\n' if command.startswith('echo ') else ''
+                channel.sendall(output.encode())
+                channel.send_exit_status(0)
+            channel.close()
+            # Wait for the client to close the connection
+            while transport.is_active():
+                transport.join(1)
+        except (paramiko.SSHException, EOFError, OSError):
+            pass
+        finally:
+            transport.close()
+
+
+# --- FTP ---
+
+class _FTPHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        send = lambda line: self.wfile.write(line.encode() + b'\r\n')
+        send('220 (vsFTPd 3.0.5 stand-in)')
+        username = None
+        failures = 0
+        logged_in = False
+        for raw in self.rfile:
+            line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+            command, _, argument = line.partition(' ')
+            command = command.upper()
+            if command == 'USER':
+                username = argument
+                send('331 Please specify the password.')
+            elif command == 'PASS':
+                if username == VALID_USERNAME and argument == VALID_PASSWORD:
+                    logged_in = True
+                    send('230 Login successful.')
+                else:
+                    failures += 1
+                    send('530 Login incorrect.')
+                    if failures >= FTP_MAX_LOGIN_FAILS:
+                        return
+            elif command == 'PWD' and logged_in:
+                send('257 "/" is the current directory')
+            elif command == 'QUIT':
+                send('221 Goodbye.')
+                return
+            elif not logged_in:
+                send('530 Please login with USER and PASS.')
+            else:
+                send('502 Command not implemented.')
+
+
+# --- Redis ---
+
+class _RedisHandler(socketserver.StreamRequestHandler):
+    def _command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b'*'):
+            return line.decode('utf-8', 'replace').split()  # inline command
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2].decode('utf-8', 'replace'))
+        return args
+
+    def handle(self):
+        authenticated = False
+        while True:
+            args = self._command()
+            if args is None:
+                return
+            if not args:
+                continue
+            name = args[0].upper()
+            if name == 'AUTH':
+                username, password = (args[1], args[2]) if len(args) > 2 else ('default', args[1])
+                if username == 'default' and password == VALID_PASSWORD:
+                    authenticated = True
+                    reply = b'+OK\r\n'
+                else:
+                    reply = b'-WRONGPASS invalid username-password pair or user is disabled.\r\n'
+            elif name == 'HELLO':
+                # HELLO [protover [AUTH username password]]
+                protocol = int(args[1]) if len(args) > 1 else 2
+                if len(args) > 4 and args[2].upper() == 'AUTH':
+                    authenticated = args[3] == 'default' and args[4] == VALID_PASSWORD
+                    if not authenticated:
+                        self.wfile.write(b'-WRONGPASS invalid username-password pair or user is disabled.\r\n')
+                        continue
+                if not authenticated:
+                    reply = b'-NOAUTH HELLO must be called with the client already authenticated.\r\n'
+                else:
+                    fields = [('server', b'$5\r\nredis\r\n'), ('version', b'$5\r\n7.2.4\r\n'),
+                              ('proto', b':%d\r\n' % protocol), ('id', b':1\r\n'),
+                              ('mode', b'$10\r\nstandalone\r\n'), ('role', b'$6\r\nmaster\r\n'),
+                              ('modules', b'*0\r\n')]
+                    head = b'%%%d\r\n' % len(fields) if protocol == 3 else b'*%d\r\n' % (len(fields) * 2)
+                    reply = head + b''.join(b'$%d\r\n%s\r\n' % (len(k), k.encode()) + v for k, v in fields)
+            elif name == 'QUIT':
+                self.wfile.write(b'+OK\r\n')
+                return
+            elif not authenticated:
+                reply = b'-NOAUTH Authentication required.\r\n'
+            elif name == 'PING':
+                reply = b'+PONG\r\n'
+            elif name in ('CLIENT', 'SELECT'):
+                reply = b'+OK\r\n'
+            elif name == 'INFO':
+                info = b'# Server\r\nredis_version:7.2.4\r\nredis_mode:standalone\r\n'
+                reply = b'$%d\r\n%s\r\n' % (len(info), info)
+            else:
+                reply = b"-ERR unknown command '%s'\r\n" % name.encode()
+            self.wfile.write(reply)
+
+
+# --- SIP ---
+
+def _sip_headers(message):
+    headers = {}
+    for line in message.split('\r\n')[1:]:
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _sip_reply(request, status, extra=''):
+    headers = _sip_headers(request)
+    lines = [f"SIP/2.0 {status}"]
+    for name in ('via', 'from', 'to', 'call-id', 'cseq'):
+        if name in headers:
+            lines.append(f"{name.title()}: {headers[name]}")
+    return ('\r\n'.join(lines) + '\r\n' + extra + 'Content-Length: 0\r\n\r\n').encode()
+
+
+class _SIPHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, sock = self.request
+        request = data.decode('utf-8', 'replace')
+        if not request.startswith('REGISTER '):
+            return
+        authorization = _sip_headers(request).get('authorization', '')
+        if not authorization.startswith('Digest '):
+            challenge = f'WWW-Authenticate: Digest realm="{SIP_REALM}", nonce="{secrets.token_hex(16)}", algorithm=MD5\r\n'
+            sock.sendto(_sip_reply(request, '401 Unauthorized', challenge), self.client_address)
+            return
+        params = dict(part.strip().split('=', 1) for part in authorization[7:].split(',') if '=' in part)
+        params = {k: v.strip('"') for k, v in params.items()}
+        ha1 = hashlib.md5(f"{VALID_USERNAME}:{SIP_REALM}:{VALID_PASSWORD}".encode()).hexdigest()
+        ha2 = hashlib.md5(f"REGISTER:{params.get('uri', '')}".encode()).hexdigest()
+        expected = hashlib.md5(f"{ha1}:{params.get('nonce', '')}:{ha2}".encode()).hexdigest()
+        if params.get('username') == VALID_USERNAME and params.get('response') == expected:
+            sock.sendto(_sip_reply(request, '200 OK'), self.client_address)
+        else:
+            sock.sendto(_sip_reply(request, '403 Forbidden'), self.client_address)
+
+
+# --- FIX ---
+
+def _fix_message(sender, target, fields):
+    body = f"35={fields[0]}\x0149={sender}\x0156={target}\x0134=1\x01" + ''.join(f"{f}\x01" for f in fields[1:])
+    message = f"8=FIX.4.4\x019={len(body)}\x01{body}"
+    return (message + f"10={sum(message.encode()) % 256:03d}\x01").encode()
+
+
+class _FIXHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data = b''
+        while b'\x0110=' not in data or not data.endswith(b'\x01'):
+            chunk = self.request.recv(4096)
+            if not chunk:
+                return
+            data += chunk
+        tags = dict(field.split('=', 1) for field in data.decode('utf-8', 'replace').split('\x01') if '=' in field)
+        sender, target = tags.get('56', 'SERVER'), tags.get('49', 'CLIENT')
+        if tags.get('35') != 'A':
+            self.request.sendall(_fix_message(sender, target, ['3', '58=Expected Logon']))
+        elif tags.get('553') == VALID_USERNAME and tags.get('554') == VALID_PASSWORD:
+            self.request.sendall(_fix_message(sender, target, ['A', '98=0', '108=30']))
+        else:
+            self.request.sendall(_fix_message(sender, target, ['5', '58=Invalid username or password']))
+
+
+# --- SNMP ---
+
+_SNMP_VALUES = {
+    ber_oid('1.3.6.1.2.1.1.1.0'): ber_str('AuthCheck SNMP stand-in'),   # sysDescr
+    ber_oid('1.3.6.1.2.1.1.3.0'): ber_int(123456, 0x43),                # sysUpTime
+    ber_oid('1.3.6.1.2.1.1.5.0'): ber_str('standin'),                   # sysName
+}
+
+
+class _SNMPHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, sock = self.request
+        try:
+            (_, message), = ber_items(data)
+            version, community, pdu = list(ber_items(message))
+            pdu_tag, pdu_body = pdu
+            request_id, _, _, varbinds = list(ber_items(pdu_body))
+        except ValueError:
+            return
+        if community[1] != VALID_COMMUNITY.encode() or pdu_tag != 0xa0:
+            return  # Agents drop requests with a wrong community
+        bindings = b''
+        for _, varbind in ber_items(varbinds[1]):
+            oid_tag, oid = next(ber_items(varbind))
+            encoded = ber(oid_tag, oid)
+            bindings += ber(0x30, encoded + _SNMP_VALUES.get(encoded, ber(0x80, b'')))
+        response = ber(0xa2, ber(0x02, request_id[1]) + ber_int(0) + ber_int(0) + ber(0x30, bindings))
+        sock.sendto(ber(0x30, ber(0x02, version[1]) + ber(0x04, community[1]) + response),
+                    self.client_address)
+
+
+def start_servers(names=None, host='127.0.0.1'):
+    """
+    Start stand-in servers on free ports, each in a daemon thread.
+
+    Args:
+        names (list): Servers to start (default all of SERVERS)
+        host (str): Address to listen on
+
+    Returns:
+        tuple: ({name: port}, [server, ...])
+    """
+    ports = {}
+    servers = []
+    for name in names or SERVERS:
+        if name == 'http':
+            server = _HTTPServer((host, 0), _HTTPHandler)
+        elif name == 'https':
+            server = _handle_https(_HTTPSServer((host, 0), _HTTPHandler))
+            server.context = _self_signed_context()
+        elif name == 'ldap':
+            _LDAPHandler.schema = _LDAPHandler.schema or _ldap_schema()
+            server = _TCPServer((host, 0), _LDAPHandler)
+        elif name == 'ssh':
+            import logging
+            import paramiko
+            logging.getLogger('paramiko').addHandler(logging.NullHandler())  # Client resets are expected
+            _SSHHandler.host_key = _SSHHandler.host_key or paramiko.RSAKey.generate(2048)
+            server = _TCPServer((host, 0), _SSHHandler)
+        elif name == 'ftp':
+            server = _TCPServer((host, 0), _FTPHandler)
+        elif name == 'redis':
+            server = _TCPServer((host, 0), _RedisHandler)
+        elif name == 'sip':
+            server = _UDPServer((host, 0), _SIPHandler)
+        elif name == 'fix':
+            server = _TCPServer((host, 0), _FIXHandler)
+        elif name == 'snmp':
+            server = _UDPServer((host, 0), _SNMPHandler)
+        else:
+            raise ValueError(f"Unknown stand-in server '{name}'")
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        ports[name] = server.server_address[1]
+        servers.append(server)
+    return ports, servers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run AuthCheck benchmark stand-in servers")
+    parser.add_argument('--only', help="Comma-separated servers to start (default all)")
+    parser.add_argument('--host', default='127.0.0.1')
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.only.split(',')] if args.only else None
+    ports, servers = start_servers(names, args.host)
+    print(json.dumps(ports), flush=True)
+    # Serve until the parent closes our stdin
+    sys.stdin.read()
+    for server in servers:
+        server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+# AuthCheck asyncio execution engine
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Runs checks on one shared event loop. Modules that define a coroutine
+# authenticate_async(form_data) run natively on the loop; legacy modules
+# with only a synchronous authenticate(form_data) run through a bounded
+# thread pool. Global and per-host limits keep thousands of queued checks
+# from turning into thousands of threads or connections.
+
+import asyncio
+import concurrent.futures
+import threading
+
+
+DEFAULT_MAX_CONCURRENCY = 512
+DEFAULT_PER_HOST_LIMIT = 8
+DEFAULT_EXECUTOR_WORKERS = 32
+
+
+def has_native_async(module):
+    """Return True if a module provides a coroutine authenticate_async()."""
+    return asyncio.iscoroutinefunction(getattr(module, 'authenticate_async', None))
+
+
+class AsyncEngine:
+    """
+    Shared event loop for running authentication checks.
+
+    The loop runs on a background thread; submit() may be called from any
+    thread and returns a concurrent.futures.Future.
+    """
+
+    def __init__(self, max_concurrency=DEFAULT_MAX_CONCURRENCY, per_host_limit=DEFAULT_PER_HOST_LIMIT,
+                 executor_workers=DEFAULT_EXECUTOR_WORKERS):
+        """
+        Args:
+            max_concurrency (int): Checks running at once across all hosts
+            per_host_limit (int): Checks running at once against one host
+            executor_workers (int): Threads for synchronous authenticate()
+        """
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=executor_workers, thread_name_prefix='authcheck-sync'
+        )
+        self.loop = asyncio.new_event_loop()
+        # asyncio.to_thread() inside native checks shares the same bound
+        self.loop.set_default_executor(self.executor)
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+        self._host_limits = {}  # {host: [asyncio.Semaphore, users]}
+        self._thread = threading.Thread(target=self._run_loop, name='authcheck-async', daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _acquire_host(self, host):
+        entry = self._host_limits.get(host)
+        if entry is None:
+            entry = self._host_limits[host] = [asyncio.Semaphore(self.per_host_limit), 0]
+        entry[1] += 1
+        try:
+            await entry[0].acquire()
+        except BaseException:
+            # Cancelled while waiting - it never held the slot
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._host_limits[host]
+            raise
+        return entry
+
+    def _release_host(self, host, entry):
+        entry[0].release()
+        entry[1] -= 1
+        if entry[1] == 0:
+            # Nobody is waiting on this host - don't keep a semaphore per target forever
+            del self._host_limits[host]
+
+    async def check(self, module, form_data, host=None, sync_call=None, timeout=None):
+        """
+        Run one check on the loop, honouring the concurrency limits.
+
+        Args:
+            module: AuthCheck module
+            form_data (dict): Form field values
+            host (str): Target host used for the per-host limit
+            sync_call (callable): Called as sync_call(module, form_data) in the
+                executor instead of module.authenticate(form_data)
+            timeout (float): Seconds a native authenticate_async() may run once
+                it has started (synchronous calls bound themselves, see
+                auth_utils.call_with_deadline)
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        # Wait for the host first: a check queued behind a busy host must not
+        # hold a global slot that checks against idle hosts could use
+        entry = await self._acquire_host(host) if host else None
+        try:
+            async with self._global_limit:
+                if has_native_async(module):
+                    try:
+                        return await asyncio.wait_for(module.authenticate_async(form_data), timeout)
+                    except asyncio.TimeoutError:
+                        return False, f"Check exceeded its {timeout:g}s deadline"
+                if sync_call is not None:
+                    return await self.loop.run_in_executor(self.executor, sync_call, module, form_data)
+                return await self.loop.run_in_executor(self.executor, module.authenticate, form_data)
+        finally:
+            if entry is not None:
+                self._release_host(host, entry)
+
+    def submit(self, coro):
+        """
+        Schedule a coroutine on the engine's loop from any thread.
+
+        Returns:
+            concurrent.futures.Future
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, module, form_data, host=None):
+        """Run one check and wait for its (success, message) result."""
+        return self.submit(self.check(module, form_data, host)).result()
+
+    def close(self):
+        """Stop the loop and the executor."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+        self.executor.shutdown(wait=False)
@@ -6,20 +6,76 @@
 # the Free Software Foundation, either version 3 of the License, or
 # (at your option) any later version.
 
+import contextlib
+import os
+import queue
 import ssl
 import socket
+import threading
+import time
+from collections import OrderedDict
 
 
-def create_ssl_context(use_tls=True, verify_cert=True, cert_file=None, key_file=None, ca_file=None):
+# Maximum number of SSL contexts kept by create_ssl_context()
+SSL_CONTEXT_CACHE_SIZE = 32
+
+# Maximum number of TLS sessions kept for resumption
+TLS_SESSION_CACHE_SIZE = 1024
+
+# Verification depths, cheapest first (see verification_depth())
+DEPTH_AUTH_ONLY = 'auth-only'
+DEPTH_IDENTITY = 'identity'
+DEPTH_FULL = 'full'
+VERIFICATION_DEPTHS = (DEPTH_AUTH_ONLY, DEPTH_IDENTITY, DEPTH_FULL)
+
+# Maximum helper threads running call_with_deadline() checks, including
+# checks abandoned past their deadline that are still finishing
+MAX_DEADLINE_HELPERS = 256
+
+_ssl_context_cache = OrderedDict()
+_ssl_context_lock = threading.Lock()
+
+_tls_sessions = OrderedDict()  # {(context, peer_host, peer_port, sni): ssl.SSLSession}
+_tls_stats = {'handshakes': 0, 'resumed': 0}
+_tls_lock = threading.Lock()
+
+_deadline_local = threading.local()
+_socket_install_lock = threading.Lock()
+_original_socket = None
+_socket_deadlines = False     # install_socket_deadlines() was called
+_socket_connect_timer = None  # install_connect_timer() context manager factory
+
+# Timeout given to sockets whose check deadline has already passed; the
+# next blocking call times out instead of the socket becoming non-blocking
+_EXPIRED_TIMEOUT = 0.001
+
+
+def _file_mtime(path):
+    """Return a file's mtime, or None if it has no path or cannot be read."""
+    if not path:
+        return None
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def create_ssl_context(use_tls=True, verify_cert=True, cert_file=None, key_file=None, ca_file=None,
+                       check_hostname=None):
     """
     Create an SSL context for secure connections.
     
+    Contexts are cached by their settings and the mtimes of the files they
+    load, so repeated attempts do not reload the CA bundle or client
+    certificate chain. The returned context is shared - do not modify it.
+    
     Args:
         use_tls (bool): Whether to use TLS
         verify_cert (bool): Whether to verify server certificate
         cert_file (str): Path to client certificate file
         key_file (str): Path to client key file
         ca_file (str): Path to CA certificate file
+        check_hostname (bool): Whether to match the hostname (defaults to verify_cert)
         
     Returns:
         ssl.SSLContext or None if TLS is disabled
@@ -27,21 +83,459 @@ def create_ssl_context(use_tls=True, verify_cert=True, cert_file=None, key_file=
     if not use_tls:
         return None
     
+    verify_cert = bool(verify_cert)
+    check_hostname = verify_cert if check_hostname is None else bool(check_hostname) and verify_cert
+    cache_key = (
+        verify_cert, check_hostname,
+        ca_file or None, _file_mtime(ca_file),
+        cert_file or None, _file_mtime(cert_file),
+        key_file or None, _file_mtime(key_file),
+    )
+    
+    with _ssl_context_lock:
+        context = _ssl_context_cache.get(cache_key)
+        if context is not None:
+            _ssl_context_cache.move_to_end(cache_key)
+            return context
+    
     context = ssl.create_default_context()
     
-    if not verify_cert:
+    if not check_hostname:
         context.check_hostname = False
+    if not verify_cert:
         context.verify_mode = ssl.CERT_NONE
     
     if ca_file:
         context.load_verify_locations(ca_file)
     
     if cert_file:
-        context.load_cert_chain(certfile=cert_file, keyfile=key_file)
+        context.load_cert_chain(certfile=cert_file, keyfile=key_file or None)
+    
+    enable_tls_resumption(context)
+    
+    with _ssl_context_lock:
+        _ssl_context_cache[cache_key] = context
+        while len(_ssl_context_cache) > SSL_CONTEXT_CACHE_SIZE:
+            _ssl_context_cache.popitem(last=False)
     
     return context
 
 
+def clear_ssl_context_cache():
+    """Drop all cached SSL contexts."""
+    with _ssl_context_lock:
+        _ssl_context_cache.clear()
+
+
+class CheckSSLSocket(ssl.SSLSocket):
+    """
+    SSLSocket that follows the check deadline like CheckSocket.
+    
+    A socket wrapped before connect() (ldap3 and some drivers do this) is
+    an SSLSocket, not a CheckSocket, so its settimeout() and connect() are
+    capped here instead. Installed as the default SSLContext.sslsocket_class
+    by install_socket_deadlines() and install_connect_timer().
+    """
+    
+    def settimeout(self, timeout):
+        if _socket_deadlines:
+            timeout = _capped_timeout(timeout)
+        super().settimeout(timeout)
+    
+    def connect(self, address):
+        if _socket_deadlines and deadline_remaining() is not None:
+            # Raises DeadlineExceeded once the budget is spent
+            super().settimeout(deadline_timeout(self.gettimeout()))
+        timer = _socket_connect_timer
+        if timer is None:
+            return super().connect(address)
+        with timer():
+            return super().connect(address)
+
+
+class ResumingSSLSocket(CheckSSLSocket):
+    """
+    SSLSocket that resumes earlier TLS sessions to the same endpoint.
+    
+    Before a client handshake the socket offers the last session seen for
+    its (context, peer address, port, SNI); afterwards, and again on close
+    (when TLS 1.3 tickets have arrived), it stores the current session.
+    """
+    
+    def _resumption_key(self):
+        try:
+            peer = self.getpeername()
+        except OSError:
+            return None
+        return (self.context, peer[0], peer[1], self.server_hostname)
+    
+    def _store_session(self, key):
+        try:
+            session = self.session
+        except (OSError, ValueError):
+            return
+        if key is None or session is None:
+            return
+        with _tls_lock:
+            _tls_sessions[key] = session
+            _tls_sessions.move_to_end(key)
+            while len(_tls_sessions) > TLS_SESSION_CACHE_SIZE:
+                _tls_sessions.popitem(last=False)
+    
+    def do_handshake(self, block=False):
+        key = None if self.server_side else self._resumption_key()
+        if key is not None:
+            with _tls_lock:
+                cached = _tls_sessions.get(key)
+            if cached is not None:
+                try:
+                    self.session = cached
+                except (ValueError, ssl.SSLError):
+                    pass
+        super().do_handshake(block)
+        if key is not None:
+            with _tls_lock:
+                _tls_stats['handshakes'] += 1
+                if self.session_reused:
+                    _tls_stats['resumed'] += 1
+            self._store_session(key)
+    
+    def close(self):
+        if not self.server_side:
+            self._store_session(self._resumption_key())
+        super().close()
+
+
+def enable_tls_resumption(context):
+    """
+    Make sockets wrapped by an SSL context resume earlier sessions.
+    
+    Args:
+        context (ssl.SSLContext): Client context
+        
+    Returns:
+        ssl.SSLContext: The same context
+    """
+    context.sslsocket_class = ResumingSSLSocket
+    return context
+
+
+def get_tls_resumption_stats():
+    """
+    Return how often TLS handshakes resumed an earlier session.
+    
+    Returns:
+        dict: {'handshakes': int, 'resumed': int, 'resumption_rate': float}
+    """
+    with _tls_lock:
+        handshakes = _tls_stats['handshakes']
+        resumed = _tls_stats['resumed']
+    return {
+        'handshakes': handshakes,
+        'resumed': resumed,
+        'resumption_rate': resumed / handshakes if handshakes else 0.0,
+    }
+
+
+def reset_tls_resumption_stats():
+    """Reset the resumption counters and forget cached sessions."""
+    with _tls_lock:
+        _tls_stats['handshakes'] = 0
+        _tls_stats['resumed'] = 0
+        _tls_sessions.clear()
+
+
+def ldap3_tls(verify_cert=False, ca_file=None, sni=None):
+    """
+    Create an ldap3 Tls object that uses a cached, resuming SSL context.
+    
+    ldap3 builds a fresh SSLContext for every connection, so sessions could
+    never be resumed. This Tls subclass wraps sockets with the shared
+    context from create_ssl_context() instead.
+    
+    Args:
+        verify_cert (bool): Whether to verify the server certificate
+        ca_file (str): Path to CA certificate file
+        sni (str): Server name to send
+        
+    Returns:
+        ldap3.Tls
+    """
+    from ldap3 import Tls
+    from ldap3.core.tls import check_hostname as ldap3_check_hostname
+    
+    class ResumingTls(Tls):
+        def wrap_socket(self, connection, do_handshake=False):
+            context = create_ssl_context(verify_cert=verify_cert, ca_file=ca_file, check_hostname=False)
+            wrapped_socket = context.wrap_socket(
+                connection.socket, server_side=False,
+                do_handshake_on_connect=do_handshake, server_hostname=self.sni
+            )
+            if do_handshake and self.validate != ssl.CERT_NONE:
+                ldap3_check_hostname(wrapped_socket, connection.server.host, self.valid_names)
+            connection.socket = wrapped_socket
+    
+    return ResumingTls(
+        validate=ssl.CERT_REQUIRED if verify_cert else ssl.CERT_NONE,
+        ca_certs_file=ca_file,
+        sni=sni,
+    )
+
+
+class DeadlineExceeded(socket.timeout):
+    """The current check has used up its time budget."""
+
+
+@contextlib.contextmanager
+def check_deadline(seconds):
+    """
+    Give the checks run on this thread a time budget.
+    
+    Inside the block, deadline_timeout(), the shared HTTP pool and (after
+    install_socket_deadlines()) new sockets cap their timeouts to the time
+    left. Nested deadlines can only shorten the outer one.
+    
+    Args:
+        seconds (float): Budget in seconds, or None for no deadline
+    """
+    previous = getattr(_deadline_local, 'deadline', None)
+    if seconds is not None:
+        deadline = time.monotonic() + seconds
+        _deadline_local.deadline = deadline if previous is None else min(previous, deadline)
+    try:
+        yield
+    finally:
+        _deadline_local.deadline = previous
+
+
+def deadline_remaining():
+    """
+    Return the seconds left on this thread's deadline.
+    
+    Returns:
+        float: Seconds left (may be negative), or None without a deadline
+    """
+    deadline = getattr(_deadline_local, 'deadline', None)
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_timeout(timeout=None):
+    """
+    Cap a timeout to the time left on this thread's deadline.
+    
+    Args:
+        timeout (float): The timeout the caller would use (None = no timeout)
+        
+    Returns:
+        float: The smaller of timeout and the time left (timeout unchanged
+               without a deadline)
+        
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    remaining = deadline_remaining()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceeded("Check deadline exceeded")
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+class _DeadlineHelpers:
+    """
+    Daemon threads that run call_with_deadline() checks.
+    
+    Threads are started on demand and reused. At most max_threads checks
+    are outstanding at once - running, or abandoned by a caller after their
+    deadline and still finishing - so stuck checks cannot pile up threads.
+    """
+    
+    def __init__(self, max_threads):
+        self.max_threads = max_threads
+        self._slots = threading.BoundedSemaphore(max_threads)
+        self._tasks = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads = 0
+        self._busy = 0
+    
+    def submit(self, task, timeout):
+        """
+        Run task() on a helper thread.
+        
+        Returns:
+            bool: False if no helper became free within timeout seconds
+        """
+        if not self._slots.acquire(timeout=max(timeout, 0)):
+            return False
+        with self._lock:
+            self._busy += 1
+            spawn = self._busy > self._threads
+            if spawn:
+                self._threads += 1
+        if spawn:
+            threading.Thread(target=self._work, name='authcheck-deadline', daemon=True).start()
+        self._tasks.put(task)
+        return True
+    
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            try:
+                task()
+            finally:
+                with self._lock:
+                    self._busy -= 1
+                self._slots.release()
+
+
+_deadline_helpers = _DeadlineHelpers(MAX_DEADLINE_HELPERS)
+
+
+def call_with_deadline(func, args=(), seconds=None, grace=2.0, pool=None):
+    """
+    Run func(*args) under check_deadline(seconds) with a hard wall-clock cap.
+    
+    The call runs on a shared, bounded set of helper threads. If it has not
+    returned seconds + grace after it was submitted, DeadlineExceeded is
+    raised and the helper is left to finish on its own (its sockets time
+    out at the deadline), so the caller is never held past its budget.
+    When MAX_DEADLINE_HELPERS checks are outstanding, new calls wait for a
+    helper within the same budget.
+    
+    Args:
+        func (callable): Function to run
+        args (tuple): Positional arguments
+        seconds (float): Budget in seconds, or None to call func directly
+        grace (float): Extra seconds allowed for the function to notice
+        pool (http_pool.SessionPool): HTTP pool to activate on the helper
+            thread (the caller's active pool does not carry over)
+        
+    Returns:
+        The return value of func
+        
+    Raises:
+        DeadlineExceeded: If the call overran its budget
+        Exception: Anything raised by func
+    """
+    if seconds is None:
+        return func(*args)
+    
+    submitted = time.monotonic()
+    outcome = {}
+    done = threading.Event()
+    
+    def run():
+        try:
+            remaining = seconds - (time.monotonic() - submitted)
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Check exceeded its {seconds:g}s deadline")
+            with pool.activate() if pool is not None else contextlib.nullcontext():
+                with check_deadline(remaining):
+                    outcome['value'] = func(*args)
+        except BaseException as e:
+            outcome['error'] = e
+        finally:
+            done.set()
+    
+    if not _deadline_helpers.submit(run, seconds):
+        raise DeadlineExceeded(f"Check exceeded its {seconds:g}s deadline waiting for a helper thread "
+                               f"({_deadline_helpers.max_threads} checks still running)")
+    if not done.wait(max(seconds + grace - (time.monotonic() - submitted), 0)):
+        raise DeadlineExceeded(f"Check exceeded its {seconds:g}s deadline")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['value']
+
+
+def _capped_timeout(timeout):
+    """Cap a socket timeout to the deadline without raising (see deadline_timeout())."""
+    remaining = deadline_remaining()
+    if remaining is None:
+        return timeout
+    remaining = max(remaining, _EXPIRED_TIMEOUT)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _install_check_socket():
+    """Install CheckSocket and CheckSSLSocket once. Caller holds _socket_install_lock."""
+    global _original_socket
+    if _original_socket is not None:
+        return
+    _original_socket = socket.socket
+    
+    class CheckSocket(_original_socket):
+        """
+        socket.socket used by checks: timeouts stop at the thread's check
+        deadline, and connect() is timed for tracing - each when installed.
+        """
+        
+        __slots__ = ()
+        
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if _socket_deadlines and deadline_remaining() is not None:
+                try:
+                    super().settimeout(_capped_timeout(self.gettimeout()))
+                except BaseException:
+                    self.close()
+                    raise
+        
+        def settimeout(self, timeout):
+            if _socket_deadlines:
+                timeout = _capped_timeout(timeout)
+            super().settimeout(timeout)
+        
+        def connect(self, address):
+            if _socket_deadlines and deadline_remaining() is not None:
+                # Raises DeadlineExceeded once the budget is spent
+                super().settimeout(deadline_timeout(self.gettimeout()))
+            timer = _socket_connect_timer
+            if timer is None:
+                return super().connect(address)
+            with timer():
+                return super().connect(address)
+    
+    socket.socket = CheckSocket
+    # Contexts that chose their own class (enable_tls_resumption()) already
+    # get a CheckSSLSocket subclass
+    if ssl.SSLContext.sslsocket_class is ssl.SSLSocket:
+        ssl.SSLContext.sslsocket_class = CheckSSLSocket
+
+
+def install_socket_deadlines():
+    """
+    Make sockets created on threads with a deadline respect it.
+    
+    Replaces socket.socket (and so socket.create_connection()) and the
+    default SSL socket class with subclasses whose timeouts are capped to
+    the time left; connect() raises DeadlineExceeded once the deadline has
+    passed. Threads without a deadline are unaffected. Safe to call
+    repeatedly.
+    """
+    global _socket_deadlines
+    with _socket_install_lock:
+        _install_check_socket()
+        _socket_deadlines = True
+
+
+def install_connect_timer(timer):
+    """
+    Time every socket connect() with timer().
+    
+    Shares the socket.socket subclass installed by install_socket_deadlines(),
+    so the two work together whatever order they are installed in.
+    
+    Args:
+        timer (callable): Returns a context manager wrapped around connect()
+    """
+    global _socket_connect_timer
+    with _socket_install_lock:
+        _install_check_socket()
+        _socket_connect_timer = timer
+
+
 def test_tcp_connection(host, port, timeout=10, ssl_context=None):
     """
     Test a basic TCP connection to a host:port.
@@ -96,3 +590,44 @@ def validate_required_fields(form_data, required_fields):
     
     return len(missing) == 0, missing
 
+
+def verification_depth(form_data):
+    """
+    Return how much work a check should do once the credentials are proven.
+    
+    Modules that declare a literal `verification_depths` list are handed
+    a 'verification_depth' value by the GUI and the batch runner:
+    
+        auth-only - stop at the cheapest request that proves the credential
+                    (no follow-up calls, no logout)
+        identity  - also confirm who/what was logged into with one cheap call
+        full      - everything the module reports (inventory, stats, searches)
+    
+    Args:
+        form_data (dict): Form field values
+        
+    Returns:
+        str: One of VERIFICATION_DEPTHS (DEPTH_FULL if unset or unknown)
+    """
+    depth = form_data.get('verification_depth', DEPTH_FULL)
+    return depth if depth in VERIFICATION_DEPTHS else DEPTH_FULL
+
+
+def module_depth(entry, depth):
+    """
+    Return the verification depth a module should run at.
+    
+    Args:
+        entry (dict): Manifest entry
+        depth (str): Requested depth, one of VERIFICATION_DEPTHS
+        
+    Returns:
+        str: The requested depth, or the next deeper one the module declares
+             in `verification_depths`; None if it declares none of them
+    """
+    declared = entry.get('verification_depths') or ()
+    levels = VERIFICATION_DEPTHS
+    for candidate in levels[levels.index(depth):] if depth in levels else ():
+        if candidate in declared:
+            return candidate
+    return None
@@ -0,0 +1,886 @@
+# AuthCheck headless batch runner
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Runs AuthCheck modules without a display: every selected module is tried
+# against every target with every credential, fanned out over a worker
+# pool, and results are streamed as JSON lines. Modules are loaded through
+# the same form_fields/authenticate contract the GUI uses. This file must
+# not import PySide6.
+#
+# Usage:
+#   python batch_runner.py -m SSH,FTP -t targets.txt -c creds.txt -w 16 -o results.jsonl
+#   python batch_runner.py -m 'Apache_*' -t targets.txt --defaults
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import fnmatch
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+import async_engine
+import auth_utils
+import credential_source
+import default_creds
+import http_pool
+import job_journal
+import process_lane
+import results
+import scheduler as pacing
+import tracing
+from module_manifest import ModuleManifest
+from results import TARGET_FIELDS, USERNAME_FIELDS
+
+
+DEFAULT_MODULES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'AuthCheck_modules')
+DEFAULT_WORKERS = 16
+DEFAULT_DEADLINE = 60.0  # Seconds one check may take, all steps included
+DEFAULT_SWEEP_SIZE = 32       # Credentials per connection with --sweep
+DEFAULT_SWEEP_BUFFER = 10000  # Jobs held back while sweeps fill up
+
+# Target fields (results.TARGET_FIELDS) that take a URL rather than a host
+URL_FIELDS = ('url', 'base_url', 'api_url', 'server_url', 'endpoint')
+
+# Field names that receive the secret, in order of preference (the
+# username goes to the first of results.USERNAME_FIELDS)
+SECRET_FIELDS = ('password', 'token', 'api_key', 'api_token', 'community',
+                 'secret_access_key', 'client_secret', 'secret_key', 'secret',
+                 'access_token')
+
+
+def read_lines(path):
+    """
+    Yield non-empty, non-comment lines from a file ('-' reads stdin).
+
+    Args:
+        path (str): File path or '-'
+
+    Yields:
+        str: Stripped line
+    """
+    f = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8', errors='replace')
+    try:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def default_form_data(form_fields):
+    """
+    Build form data from field defaults, the way the GUI fills a new form.
+
+    Args:
+        form_fields (list): Module form_fields
+
+    Returns:
+        dict: {field_name: value}
+    """
+    form_data = {}
+    for field in form_fields:
+        field_name = field.get('name', '')
+        field_type = field.get('type', 'text')
+        field_default = field.get('default', '')
+        if field_type == 'readonly':
+            continue
+        if field_type == 'checkbox':
+            form_data[field_name] = bool(field_default)
+        elif field_type == 'combo':
+            options = field.get('options', [])
+            if field_default and field_default in options:
+                form_data[field_name] = field_default
+            else:
+                form_data[field_name] = options[0] if options else ''
+        else:
+            form_data[field_name] = str(field_default) if field_default else ''
+    return form_data
+
+
+def _first_field(form_fields, candidates):
+    """Return the first candidate field name the module defines, or None."""
+    names = {field.get('name') for field in form_fields}
+    for candidate in candidates:
+        if candidate in names:
+            return candidate
+    return None
+
+
+def apply_target(form_fields, form_data, target):
+    """
+    Fill the module's target fields from a target string.
+
+    Accepts 'host', 'host:port', '[ipv6]:port' or a URL.
+
+    Returns:
+        bool: False if the module has no field that can take a target
+    """
+    field = _first_field(form_fields, TARGET_FIELDS)
+    if field is None:
+        return False
+
+    if field in URL_FIELDS:
+        form_data[field] = target
+        return True
+
+    if '://' in target:
+        parts = urlsplit(target)
+        host, port = parts.hostname or '', parts.port
+        if parts.scheme in ('https', 'http'):
+            for tls_field in ('use_https', 'use_ssl', 'use_tls'):
+                if tls_field in form_data:
+                    form_data[tls_field] = parts.scheme == 'https'
+                    break
+    else:
+        parts = urlsplit('//' + target)
+        try:
+            host, port = parts.hostname or target, parts.port
+        except ValueError:
+            host, port = target, None
+
+    form_data[field] = host
+    if port is not None and 'port' in form_data:
+        form_data['port'] = str(port)
+    return True
+
+
+def apply_credential(form_fields, form_data, username, secret,
+                     username_field=None, secret_field=None):
+    """
+    Fill the module's credential fields.
+
+    Returns:
+        bool: False if the module has no field that can take the secret
+    """
+    if secret_field is None:
+        secret_field = _first_field(form_fields, SECRET_FIELDS)
+    if secret_field is None:
+        for field in form_fields:
+            if field.get('type') == 'password':
+                secret_field = field.get('name')
+                break
+    if secret_field is None:
+        return False
+    form_data[secret_field] = secret
+
+    if username is not None:
+        if username_field is None:
+            username_field = _first_field(form_fields, USERNAME_FIELDS)
+        if username_field is not None:
+            form_data[username_field] = username
+    return True
+
+
+def select_modules(manifest, patterns):
+    """
+    Resolve module names or shell-style patterns against the manifest.
+
+    Args:
+        manifest (ModuleManifest): Refreshed manifest
+        patterns (list): Names or patterns (e.g. 'SSH', 'Apache_*')
+
+    Returns:
+        list: Matching module names, in manifest order
+    """
+    available = [name for name, _ in manifest.available()]
+    selected = []
+    for pattern in patterns:
+        matches = [name for name in available if fnmatch.fnmatchcase(name, pattern)]
+        if not matches:
+            raise ValueError(f"No module matches '{pattern}'")
+        selected.extend(name for name in matches if name not in selected)
+    return selected
+
+
+def full_depth_job(job):
+    """Return a copy of a job that runs at full verification depth."""
+    return dict(job, form_data=dict(job['form_data'], verification_depth=auth_utils.DEPTH_FULL))
+
+
+def plan_jobs(manifest, module_names, targets, credentials, overrides=None,
+              username_field=None, secret_field=None, skip=None, credentials_for=None, journal=None,
+              depth=None):
+    """
+    Lazily yield one job per (module, target, credential).
+
+    Each credential is tried against every target before the next one, so
+    consecutive jobs are spread across hosts.
+
+    Args:
+        manifest (ModuleManifest): Refreshed manifest
+        module_names (list): Modules to run
+        targets (list): Target strings
+        credentials (iterable): Re-iterable of (username, secret) pairs,
+            e.g. a credential_source source
+        overrides (dict): Extra {field_name: value} applied to every job
+        skip (callable): skip(module, target, username, secret) -> True to
+            leave a job out (e.g. already tried)
+        credentials_for (callable): credentials_for(module) -> that module's
+            (username, secret) pairs, used instead of credentials
+        journal (job_journal.JobJournal): Leave out jobs it records as done
+        depth (str): Verification depth for modules that declare
+            `verification_depths` (see auth_utils.verification_depth)
+
+    Yields:
+        dict: {'seq', 'module', 'target', 'username', 'password', 'form_data'}
+        where seq numbers every planned job, including ones left out
+    """
+    seq = -1
+    for module_name in module_names:
+        form_fields = manifest.entries[module_name].get('form_fields', [])
+        base = default_form_data(form_fields)
+        base.update(overrides or {})
+        if depth is not None:
+            run_depth = auth_utils.module_depth(manifest.entries[module_name], depth)
+            if run_depth is not None:
+                base['verification_depth'] = run_depth
+        if not apply_credential(form_fields, dict(base), None, '', username_field, secret_field):
+            continue
+        with_targets = []
+        for target in targets:
+            with_target = dict(base)
+            if apply_target(form_fields, with_target, target):
+                with_targets.append((target, with_target))
+        module_credentials = credentials if credentials_for is None else credentials_for(module_name)
+        for username, secret in module_credentials:
+            for target, with_target in with_targets:
+                seq += 1
+                if journal is not None and journal.is_done(seq):
+                    continue
+                if skip is not None and skip(module_name, target, username, secret):
+                    continue
+                form_data = dict(with_target)
+                apply_credential(form_fields, form_data, username, secret,
+                                 username_field, secret_field)
+                yield {
+                    'seq': seq,
+                    'module': module_name,
+                    'target': target,
+                    'username': username,
+                    'password': secret,
+                    'form_data': form_data,
+                }
+
+
+def has_sweep(module):
+    """Return True if a module can try several credentials per connection (authenticate_sweep())."""
+    return callable(getattr(module, 'authenticate_sweep', None))
+
+
+def sweeps_per_username(module):
+    """Return True if a module's sweeps must all use one username (`sweep_per_username = True`)."""
+    return bool(getattr(module, 'sweep_per_username', False))
+
+
+def _sweep_job(batch):
+    """Wrap jobs for one (module, target) into a sweep job; a single job stays plain."""
+    if len(batch) == 1:
+        return batch[0]
+    first = batch[0]
+    return {
+        'seq': None,
+        'module': first['module'],
+        'target': first['target'],
+        'username': None,
+        'password': None,
+        'form_data': first['form_data'],
+        'sweep': batch,
+    }
+
+
+def sweep_jobs(manifest, jobs, size, lane=None, budgeted=()):
+    """
+    Group jobs into sweeps for modules that define authenticate_sweep().
+
+    Jobs for one (module, target) - and one username for modules that set
+    `sweep_per_username` - are collected into sweeps of up to `size`
+    credentials, which the module tries over one connection. Jobs for
+    other modules pass through unchanged. At most DEFAULT_SWEEP_BUFFER jobs
+    are held back; beyond that the oldest partial sweep is released.
+
+    Args:
+        manifest (ModuleManifest): Refreshed manifest
+        jobs (iterable): Jobs from plan_jobs()
+        size (int): Credentials per sweep
+        lane (process_lane.ProcessLane): Modules running in the lane are not swept
+        budgeted (iterable): Modules with a lockout budget; their sweeps try
+            each username at most once, so the scheduler can hold and charge
+            every account in a sweep like a single check
+
+    Yields:
+        dict: Plain jobs, or sweep jobs whose 'sweep' lists the jobs they cover
+    """
+    sweepable = {}  # {module: None if not swept, else whether sweeps are per username}
+    pending = collections.OrderedDict()  # {(module, target[, username]): [jobs]}
+    held = 0
+    for job in jobs:
+        module_name = job['module']
+        if module_name not in sweepable:
+            try:
+                module = load_job_module(manifest, module_name, lane)
+                sweepable[module_name] = sweeps_per_username(module) if has_sweep(module) else None
+            except Exception:
+                sweepable[module_name] = None  # run_job() reports the import error
+        if sweepable[module_name] is None:
+            yield job
+            continue
+        key = (module_name, job['target'])
+        if sweepable[module_name]:
+            key += (job['username'],)
+        batch = pending.get(key)
+        if (batch and module_name in budgeted and job['username'] is not None
+                and any(queued['username'] == job['username'] for queued in batch)):
+            # One attempt per account per sweep, so its budget is checked up front
+            held -= len(batch)
+            yield _sweep_job(pending.pop(key))
+            batch = None
+        if batch is None:
+            batch = pending[key] = []
+        batch.append(job)
+        held += 1
+        if len(batch) >= size:
+            held -= len(batch)
+            yield _sweep_job(pending.pop(key))
+        elif held > DEFAULT_SWEEP_BUFFER:
+            _, oldest = pending.popitem(last=False)
+            held -= len(oldest)
+            yield _sweep_job(oldest)
+    for batch in pending.values():
+        yield _sweep_job(batch)
+
+
+def _next_sweep_result(outcomes, session_pool=None, trace=None):
+    """Advance a module's authenticate_sweep() by one attempt, inside the pool and trace if any."""
+    with trace.activate() if trace is not None else contextlib.nullcontext():
+        with session_pool.activate() if session_pool is not None else contextlib.nullcontext():
+            outcome = next(outcomes, None)
+    if outcome is None:
+        raise RuntimeError("authenticate_sweep() returned fewer results than attempts")
+    return outcome
+
+
+def _call_authenticate(module, form_data, session_pool=None, trace=None):
+    """Call a module's synchronous authenticate(), inside the pool and trace if any."""
+    with trace.activate() if trace is not None else contextlib.nullcontext():
+        if session_pool is not None:
+            with session_pool.activate():
+                return module.authenticate(form_data)
+        return module.authenticate(form_data)
+
+
+def _job_result(job, success, message, status, start, trace=None):
+    """Build the JSON-serialisable result for a finished job."""
+    result = {
+        'module': job['module'],
+        'target': job['target'],
+        'username': job['username'],
+        'status': status,
+        'outcome': results.classify(success, message, raised=status == 'error'),
+        'success': bool(success),
+        'message': str(message),
+        'elapsed': round(time.perf_counter() - start, 4),
+        'phases': trace.phases() if trace is not None else {},
+    }
+    depth = job['form_data'].get('verification_depth')
+    if depth is not None:
+        result['depth'] = depth
+    return result
+
+
+def load_job_module(manifest, module_name, lane=None):
+    """
+    Return the module to run a job with.
+
+    Modules that belong in the process lane (see process_lane.module_lane)
+    are not imported here; a stand-in that calls into the lane is returned.
+    """
+    if lane is not None and process_lane.module_lane(manifest.entries[module_name]) == process_lane.LANE_PROCESS:
+        return lane.module(module_name)
+    return manifest.load_module(module_name)
+
+
+def run_job(manifest, job, session_pool=None, lane=None, deadline=None):
+    """
+    Run one job through the module's authenticate() function.
+
+    Args:
+        manifest (ModuleManifest): Refreshed manifest
+        job (dict): Job from plan_jobs()
+        session_pool (http_pool.SessionPool): Shared HTTP connections, if any
+        lane (process_lane.ProcessLane): Worker processes for native-driver modules
+        deadline (float): Seconds the check may take (see auth_utils.call_with_deadline)
+
+    Returns:
+        dict: JSON-serialisable result
+    """
+    start = time.perf_counter()
+    trace = tracing.Trace()
+    try:
+        module = load_job_module(manifest, job['module'], lane)
+        success, message = auth_utils.call_with_deadline(
+            _call_authenticate, (module, job['form_data'], session_pool, trace), deadline)
+        status = 'success' if success else 'failed'
+    except auth_utils.DeadlineExceeded as e:
+        success, message, status = False, str(e), 'failed'
+    except Exception as e:
+        success, message, status = False, f"Exception during authentication: {e}", 'error'
+    return _job_result(job, success, message, status, start, trace)
+
+
+def run_sweep(manifest, sweep, session_pool=None, lane=None, deadline=None):
+    """
+    Run a sweep job through the module's authenticate_sweep().
+
+    Each attempt gets its own deadline and result. If an attempt overruns
+    or raises, the sweep is abandoned and its remaining jobs run one by one
+    through run_job().
+
+    Returns:
+        list: (job, result) for every job in the sweep, in order
+    """
+    jobs = sweep['sweep']
+    pairs = []
+    try:
+        module = load_job_module(manifest, sweep['module'], lane)
+        outcomes = module.authenticate_sweep(job['form_data'] for job in jobs)
+    except Exception:
+        outcomes = None
+    for index, job in enumerate(jobs):
+        if outcomes is None:
+            pairs.append((job, run_job(manifest, job, session_pool, lane, deadline)))
+            continue
+        start = time.perf_counter()
+        trace = tracing.Trace()
+        try:
+            success, message = auth_utils.call_with_deadline(
+                _next_sweep_result, (outcomes, session_pool, trace), deadline)
+            status = 'success' if success else 'failed'
+        except auth_utils.DeadlineExceeded as e:
+            # The sweep may still be running on its helper thread; leave it
+            success, message, status = False, str(e), 'failed'
+            outcomes = None
+        except Exception as e:
+            success, message, status = False, f"Exception during authentication: {e}", 'error'
+            outcomes = None
+        pairs.append((job, _job_result(job, success, message, status, start, trace)))
+    if outcomes is not None:
+        outcomes.close()  # Lets the module close its connection
+    return pairs
+
+
+def job_host(job):
+    """Return the host a job targets, for per-host concurrency limits."""
+    target = job['target']
+    parts = urlsplit(target if '://' in target else '//' + target)
+    return (parts.hostname or target).lower()
+
+
+async def run_job_async(engine, module, job, session_pool=None, deadline=None):
+    """
+    Run one job on an AsyncEngine.
+
+    Modules with authenticate_async() run on the engine's loop; others run
+    on its bounded executor. The module is loaded by the caller (see
+    load_job_module) so that imports never block the loop.
+
+    Returns:
+        dict: JSON-serialisable result
+    """
+    start = time.perf_counter()
+    trace = tracing.Trace()  # Only synchronous checks are traced
+    try:
+        success, message = await engine.check(
+            module, job['form_data'], host=job_host(job),
+            sync_call=lambda m, form_data: auth_utils.call_with_deadline(
+                _call_authenticate, (m, form_data, session_pool, trace), deadline),
+            timeout=deadline,
+        )
+        status = 'success' if success else 'failed'
+    except auth_utils.DeadlineExceeded as e:
+        success, message, status = False, str(e), 'failed'
+    except Exception as e:
+        success, message, status = False, f"Exception during authentication: {e}", 'error'
+    return _job_result(job, success, message, status, start, trace)
+
+
+def run_jobs(manifest, jobs, workers=DEFAULT_WORKERS, on_result=None, session_pool=None, engine=None,
+             scheduler=None, lane=None, deadline=None):
+    """
+    Run jobs concurrently, keeping a bounded number in flight.
+
+    Args:
+        manifest (ModuleManifest): Refreshed manifest
+        jobs (iterable): Jobs from plan_jobs()
+        workers (int): Maximum concurrent checks
+        on_result (callable): Called with (job, result) as each check finishes
+        session_pool (http_pool.SessionPool): Shared HTTP connections, if any
+        engine (async_engine.AsyncEngine): Run on this engine instead of a
+            thread pool; its own limits then bound concurrency (sweep jobs
+            run on its executor threads)
+        scheduler (scheduler.Scheduler): Pace jobs per host and account
+        lane (process_lane.ProcessLane): Run native-driver modules in worker
+            processes; other modules stay in threads
+        deadline (float): Seconds each check may take, or None for no limit
+
+    Returns:
+        dict: Totals {'total', 'success', 'failed', 'error'}
+    """
+    totals = {'total': 0, 'success': 0, 'failed': 0, 'error': 0}
+    slots = engine.max_concurrency if engine is not None else workers
+    in_flight = {}  # {future: (job, host)}
+
+    def collect(done):
+        for future in done:
+            job, host = in_flight.pop(future)
+            result = future.result()
+            pairs = result if 'sweep' in job else [(job, result)]
+            if scheduler is not None:
+                if 'sweep' in job:
+                    # Every credential in the sweep is charged to its own account
+                    scheduler.finished_sweep(job, host, pairs)
+                else:
+                    scheduler.finished(job, host, result)
+            for finished_job, finished_result in pairs:
+                totals['total'] += 1
+                totals[finished_result['status']] += 1
+                if on_result:
+                    on_result(finished_job, finished_result)
+
+    def drain(until, timeout=None):
+        while len(in_flight) > until:
+            done, _ = concurrent.futures.wait(in_flight, timeout=timeout,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            collect(done)
+            if timeout is not None:
+                break
+
+    def dispatch(submit):
+        if scheduler is None:
+            for job in jobs:
+                # Queue a little ahead so workers never wait on planning
+                drain(slots * 2 - 1)
+                in_flight[submit(job)] = (job, None)
+            drain(0)
+            return
+
+        pending_jobs = iter(jobs)
+        exhausted = False
+        while True:
+            while not exhausted and scheduler.wants_more():
+                job = next(pending_jobs, None)
+                if job is None:
+                    exhausted = True
+                else:
+                    scheduler.add(job, job_host(job))
+            delay = None
+            while len(in_flight) < slots:
+                job, host, delay = scheduler.next_job()
+                if job is None:
+                    break
+                in_flight[submit(job)] = (job, host)
+            if in_flight:
+                # Wake up for a finished check or for a paced job, whichever is first
+                drain(len(in_flight) - 1, delay)
+            elif delay is not None:
+                time.sleep(delay)
+            elif exhausted:
+                return
+
+    if engine is not None:
+        def submit_async(job):
+            if 'sweep' in job:
+                # One connection per sweep; it runs on the engine's executor threads
+                return engine.executor.submit(run_sweep, manifest, job, session_pool, lane, deadline)
+            try:
+                # Imported here, on the dispatching thread, not on the loop
+                module = load_job_module(manifest, job['module'], lane)
+            except Exception:
+                # run_job() reports the import error
+                return engine.executor.submit(run_job, manifest, job, session_pool, lane, deadline)
+            return engine.submit(run_job_async(engine, module, job, session_pool, deadline))
+        dispatch(submit_async)
+        return totals
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        dispatch(lambda job: executor.submit(run_sweep if 'sweep' in job else run_job,
+                                             manifest, job, session_pool, lane, deadline))
+    return totals
+
+
+def _parse_overrides(values):
+    """Turn ['field=value', ...] into a dict, converting true/false."""
+    overrides = {}
+    for item in values or []:
+        if '=' not in item:
+            raise ValueError(f"--set expects field=value, got '{item}'")
+        name, value = item.split('=', 1)
+        if value.lower() in ('true', 'false'):
+            value = value.lower() == 'true'
+        overrides[name] = value
+    return overrides
+
+
+def build_parser():
+    """Create the command line parser."""
+    parser = argparse.ArgumentParser(
+        description="Run AuthCheck modules headlessly and stream results as JSON lines."
+    )
+    parser.add_argument('-m', '--modules', required=True,
+                        help="Comma-separated module names or patterns (e.g. 'SSH,Apache_*')")
+    parser.add_argument('-t', '--targets', required=True,
+                        help="File of targets (host, host:port or URL), '-' for stdin")
+    parser.add_argument('-c', '--credentials',
+                        help="File of credentials, one 'user:password' (or bare secret) per line")
+    parser.add_argument('--users', help="File of usernames, combined with every --passwords entry")
+    parser.add_argument('--passwords',
+                        help="File of passwords/secrets (alone: bare secrets, no username)")
+    parser.add_argument('--defaults', action='store_true',
+                        help="Try each module's default credentials (from its hints) first")
+    parser.add_argument('--user-major', action='store_true',
+                        help="With --users: try every password for one user before the next user "
+                             "(default: each password across all users)")
+    parser.add_argument('--tried', metavar='FILE',
+                        help="Skip (module, target, credential) tuples recorded in FILE and record "
+                             "new attempts there")
+    parser.add_argument('--journal', metavar='FILE',
+                        help="Record finished jobs in FILE; rerunning the same command with the "
+                             "same FILE resumes after an interruption")
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent checks (default {DEFAULT_WORKERS})")
+    parser.add_argument('--deadline', type=float, default=DEFAULT_DEADLINE,
+                        help=f"Seconds one check may take in total; HTTP requests and sockets stop "
+                             f"at the deadline (default {DEFAULT_DEADLINE:g}, 0 = no limit)")
+    parser.add_argument('--engine', choices=['threads', 'async'], default='threads',
+                        help="threads: one thread per check; async: shared event loop with "
+                             "per-host limits (default threads)")
+    parser.add_argument('--per-host', type=int, default=async_engine.DEFAULT_PER_HOST_LIMIT,
+                        help=f"Concurrent checks per host with --engine async "
+                             f"(default {async_engine.DEFAULT_PER_HOST_LIMIT})")
+    parser.add_argument('--max-per-host', type=int, default=pacing.DEFAULT_MAX_PER_HOST,
+                        help=f"Concurrent checks per host (default {pacing.DEFAULT_MAX_PER_HOST})")
+    parser.add_argument('--max-per-account', type=int, default=pacing.DEFAULT_MAX_PER_ACCOUNT,
+                        help=f"Concurrent checks per host and username (default {pacing.DEFAULT_MAX_PER_ACCOUNT})")
+    parser.add_argument('--min-spacing', type=float, default=pacing.DEFAULT_MIN_SPACING,
+                        help="Minimum seconds between attempts on one host (default 0)")
+    parser.add_argument('--lockout-budget', action='append', metavar='MODULE=ATTEMPTS/SECONDS',
+                        help="Failed attempts allowed per account per window for a module "
+                             "(repeatable; adds to the built-in budgets)")
+    parser.add_argument('--unpaced', action='store_true',
+                        help="Disable per-host/per-account pacing and lockout budgets")
+    parser.add_argument('--process-workers', type=int, default=process_lane.DEFAULT_WORKERS,
+                        help=f"Worker processes for native-driver modules such as Oracle_DB and SAP "
+                             f"(default {process_lane.DEFAULT_WORKERS})")
+    parser.add_argument('--no-process-lane', action='store_true',
+                        help="Run native-driver modules in threads like every other module")
+    parser.add_argument('-o', '--output', default='-',
+                        help="JSONL output file (default stdout)")
+    parser.add_argument('--store', metavar='DB',
+                        help="Also append results to this SQLite result database")
+    parser.add_argument('--set', action='append', metavar='FIELD=VALUE',
+                        help="Set a form field for every check (repeatable)")
+    parser.add_argument('--username-field', help="Form field that receives the username")
+    parser.add_argument('--secret-field', help="Form field that receives the password/secret")
+    parser.add_argument('--no-timing-summary', action='store_true',
+                        help="Don't print per-module/per-host latency percentiles at the end")
+    parser.add_argument('--include-passwords', action='store_true',
+                        help="Include the tried password in each result line")
+    parser.add_argument('--sweep', type=int, nargs='?', const=DEFAULT_SWEEP_SIZE, default=0, metavar='N',
+                        help=f"Try up to N credentials (default {DEFAULT_SWEEP_SIZE}) per connection with "
+                             f"modules that support it, such as SSH; a sweep is paced as one check on "
+                             f"its host and modules with lockout budgets are not swept")
+    parser.add_argument('--depth', choices=auth_utils.VERIFICATION_DEPTHS,
+                        help="How far modules that support it go after a successful login: auth-only stops "
+                             "at the first proof, identity adds one who-am-I call, full does everything "
+                             "(default: each module's full check)")
+    parser.add_argument('--rerun-full', action='store_true',
+                        help="With --depth auth-only/identity: re-check every success at full depth "
+                             "after the run")
+    parser.add_argument('--no-http-pool', action='store_true',
+                        help="Open a new HTTP connection for every request")
+    parser.add_argument('--modules-dir', default=DEFAULT_MODULES_DIR,
+                        help="Path to AuthCheck_modules")
+    return parser
+
+
+def main(argv=None):
+    """Command line entry point."""
+    args = build_parser().parse_args(argv)
+
+    manifest = ModuleManifest(args.modules_dir)
+    for message in manifest.refresh():
+        print(message, file=sys.stderr)
+
+    try:
+        module_names = select_modules(manifest, [p.strip() for p in args.modules.split(',') if p.strip()])
+        overrides = _parse_overrides(args.set)
+        budgets = dict(pacing.DEFAULT_LOCKOUT_BUDGETS)
+        budgets.update(pacing.parse_budget(item) for item in args.lockout_budget or [])
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    targets = list(read_lines(args.targets))
+    if args.credentials:
+        credentials = credential_source.ComboSource(args.credentials, skip_comments=True)
+    elif args.users and args.passwords:
+        credentials = credential_source.CrossProductSource(args.users, args.passwords,
+                                                           password_major=not args.user_major)
+    elif args.passwords:
+        credentials = credential_source.SecretSource(args.passwords)
+    elif args.defaults:
+        credentials = ()
+    else:
+        print("Error: give -c, --defaults, or --passwords (optionally with --users)", file=sys.stderr)
+        return 2
+
+    credentials_for = None
+    if args.defaults:
+        defaults = default_creds.DefaultCredentials(manifest)
+        missing = [name for name in module_names if not defaults.get(name)]
+        if missing:
+            print(f"No default credentials known for: {', '.join(missing)}", file=sys.stderr)
+        credentials_for = lambda module: itertools.chain(defaults.get(module), credentials)
+
+    journal = None
+    if args.journal:
+        # Anything that changes the job order makes the journal invalid
+        fingerprint = job_journal.plan_fingerprint(
+            module_names, targets, job_journal.file_identity(args.credentials),
+            job_journal.file_identity(args.users), job_journal.file_identity(args.passwords),
+            args.user_major, args.defaults and {name: defaults.get(name) for name in module_names},
+            overrides, args.username_field, args.secret_field,
+        )
+        try:
+            journal = job_journal.JobJournal(args.journal, fingerprint)
+        except job_journal.JournalMismatch as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        if journal.resumed:
+            print(f"Resuming: {journal.resumed} job(s) already finished", file=sys.stderr)
+
+    tried = credential_source.TriedSet(args.tried) if args.tried else None
+    skip = None
+    if tried is not None:
+        skip = lambda module, target, username, secret: (module, target, username, secret) in tried
+    jobs = plan_jobs(manifest, module_names, targets, credentials, overrides,
+                     args.username_field, args.secret_field, skip, credentials_for, journal, args.depth)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'a', encoding='utf-8')
+    write_lock = threading.Lock()
+
+    store = results.ResultStore(args.store) if args.store else None
+    latency = tracing.LatencyStats()
+    winners = []  # Successes to confirm at full depth
+
+    def on_result(job, result):
+        latency.add(job['module'], job_host(job), result['phases'])
+        if args.rerun_full and result['success'] and result.get('depth', auth_utils.DEPTH_FULL) != auth_utils.DEPTH_FULL:
+            winners.append(job)
+        if store is not None:
+            store.add(results.AuthResult(result['module'], result['target'], result['username'],
+                                         result['outcome'], result['elapsed'], result['message'],
+                                         phases=result['phases'] or None))
+        if args.include_passwords:
+            result['password'] = job['password']
+        with write_lock:
+            out.write(json.dumps(result) + '\n')
+            out.flush()
+        if tried is not None:
+            tried.add(job['module'], job['target'], job['username'], job['password'])
+        # Last, so a job is never recorded as done without its result
+        if journal is not None:
+            journal.complete(job['seq'])
+
+    def flush_results():
+        """Make every written result durable before the journal records it."""
+        if store is not None:
+            store.flush()
+        if out is not sys.stdout:
+            os.fsync(out.fileno())
+
+    if journal is not None:
+        journal.before_sync = flush_results
+
+    # Sockets opened during a check stop at its deadline
+    if args.deadline:
+        auth_utils.install_socket_deadlines()
+    tracing.install()
+
+    # Share keep-alive HTTP connections between attempts
+    session_pool = None
+    if not args.no_http_pool and http_pool.install():
+        session_pool = http_pool.SessionPool()
+
+    scheduler = None
+    if not args.unpaced:
+        scheduler = pacing.Scheduler(args.max_per_host, args.max_per_account, args.min_spacing, budgets)
+
+    engine = None
+    if args.engine == 'async':
+        # -w bounds the threads used by synchronous modules; native async
+        # modules may have many more checks in flight
+        engine = async_engine.AsyncEngine(per_host_limit=args.per_host, executor_workers=args.workers)
+
+    lane = None
+    if not args.no_process_lane:
+        lane = process_lane.ProcessLane(args.modules_dir, workers=args.process_workers)
+
+    if args.sweep > 1:
+        # With pacing, sweeps of budgeted modules try each account once
+        jobs = sweep_jobs(manifest, jobs, args.sweep, lane, budgets if scheduler is not None else ())
+
+    try:
+        totals = run_jobs(manifest, jobs, args.workers, on_result, session_pool, engine, scheduler, lane,
+                          args.deadline or None)
+        rerun = None
+        if winners:
+            # Only the proven credentials pay for the full post-login work
+            rerun = run_jobs(manifest, [full_depth_job(job) for job in winners], args.workers, on_result,
+                             session_pool, engine, scheduler, lane, args.deadline or None)
+    finally:
+        if lane is not None:
+            lane.close()
+        if engine is not None:
+            engine.close()
+        if session_pool is not None:
+            session_pool.close()
+        # The journal's last sync flushes the store and output first
+        if journal is not None:
+            journal.close()
+        if store is not None:
+            store.close()
+        if tried is not None:
+            tried.close()
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"{totals['total']} checks: {totals['success']} success, {totals['failed']} failed, "
+          f"{totals['error']} error", file=sys.stderr)
+    if rerun is not None:
+        print(f"{rerun['total']} success(es) re-checked at full depth: {rerun['success']} confirmed",
+              file=sys.stderr)
+    if totals['total'] and not args.no_timing_summary:
+        print(f"\nLatency by module:\n{latency.format_table('module')}", file=sys.stderr)
+        print(f"\nSlowest hosts:\n{latency.format_table('host', limit=10)}", file=sys.stderr)
+    tls = auth_utils.get_tls_resumption_stats()
+    if tls['handshakes']:
+        print(f"TLS: {tls['handshakes']} handshakes, {tls['resumed']} resumed "
+              f"({tls['resumption_rate']:.0%})", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
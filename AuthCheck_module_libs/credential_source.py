@@ -0,0 +1,244 @@
+# AuthCheck credential sources
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Streams (username, secret) pairs from very large wordlists. Files are
+# memory-mapped and read one line at a time, so memory use does not grow
+# with the list, and a TriedSet remembers attempted pairs compactly on disk
+# so a later run can skip them. Interrupted batch runs resume through the
+# job journal (job_journal.py), which records finished jobs in plan order;
+# the sources themselves keep no position.
+
+import bisect
+import hashlib
+import heapq
+import mmap
+import os
+from array import array
+
+
+def _decode(raw):
+    """Decode a wordlist line; non-UTF-8 lines are taken as Latin-1."""
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode('latin-1')
+
+
+def iter_lines(path, skip_comments=False):
+    """
+    Lazily yield the non-empty lines of a file through mmap.
+
+    Args:
+        path (str): File to read
+        skip_comments (bool): Skip lines starting with '#'
+
+    Yields:
+        str: Line without its line ending
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while pos < size:
+                end = mm.find(b'\n', pos)
+                next_pos = size if end == -1 else end + 1
+                if end == -1:
+                    end = size
+                raw = mm[pos:end].rstrip(b'\r')
+                pos = next_pos
+                if not raw or (skip_comments and raw.startswith(b'#')):
+                    continue
+                yield _decode(raw)
+
+
+def parse_combo(line, separator=':'):
+    """
+    Split a combo line into (username, secret).
+
+    A line without the separator is a bare secret (token, community string)
+    and gives (None, line).
+    """
+    if separator in line:
+        username, secret = line.split(separator, 1)
+        return username, secret
+    return None, line
+
+
+class ComboSource:
+    """Pairs from a combo file ('user:password' per line, or bare secrets)."""
+
+    def __init__(self, path, separator=':', skip_comments=False):
+        self.path = path
+        self.separator = separator
+        self.skip_comments = skip_comments
+
+    def pairs(self, skip=None):
+        """
+        Yield pairs in file order.
+
+        Args:
+            skip (callable): skip(username, secret) -> True to leave a pair out
+
+        Yields:
+            tuple: (username, secret)
+        """
+        for line in iter_lines(self.path, self.skip_comments):
+            username, secret = parse_combo(line, self.separator)
+            if skip is not None and skip(username, secret):
+                continue
+            yield username, secret
+
+    def __iter__(self):
+        return self.pairs()
+
+
+class SecretSource:
+    """Pairs from a list of bare secrets, with an optional fixed username."""
+
+    def __init__(self, path, username=None):
+        self.path = path
+        self.username = username
+
+    def pairs(self, skip=None):
+        """Yield (username, secret); see ComboSource.pairs()."""
+        for secret in iter_lines(self.path):
+            if skip is not None and skip(self.username, secret):
+                continue
+            yield self.username, secret
+
+    def __iter__(self):
+        return self.pairs()
+
+
+class CrossProductSource:
+    """
+    Every username combined with every password.
+
+    By default each password is tried for all users before the next
+    password (spraying), which spreads attempts per account out over time.
+    """
+
+    def __init__(self, users_path, passwords_path, password_major=True):
+        """
+        Args:
+            users_path (str): One username per line
+            passwords_path (str): One password per line
+            password_major (bool): Iterate passwords in the outer loop
+        """
+        self.users_path = users_path
+        self.passwords_path = passwords_path
+        self.password_major = password_major
+
+    def pairs(self, skip=None):
+        """Yield (username, secret); see ComboSource.pairs()."""
+        if self.password_major:
+            outer_path, inner_path = self.passwords_path, self.users_path
+        else:
+            outer_path, inner_path = self.users_path, self.passwords_path
+
+        for outer in iter_lines(outer_path):
+            for inner in iter_lines(inner_path):
+                if self.password_major:
+                    username, secret = inner, outer
+                else:
+                    username, secret = outer, inner
+                if skip is not None and skip(username, secret):
+                    continue
+                yield username, secret
+
+    def __iter__(self):
+        return self.pairs()
+
+
+class TriedSet:
+    """
+    On-disk set of attempted tuples, 8 bytes per entry.
+
+    Each tuple (e.g. module, target, username, secret) is stored as a 64-bit
+    BLAKE2b digest. `path` holds sorted digests and is loaded straight into
+    an array; digests added since the last compaction are appended to
+    `path`.new and merged in on close(). A collision makes a never-tried
+    tuple look tried with negligible probability (about n / 2**64).
+    """
+
+    MERGE_THRESHOLD = 100000
+
+    def __init__(self, path):
+        self.path = path
+        self.pending_path = path + '.new'
+        self._sorted = array('Q')
+        if self._sorted.itemsize != 8:
+            raise RuntimeError("array('Q') is not 64-bit on this platform")
+        self._sorted.frombytes(self._read_records(path))
+        self._recent = set(array('Q', self._read_records(self.pending_path)))
+        self._dirty = bool(self._recent)  # `path` is missing digests
+        self._file = open(self.pending_path, 'ab')
+
+    @staticmethod
+    def _read_records(path):
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return b''
+        # Ignore a torn final record from an interrupted write
+        return data[:len(data) - len(data) % 8]
+
+    @staticmethod
+    def digest(*parts):
+        """Return the 64-bit key of a tuple of strings (None allowed)."""
+        text = '\0'.join('' if part is None else str(part) for part in parts)
+        raw = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+        return int.from_bytes(raw, 'little')
+
+    def _has(self, key):
+        if key in self._recent:
+            return True
+        i = bisect.bisect_left(self._sorted, key)
+        return i < len(self._sorted) and self._sorted[i] == key
+
+    def __contains__(self, parts):
+        return self._has(self.digest(*parts))
+
+    def __len__(self):
+        return len(self._sorted) + len(self._recent)
+
+    def add(self, *parts):
+        """Record a tuple as tried."""
+        key = self.digest(*parts)
+        if self._has(key):
+            return
+        self._file.write(key.to_bytes(8, 'little'))
+        self._recent.add(key)
+        self._dirty = True
+        if len(self._recent) >= self.MERGE_THRESHOLD:
+            self._merge()
+
+    def _merge(self):
+        """Fold recent digests into the sorted array."""
+        self._sorted = array('Q', heapq.merge(self._sorted, sorted(self._recent)))
+        self._recent.clear()
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        """Write the merged, sorted set to `path` and drop the pending file."""
+        self._file.close()
+        if self._dirty:
+            self._merge()
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                self._sorted.tofile(f)
+            os.replace(tmp_path, self.path)
+        try:
+            os.remove(self.pending_path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,212 @@
+# AuthCheck default-credential table
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Most modules list vendor default credentials in their free-text 'hints'
+# field ("TLS: 443, Non-TLS: 80. admin / admin"). This module parses them
+# into a {module: [(username, password), ...]} table and caches the
+# compiled table next to the module manifest. The cache is rebuilt when
+# any module's hints change.
+#
+# Usage (build step):
+#   python default_creds.py [--modules-dir DIR] [--show]
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+
+DEFAULT_CREDS_FILENAME = '.authcheck_default_creds.json'
+DEFAULT_CREDS_VERSION = 1
+
+# "user / pass", "user/pass" or "user / (blank)"
+_PAIR = re.compile(r'(?<![\w/.:=\\-])([\w.@-]{1,64})\s?/\s?(\([^)]*\)|[^\s,;()/]{1,64}(?![^\s,;()]))')
+
+# Sentences that may use a tight "user/pass" form; " / " is accepted anywhere
+_DEFAULT_WORDS = re.compile(r'\b(default|common|factory)\b', re.I)
+
+# Placeholders that mean an empty password
+_EMPTY_PASSWORDS = ('blank', 'empty', 'none', 'no password')
+
+# Words that show a '/' is joining protocols or options, not credentials
+_NOT_CREDENTIALS = {
+    'tls', 'non-tls', 'ssl', 'http', 'https', 'tcp', 'udp', 'ldap', 'kerberos', 'saml',
+    'oauth', 'oauth2', 'sso', 'api', 'rest', 'soap', 'sasl_ssl', 'plaintext', 'ws', 'wss',
+    'read', 'write', 'on', 'off', 'yes', 'no', 'and', 'or', 'v1', 'v2', 'v3',
+}
+
+
+def _password_value(raw):
+    """Return the password for a parsed token, or None if it is a placeholder."""
+    if raw.startswith('('):
+        text = raw[1:-1].strip().lower()
+        if any(text.startswith(word) for word in _EMPTY_PASSWORDS):
+            return ''
+        # (set during install), (generated), (serial number)...
+        return None
+    return raw.rstrip('.')
+
+
+def parse_hint(hint):
+    """
+    Extract (username, password) pairs from a hints text.
+
+    Args:
+        hint (str): Free-text hint
+
+    Returns:
+        list: Unique pairs in the order they appear
+    """
+    pairs = []
+    for sentence in re.split(r'(?<=[.;])\s+|\n', hint or ''):
+        sentence_has_default = bool(_DEFAULT_WORDS.search(sentence))
+        for clause in re.split(r',\s*|\s+or\s+', sentence):
+            for match in _PAIR.finditer(clause):
+                # A pair starts its clause or follows a label ("Common: admin / admin")
+                prefix = clause[:match.start()].strip()
+                if prefix and not prefix.endswith(':'):
+                    continue
+                username, raw_password = match.group(1), match.group(2)
+                spaced = ' /' in match.group(0) or '/ ' in match.group(0)
+                if not spaced and not sentence_has_default:
+                    continue
+                if username.lower() in _NOT_CREDENTIALS or raw_password.lower() in _NOT_CREDENTIALS:
+                    continue
+                if username.isdigit() or 'username' in username.lower():
+                    continue  # Port pair such as 61616/61617, or a placeholder
+                password = _password_value(raw_password)
+                if password is None:
+                    continue
+                pair = (username, password)
+                if pair not in pairs:
+                    pairs.append(pair)
+    return pairs
+
+
+def _hints_of(entry):
+    """Return the text of a manifest entry's readonly hint fields."""
+    return '\n'.join(str(field.get('default', '')) for field in entry.get('form_fields', [])
+                     if field.get('type') == 'readonly')
+
+
+def _fingerprint(entries):
+    """Hash every module's hints so a stale compiled table is detected."""
+    digest = hashlib.sha256()
+    for module_name in sorted(entries):
+        digest.update(module_name.encode('utf-8') + b'\0')
+        digest.update(_hints_of(entries[module_name]).encode('utf-8') + b'\0')
+    return digest.hexdigest()
+
+
+def compile_table(entries):
+    """
+    Build the default-credential table from manifest entries.
+
+    Args:
+        entries (dict): {module_name: manifest entry}
+
+    Returns:
+        dict: {module_name: [[username, password], ...]} for modules with pairs
+    """
+    table = {}
+    for module_name, entry in entries.items():
+        pairs = parse_hint(_hints_of(entry))
+        if pairs:
+            table[module_name] = [list(pair) for pair in pairs]
+    return table
+
+
+class DefaultCredentials:
+    """
+    Compiled default credentials for a ModuleManifest, loaded on first use.
+    """
+
+    def __init__(self, manifest, path=None):
+        """
+        Args:
+            manifest (ModuleManifest): Refreshed manifest
+            path (str): Compiled table location (defaults to a hidden file
+                next to the manifest)
+        """
+        self.manifest = manifest
+        self.path = path or os.path.join(manifest.modules_dir, DEFAULT_CREDS_FILENAME)
+        self._table = None
+
+    def _load(self):
+        entries = dict(self.manifest.available())
+        fingerprint = _fingerprint(entries)
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data.get('version') == DEFAULT_CREDS_VERSION
+                    and data.get('fingerprint') == fingerprint):
+                return data['modules']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        table = compile_table(entries)
+        self._write(fingerprint, table)
+        return table
+
+    def _write(self, fingerprint, table):
+        """Persist the compiled table atomically. Failures are not fatal."""
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': DEFAULT_CREDS_VERSION, 'fingerprint': fingerprint,
+                           'modules': table}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @property
+    def table(self):
+        """{module_name: [[username, password], ...]}, compiled or loaded on first access."""
+        if self._table is None:
+            self._table = self._load()
+        return self._table
+
+    def get(self, module_name):
+        """
+        Return a module's default credentials.
+
+        Returns:
+            list: [(username, password), ...] (empty if none are known)
+        """
+        return [tuple(pair) for pair in self.table.get(module_name, [])]
+
+
+def main(argv=None):
+    """Compile the default-credential table and report what was found."""
+    from module_manifest import ModuleManifest
+
+    parser = argparse.ArgumentParser(description="Compile default credentials from module hints.")
+    parser.add_argument('--modules-dir', default=os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'AuthCheck_modules'))
+    parser.add_argument('--show', action='store_true', help="Print every module's pairs")
+    args = parser.parse_args(argv)
+
+    manifest = ModuleManifest(args.modules_dir)
+    manifest.refresh()
+    defaults = DefaultCredentials(manifest)
+    table = defaults.table
+    if args.show:
+        for module_name in sorted(table):
+            pairs = ', '.join(f"{u} / {p if p else '(blank)'}" for u, p in table[module_name])
+            print(f"{module_name}: {pairs}")
+    total = sum(len(pairs) for pairs in table.values())
+    print(f"{total} default credential(s) for {len(table)} module(s) -> {defaults.path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,367 @@
+# AuthCheck shared HTTP connection pool
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Most modules make one-shot requests.get()/post() calls, which open a new
+# TCP (and TLS) connection for every attempt. A SessionPool keeps
+# keep-alive connections per (scheme, host, port, verify, cert) endpoint and
+# shares them between attempts, while every attempt still gets its own
+# requests.Session - and so its own cookie jar.
+#
+# Modules do not need to change: once install() has been called, one-shot
+# requests calls and requests.Session() objects created on a thread inside
+# SessionPool.activate() are routed through the pool. Pooled requests also
+# stop at the check deadline set with auth_utils.check_deadline(), and the
+# first successful (2xx/3xx) response to a request carrying credentials
+# marks the check as authenticated for tracing (later requests count as
+# post-auth work).
+
+import contextlib
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+
+DEFAULT_MAX_ENDPOINTS = 256
+DEFAULT_IDLE_TIMEOUT = 60.0
+DEFAULT_CONNECTIONS_PER_ENDPOINT = 10
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+_original_request = None
+
+
+def endpoint_key(url, verify=True, cert=None):
+    """
+    Return the pool key for a URL.
+
+    Args:
+        url (str): Request URL
+        verify (bool or str): requests 'verify' argument
+        cert (str or tuple): requests 'cert' argument (client certificate)
+
+    Returns:
+        tuple: (scheme, host, port, verify, cert)
+    """
+    parts = urlsplit(url)
+    scheme = (parts.scheme or 'http').lower()
+    host = (parts.hostname or '').lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port is None:
+        port = _DEFAULT_PORTS.get(scheme)
+    if isinstance(cert, list):
+        cert = tuple(cert)
+    return scheme, host, port, verify, cert
+
+
+def active_pool():
+    """Return the SessionPool active on this thread, or None."""
+    return getattr(_local, 'pool', None)
+
+
+def _make_endpoint_adapter_class():
+    """Build the per-endpoint adapter class once requests is importable."""
+    from requests.adapters import HTTPAdapter
+
+    class EndpointAdapter(HTTPAdapter):
+        """
+        HTTPAdapter for one endpoint whose TLS connections resume sessions.
+
+        requests >= 2.32 lets adapters choose the SSL context per request;
+        older versions keep their default context (keep-alive still works).
+        """
+
+        def __init__(self, ssl_context=None, **kwargs):
+            self.resuming_ssl_context = ssl_context
+            super().__init__(**kwargs)
+
+        def build_connection_pool_key_attributes(self, request, verify, cert=None):
+            host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+            if self.resuming_ssl_context is not None and host_params.get('scheme') == 'https':
+                pool_kwargs['ssl_context'] = self.resuming_ssl_context
+            return host_params, pool_kwargs
+
+    return EndpointAdapter
+
+
+def _resuming_ssl_context(verify):
+    """Create an SSL context matching requests' verify setting, with resumption."""
+    import ssl
+    from urllib3.util.ssl_ import create_urllib3_context
+    from auth_utils import enable_tls_resumption
+
+    if verify is False:
+        context = create_urllib3_context(cert_reqs=ssl.CERT_NONE)
+        context.check_hostname = False
+    else:
+        context = create_urllib3_context(cert_reqs=ssl.CERT_REQUIRED)
+        if verify is True:
+            from requests.certs import where
+            context.load_verify_locations(where())
+        # A CA bundle path in verify is loaded by urllib3 itself
+    return enable_tls_resumption(context)
+
+
+def _deadline_timeout(timeout):
+    """Cap a requests timeout (None, seconds or (connect, read)) to the check deadline."""
+    from auth_utils import deadline_remaining, deadline_timeout
+
+    if deadline_remaining() is None:
+        return timeout
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return deadline_timeout(connect), deadline_timeout(read)
+    return deadline_timeout(timeout)
+
+
+def _carries_credentials(request):
+    """Guess whether a request is the login step of a check."""
+    if 'Authorization' in request.headers:
+        return True
+    if request.method in ('POST', 'PUT', 'PATCH') and request.body:
+        return True
+    query = urlsplit(request.url).query.lower()
+    return 'pass' in query or 'token' in query
+
+
+def _make_dispatch_adapter_class():
+    """Build the dispatching adapter class once requests is importable."""
+    from requests.adapters import HTTPAdapter
+
+    class PooledAdapter(HTTPAdapter):
+        """Send each request through the pool's adapter for its endpoint."""
+
+        def __init__(self, pool):
+            super().__init__()
+            self.pool = pool
+
+        def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+            key = endpoint_key(request.url, verify, cert)
+            timeout = _deadline_timeout(timeout)
+            adapter = self.pool._checkout(key)
+            try:
+                response = adapter.send(request, stream=stream, timeout=timeout,
+                                        verify=verify, cert=cert, proxies=proxies)
+            finally:
+                self.pool._checkin(key)
+            # A rejected login (401/403) keeps the rest of the check in auth
+            if response.status_code < 400 and _carries_credentials(request):
+                import tracing
+                tracing.mark_authenticated()
+            return response
+
+        def close(self):
+            # Endpoint adapters belong to the pool, not to this session
+            pass
+
+    return PooledAdapter
+
+
+class SessionPool:
+    """
+    Keep-alive HTTP connections shared between authentication attempts.
+
+    Connections are pooled per (scheme, host, port, verify, cert) endpoint. Idle
+    endpoints are closed after idle_timeout seconds, and the least recently
+    used endpoint is closed when more than max_endpoints are open.
+    """
+
+    def __init__(self, max_endpoints=DEFAULT_MAX_ENDPOINTS, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 connections_per_endpoint=DEFAULT_CONNECTIONS_PER_ENDPOINT):
+        """
+        Args:
+            max_endpoints (int): Maximum endpoints kept open (LRU eviction)
+            idle_timeout (float): Seconds an unused endpoint is kept open
+            connections_per_endpoint (int): Keep-alive connections per endpoint
+        """
+        self.max_endpoints = max_endpoints
+        self.idle_timeout = idle_timeout
+        self.connections_per_endpoint = connections_per_endpoint
+        self._endpoints = OrderedDict()  # {key: [adapter, last_used, in_use]}
+        self._lock = threading.Lock()
+        self._dispatch_class = None
+        self._endpoint_class = None
+        # {(verify, cert): ssl.SSLContext} shared by HTTPS endpoints. urllib3
+        # loads the client certificate into the context it is given, so
+        # endpoints with different certificates must never share one.
+        self._ssl_contexts = {}
+
+    def _new_adapter(self, key):
+        """Create the adapter for an endpoint. Caller holds the lock."""
+        if self._endpoint_class is None:
+            self._endpoint_class = _make_endpoint_adapter_class()
+        scheme, _, _, verify, cert = key
+        ssl_context = None
+        if scheme == 'https':
+            ssl_context = self._ssl_contexts.get((verify, cert))
+            if ssl_context is None:
+                ssl_context = _resuming_ssl_context(verify)
+                self._ssl_contexts[(verify, cert)] = ssl_context
+        return self._endpoint_class(ssl_context=ssl_context, pool_connections=1,
+                                    pool_maxsize=self.connections_per_endpoint)
+
+    def _checkout(self, key):
+        """Return the adapter for an endpoint, creating it if needed."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._endpoints.get(key)
+            if entry is None:
+                entry = [self._new_adapter(key), now, 0]
+                self._endpoints[key] = entry
+            else:
+                self._endpoints.move_to_end(key)
+            entry[1] = now
+            entry[2] += 1
+            stale = self._collect_stale(now)
+        for adapter in stale:
+            adapter.close()
+        return entry[0]
+
+    def _checkin(self, key):
+        with self._lock:
+            entry = self._endpoints.get(key)
+            if entry is not None:
+                entry[1] = time.monotonic()
+                entry[2] -= 1
+
+    def _collect_stale(self, now):
+        """Remove idle and over-limit endpoints. Caller holds the lock."""
+        stale = []
+        excess = len(self._endpoints) - self.max_endpoints
+        for key in list(self._endpoints):
+            adapter, last_used, in_use = self._endpoints[key]
+            if in_use:
+                continue
+            if excess > 0 or now - last_used > self.idle_timeout:
+                del self._endpoints[key]
+                stale.append(adapter)
+                excess -= 1
+            else:
+                # Entries are in LRU order - the rest are newer
+                break
+        return stale
+
+    def session(self):
+        """
+        Create a requests.Session that uses the pooled connections.
+
+        Each session has its own cookie jar, so cookies never leak between
+        attempts even though connections are shared.
+        """
+        import requests.sessions
+
+        session = requests.sessions.Session()
+        self.mount(session)
+        return session
+
+    def mount(self, session):
+        """Route an existing requests.Session through the pooled connections."""
+        if self._dispatch_class is None:
+            self._dispatch_class = _make_dispatch_adapter_class()
+        adapter = self._dispatch_class(self)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+    @contextlib.contextmanager
+    def activate(self):
+        """
+        Route requests made on this thread through the pool.
+
+        Use around a module's authenticate() call. install() must have been
+        called for one-shot requests calls to be redirected.
+        """
+        previous = getattr(_local, 'pool', None)
+        _local.pool = self
+        try:
+            yield self
+        finally:
+            _local.pool = previous
+
+    def endpoint_count(self):
+        """Return the number of endpoints currently open."""
+        with self._lock:
+            return len(self._endpoints)
+
+    def close(self):
+        """Close every pooled connection."""
+        with self._lock:
+            adapters = [entry[0] for entry in self._endpoints.values()]
+            self._endpoints.clear()
+        for adapter in adapters:
+            adapter.close()
+
+
+def pooled_session():
+    """
+    Return a requests.Session for a module to use.
+
+    Inside SessionPool.activate() the session shares the pool's keep-alive
+    connections; otherwise a plain requests.Session is returned.
+    """
+    import requests.sessions
+
+    pool = active_pool()
+    if pool is None:
+        return requests.sessions.Session()
+    return pool.session()
+
+
+def _pooled_request(method, url, **kwargs):
+    """Replacement for requests.request() that honours the active pool."""
+    pool = active_pool()
+    if pool is None:
+        return _original_request(method, url, **kwargs)
+    with pool.session() as session:
+        return session.request(method=method, url=url, **kwargs)
+
+
+def install():
+    """
+    Redirect requests' one-shot API and Session() to the active pool.
+
+    Threads without an active pool are unaffected. Safe to call repeatedly.
+
+    Returns:
+        bool: False if requests is not installed
+    """
+    global _installed, _original_request
+    try:
+        import requests
+        import requests.api
+    except ImportError:
+        return False
+
+    with _install_lock:
+        if _installed:
+            return True
+
+        _original_request = requests.api.request
+        base_session = requests.sessions.Session
+
+        class Session(base_session):
+            """requests.Session that joins the active pool when created inside one."""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pool = active_pool()
+                if pool is not None:
+                    pool.mount(self)
+
+        # requests.get()/post()/... look up request() in requests.api
+        requests.api.request = _pooled_request
+        requests.request = _pooled_request
+        requests.Session = Session
+        requests.session = Session
+        _installed = True
+    return True
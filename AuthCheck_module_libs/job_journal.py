@@ -0,0 +1,191 @@
+# AuthCheck resumable job journal
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Records which jobs of a batch run have finished, so an interrupted sweep
+# can resume without repeating them. Jobs are numbered in plan order; the
+# plan is identified by a fingerprint of its inputs, and completion is one
+# bit per job in a memory-mapped bitmap, so a hundred million jobs take
+# about 12 MB. The bitmap is synced to disk in batches. Completions are only
+# written to the bitmap at a sync, after the before_sync callback has made
+# their results durable, so a crash can repeat a job but never lose one.
+
+import hashlib
+import json
+import mmap
+import os
+import time
+
+
+JOURNAL_MAGIC = b'AUTHCHECK-JOURNAL\n'
+JOURNAL_VERSION = 1
+HEADER_SIZE = 4096           # Magic + JSON header, padded; the bitmap follows
+GROW_BYTES = 1024 * 1024     # Bitmap grows in steps of this many bytes (8M jobs)
+DEFAULT_SYNC_EVERY = 1000    # Completions between syncs
+DEFAULT_SYNC_INTERVAL = 2.0  # Seconds between syncs
+COUNT_CHUNK_BYTES = 64 * 1024  # Bitmap bytes counted at a time by completed_count()
+
+
+def plan_fingerprint(*parts):
+    """
+    Return a fingerprint of everything that determines a plan's job order.
+
+    Args:
+        *parts: JSON-serialisable values (module names, targets, credential
+            source identities, field overrides, ...)
+
+    Returns:
+        str: Hex digest
+    """
+    text = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def file_identity(path):
+    """Identify an input file by path, size and modification time without reading it."""
+    if not path or path == '-':
+        return path
+    st = os.stat(path)
+    return [os.path.abspath(path), st.st_size, st.st_mtime_ns]
+
+
+class JournalMismatch(ValueError):
+    """The journal file was written for a different plan."""
+
+
+class JobJournal:
+    """
+    Completion bitmap of a numbered job plan.
+
+    Not thread-safe; the batch runner records completions from its
+    dispatch thread.
+    """
+
+    def __init__(self, path, fingerprint, sync_every=DEFAULT_SYNC_EVERY,
+                 sync_interval=DEFAULT_SYNC_INTERVAL):
+        """
+        Open or create a journal.
+
+        Args:
+            path (str): Journal file
+            fingerprint (str): plan_fingerprint() of the run's inputs
+            sync_every (int): Completions between syncs to disk
+            sync_interval (float): Seconds after which a completion syncs anyway
+
+        The before_sync attribute may be set to a callable that makes the
+        results of completed jobs durable (flush output files, commit the
+        result store); it runs before each sync writes their bits.
+
+        Raises:
+            JournalMismatch: If the file belongs to a different plan
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.before_sync = None
+        self._pending = []  # Completed job numbers not yet in the bitmap
+        self._last_sync = time.monotonic()
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'r+b' if exists else 'w+b')
+        try:
+            if exists:
+                self._check_header()
+            else:
+                self._write_header()
+            size = os.fstat(self._file.fileno()).st_size
+            if size < HEADER_SIZE + GROW_BYTES:
+                self._file.truncate(HEADER_SIZE + GROW_BYTES)
+            self._map()
+        except BaseException:
+            self._file.close()
+            raise
+        self.resumed = self.completed_count() if exists else 0
+
+    def _write_header(self):
+        header = json.dumps({'version': JOURNAL_VERSION, 'fingerprint': self.fingerprint,
+                             'created': time.time()}).encode('utf-8')
+        data = JOURNAL_MAGIC + header + b'\n'
+        self._file.write(data.ljust(HEADER_SIZE, b'\0'))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _check_header(self):
+        data = self._file.read(HEADER_SIZE)
+        if not data.startswith(JOURNAL_MAGIC):
+            raise JournalMismatch(f"{self.path} is not a job journal")
+        try:
+            header = json.loads(data[len(JOURNAL_MAGIC):].split(b'\n', 1)[0])
+        except ValueError:
+            raise JournalMismatch(f"{self.path} has a damaged header")
+        if header.get('version') != JOURNAL_VERSION:
+            raise JournalMismatch(f"{self.path} has unsupported version {header.get('version')}")
+        if header.get('fingerprint') != self.fingerprint:
+            raise JournalMismatch(
+                f"{self.path} was written for a different set of modules, targets or "
+                f"credentials; use a new journal file to start over")
+
+    def _map(self):
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._capacity = (len(self._mm) - HEADER_SIZE) * 8
+
+    def _grow(self, seq):
+        """Extend the bitmap so it holds job number seq."""
+        self._mm.flush()
+        self._mm.close()
+        needed = HEADER_SIZE + seq // 8 + 1
+        size = HEADER_SIZE + -(-(needed - HEADER_SIZE) // GROW_BYTES) * GROW_BYTES
+        self._file.truncate(size)
+        self._map()
+
+    def is_done(self, seq):
+        """Return True if job number seq finished in this or an earlier run."""
+        if seq >= self._capacity:
+            return False
+        return bool(self._mm[HEADER_SIZE + (seq >> 3)] & (1 << (seq & 7)))
+
+    def complete(self, seq):
+        """
+        Mark job number seq as finished; written to disk in batches.
+
+        Call this only after the job's result has been written.
+        """
+        self._pending.append(seq)
+        if (len(self._pending) >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+
+    def sync(self):
+        """Make pending results durable (before_sync), then write their bits to disk."""
+        if self._pending:
+            if self.before_sync is not None:
+                self.before_sync()
+            pending, self._pending = self._pending, []
+            if max(pending) >= self._capacity:
+                self._grow(max(pending))
+            for seq in pending:
+                offset = HEADER_SIZE + (seq >> 3)
+                self._mm[offset] = self._mm[offset] | (1 << (seq & 7))
+            self._mm.flush()
+        self._last_sync = time.monotonic()
+
+    def completed_count(self):
+        """Return the number of finished jobs recorded."""
+        count = 0
+        # A chunk at a time, so a large bitmap is never copied whole
+        for start in range(HEADER_SIZE, len(self._mm), COUNT_CHUNK_BYTES):
+            bits = int.from_bytes(self._mm[start:start + COUNT_CHUNK_BYTES], 'little')
+            # int.bit_count() is Python 3.10+
+            count += bits.bit_count() if hasattr(bits, 'bit_count') else bin(bits).count('1')
+        return count
+
+    def close(self):
+        """Sync and close the journal. Close it before the outputs before_sync flushes."""
+        self.sync()
+        self._mm.close()
+        self._file.close()
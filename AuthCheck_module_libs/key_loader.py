@@ -0,0 +1,167 @@
+# AuthCheck SSH private key loader
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Loads private keys for paramiko-based modules (SSH, SFTP). The key type
+# is read from the file itself - the PEM header, or the public key inside
+# an OpenSSH key - so the file is read and parsed once instead of being
+# tried as RSA, Ed25519, ECDSA and DSA in turn. Decrypted keys are cached
+# by path, mtime, size and a hash of the passphrase, so a sweep that uses
+# one key against many hosts runs the passphrase KDF only once.
+
+import base64
+import binascii
+import hashlib
+import io
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+
+# Maximum number of decrypted keys kept by load_private_key()
+KEY_CACHE_SIZE = 32
+
+# PEM header -> key type
+_PEM_TYPES = {
+    'RSA PRIVATE KEY': 'rsa',
+    'EC PRIVATE KEY': 'ecdsa',
+    'DSA PRIVATE KEY': 'dss',
+}
+
+# Key type -> paramiko class name (DSSKey is gone from paramiko 4+)
+_KEY_CLASSES = {
+    'rsa': 'RSAKey',
+    'ed25519': 'Ed25519Key',
+    'ecdsa': 'ECDSAKey',
+    'dss': 'DSSKey',
+}
+
+_OPENSSH_MAGIC = b'openssh-key-v1\x00'
+
+_key_cache = OrderedDict()  # {(path, mtime_ns, size, passphrase hash): PKey}
+_key_lock = threading.Lock()
+
+
+def _openssh_key_type(body):
+    """Return the key type stored in an OpenSSH private key body, or None."""
+    try:
+        blob = base64.b64decode(''.join(body.split()))
+    except (binascii.Error, ValueError):
+        return None
+    if not blob.startswith(_OPENSSH_MAGIC):
+        return None
+    offset = len(_OPENSSH_MAGIC)
+    try:
+        # ciphername, kdfname, kdfoptions, then the key count and the first
+        # public key, which is never encrypted
+        for _ in range(3):
+            length, = struct.unpack_from('>I', blob, offset)
+            offset += 4 + length
+        offset += 4
+        offset += 4  # Length of the public key blob
+        length, = struct.unpack_from('>I', blob, offset)
+        name = blob[offset + 4:offset + 4 + length].decode('ascii')
+    except (struct.error, UnicodeDecodeError):
+        return None
+    if name == 'ssh-ed25519':
+        return 'ed25519'
+    if name == 'ssh-rsa':
+        return 'rsa'
+    if name.startswith('ecdsa-sha2-'):
+        return 'ecdsa'
+    if name == 'ssh-dss':
+        return 'dss'
+    return None
+
+
+def detect_key_type(text):
+    """
+    Detect the type of a PEM or OpenSSH private key.
+
+    Args:
+        text (str): Contents of the key file
+
+    Returns:
+        str: 'rsa', 'ecdsa', 'ed25519', 'dss', or None for anything else
+            (e.g. PKCS#8 "BEGIN PRIVATE KEY", which paramiko cannot load)
+    """
+    begin = text.find('-----BEGIN ')
+    if begin < 0:
+        return None
+    header_end = text.find('-----', begin + 11)
+    if header_end < 0:
+        return None
+    label = text[begin + 11:header_end]
+    if label == 'OPENSSH PRIVATE KEY':
+        end = text.find('-----END ', header_end)
+        return _openssh_key_type(text[header_end + 5:end if end >= 0 else None])
+    return _PEM_TYPES.get(label)
+
+
+def _parse_key(paramiko, text, passphrase):
+    """Parse key text with the paramiko class matching its type."""
+    key_type = detect_key_type(text)
+    if key_type is None:
+        raise paramiko.SSHException("Unsupported private key format (expected an OpenSSH or PEM RSA/EC/DSA key)")
+    key_class = getattr(paramiko, _KEY_CLASSES[key_type], None)
+    if key_class is None:
+        raise paramiko.SSHException(f"{key_type.upper()} keys are not supported by this paramiko version")
+    return key_class.from_private_key(io.StringIO(text), password=passphrase)
+
+
+def load_private_key(path, passphrase=None):
+    """
+    Load an SSH private key of any supported type.
+
+    Keys are cached until the file changes, so repeated attempts with the
+    same key and passphrase do not re-read or re-decrypt it. The returned
+    key is shared - do not modify it.
+
+    Args:
+        path (str): Path to the private key file
+        passphrase (str): Passphrase for an encrypted key
+
+    Returns:
+        paramiko.PKey: The decrypted key
+
+    Raises:
+        paramiko.PasswordRequiredException: If the key is encrypted and no
+            passphrase was given
+        paramiko.SSHException: If the file is not a supported key or the
+            passphrase is wrong
+        OSError: If the file cannot be read
+    """
+    import paramiko
+
+    passphrase = passphrase or None
+    stat = os.stat(path)
+    digest = hashlib.sha256(passphrase.encode('utf-8')).digest() if passphrase is not None else None
+    cache_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, digest)
+
+    with _key_lock:
+        pkey = _key_cache.get(cache_key)
+        if pkey is not None:
+            _key_cache.move_to_end(cache_key)
+            return pkey
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    pkey = _parse_key(paramiko, text, passphrase)
+
+    with _key_lock:
+        _key_cache[cache_key] = pkey
+        while len(_key_cache) > KEY_CACHE_SIZE:
+            _key_cache.popitem(last=False)
+
+    return pkey
+
+
+def clear_key_cache():
+    """Drop all cached private keys."""
+    with _key_lock:
+        _key_cache.clear()
@@ -0,0 +1,174 @@
+# AuthCheck module search index
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prebuilt lowercase n-gram index over each module's display name, module
+# name and category, plus category and protocol facets, so a filter
+# keystroke only touches the rows that match.
+
+import re
+import sys
+
+
+# Index every substring up to this length; longer queries intersect trigrams
+NGRAM = 3
+
+_CATEGORY = re.compile(r'\(([^()]+)\)\s*$')
+
+# Protocol facet values by imported package (see module_metadata.extract_imports)
+PROTOCOL_LIBRARIES = {
+    'requests': 'HTTP', 'requests_oauthlib': 'HTTP', 'requests_ntlm': 'HTTP',
+    'urllib': 'HTTP', 'urllib3': 'HTTP', 'http': 'HTTP', 'xmlrpc': 'HTTP',
+    'paramiko': 'SSH',
+    'ldap3': 'LDAP',
+    'ftplib': 'FTP',
+    'telnetlib': 'Telnet', 'py3270': 'Telnet',
+    'pysnmp': 'SNMP',
+    'smb': 'SMB',
+    'paho': 'MQTT',
+    'pika': 'AMQP',
+    'kafka': 'Kafka', 'confluent_kafka': 'Kafka',
+    'stomp': 'STOMP',
+    'socket': 'TCP socket', 'ssl': 'TCP socket', 'asyncio': 'TCP socket',
+    'boto3': 'Cloud SDK', 'botocore': 'Cloud SDK', 'google': 'Cloud SDK',
+    'azure': 'Cloud SDK', 'firebase_admin': 'Cloud SDK',
+    'psycopg': 'Database driver', 'psycopg2': 'Database driver', 'mysql': 'Database driver',
+    'pymysql': 'Database driver', 'mariadb': 'Database driver', 'pymssql': 'Database driver',
+    'pyodbc': 'Database driver', 'pymongo': 'Database driver', 'cassandra': 'Database driver',
+    'oracledb': 'Database driver', 'cx_Oracle': 'Database driver', 'ibm_db': 'Database driver',
+    'redis': 'Database driver', 'couchbase': 'Database driver', 'neo4j': 'Database driver',
+    'teradatasql': 'Database driver', 'vertica_python': 'Database driver',
+    'snowflake': 'Database driver', 'redshift_connector': 'Database driver',
+    'hdbcli': 'Database driver', 'pyexasol': 'Database driver', 'pyhive': 'Database driver',
+    'impala': 'Database driver', 'phoenixdb': 'Database driver', 'pynuodb': 'Database driver',
+    'sybpydb': 'Database driver', 'rethinkdb': 'Database driver', 'faunadb': 'Database driver',
+}
+
+# Any other third-party import
+PROTOCOL_VENDOR_SDK = 'Vendor SDK'
+
+_IGNORED_IMPORTS = set(getattr(sys, 'stdlib_module_names', ())) | {'auth_utils', 'http_pool', '__future__'}
+
+
+def module_category(description):
+    """Return the '(Category)' suffix of a module description, or ''."""
+    match = _CATEGORY.search(description or '')
+    return match.group(1).strip() if match else ''
+
+
+def module_protocols(imports):
+    """
+    Map a module's imported packages to protocol facet values.
+
+    Args:
+        imports (list): Top-level package names
+
+    Returns:
+        tuple: Sorted protocol names
+    """
+    protocols = set()
+    for name in imports or ():
+        protocol = PROTOCOL_LIBRARIES.get(name)
+        if protocol is None and name not in _IGNORED_IMPORTS:
+            protocol = PROTOCOL_VENDOR_SDK
+        if protocol is not None:
+            protocols.add(protocol)
+    return tuple(sorted(protocols))
+
+
+def _ngrams(text):
+    """Return every substring of text up to NGRAM characters long."""
+    grams = set()
+    for size in range(1, NGRAM + 1):
+        for start in range(len(text) - size + 1):
+            grams.add(text[start:start + size])
+    return grams
+
+
+class ModuleIndex:
+    """
+    Substring search with category and protocol facets over module rows.
+
+    Rows are numbered in the order given; search results come back in that
+    order.
+    """
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows (list): [(module_name, display_name, imports), ...]
+        """
+        self.categories = {}  # {category: set(row ids)}
+        self.protocols = {}   # {protocol: set(row ids)}
+        self._texts = []
+        self._grams = {}      # {ngram: set(row ids)}
+        for row, (module_name, display_name, imports) in enumerate(rows):
+            category = module_category(display_name)
+            text = '\0'.join((display_name.lower(), module_name.lower(), category.lower()))
+            self._texts.append(text)
+            for gram in _ngrams(text):
+                if '\0' not in gram:
+                    self._grams.setdefault(gram, set()).add(row)
+            if category:
+                self.categories.setdefault(category, set()).add(row)
+            for protocol in module_protocols(imports):
+                self.protocols.setdefault(protocol, set()).add(row)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def _text_matches(self, text):
+        """Return the set of rows containing text, or None for all rows."""
+        text = text.strip().lower()
+        if not text:
+            return None
+        if len(text) <= NGRAM:
+            return self._grams.get(text, set())
+
+        # Candidates contain every trigram of the query; confirm the substring
+        postings = []
+        for start in range(len(text) - NGRAM + 1):
+            rows = self._grams.get(text[start:start + NGRAM])
+            if not rows:
+                return set()
+            postings.append(rows)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for rows in postings[1:]:
+            candidates &= rows
+            if not candidates:
+                break
+        return {row for row in candidates if text in self._texts[row]}
+
+    def search(self, text='', category=None, protocol=None):
+        """
+        Return matching row ids in row order.
+
+        Args:
+            text (str): Case-insensitive substring of the display name,
+                module name or category
+            category (str): Only rows in this category
+            protocol (str): Only rows using this protocol
+
+        Returns:
+            list: Row ids, or None when no filter is active (every row)
+        """
+        sets = []
+        matches = self._text_matches(text)
+        if matches is not None:
+            sets.append(matches)
+        if category:
+            sets.append(self.categories.get(category, set()))
+        if protocol:
+            sets.append(self.protocols.get(protocol, set()))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        result = set(sets[0])
+        for rows in sets[1:]:
+            result &= rows
+        return sorted(result)
@@ -0,0 +1,220 @@
+# AuthCheck module metadata manifest
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+
+from module_metadata import extract_imports, extract_metadata
+
+
+MANIFEST_FILENAME = '.authcheck_manifest.json'
+MANIFEST_VERSION = 5
+
+
+def _file_digest(file_path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def import_module_file(module_name, file_path):
+    """
+    Import an AuthCheck module from its file path.
+
+    Args:
+        module_name (str): Module name (file name without .py)
+        file_path (str): Path to the module file
+
+    Returns:
+        module: The executed module object
+
+    Raises:
+        ImportError: If no import spec can be created for the file
+        Exception: Anything raised while executing the module
+    """
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    if spec is None:
+        raise ImportError(f"Could not create spec for {os.path.basename(file_path)}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ModuleManifest:
+    """
+    Cached metadata for every module in an AuthCheck_modules directory.
+
+    The manifest stores each module's description and form fields together
+    with the file's mtime, size and hash, so the module list can be filled
+    without executing module code. Entries are rebuilt automatically when a
+    module file changes, and modules are only imported on demand.
+    """
+
+    def __init__(self, modules_dir, manifest_path=None):
+        """
+        Args:
+            modules_dir (str): Path to the AuthCheck_modules directory
+            manifest_path (str): Manifest file location (defaults to a hidden
+                file inside modules_dir)
+        """
+        self.modules_dir = modules_dir
+        self.manifest_path = manifest_path or os.path.join(modules_dir, MANIFEST_FILENAME)
+        self.entries = {}    # {module_name: entry dict}
+        self._loaded = {}    # {module_name: imported module}
+        self._lock = threading.Lock()
+
+    def _read_manifest(self):
+        """Read the stored manifest, returning {} if missing or unusable."""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            return {}
+        modules = data.get('modules', {})
+        return modules if isinstance(modules, dict) else {}
+
+    def _write_manifest(self):
+        """Persist the manifest atomically. Failures are not fatal."""
+        tmp_path = self.manifest_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'modules': self.entries}, f)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _build_entry(self, module_name, file_path, stat, digest):
+        """
+        Create a manifest entry for a module file.
+
+        Metadata is read statically from the source when it is a plain
+        literal; only modules that compute their metadata are imported.
+        """
+        entry = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'sha256': digest,
+            'imports': extract_imports(file_path),
+        }
+
+        metadata = extract_metadata(file_path)
+        if metadata is not None:
+            entry['module_description'] = metadata.get('module_description', module_name)
+            entry['form_fields'] = metadata['form_fields']
+            for name in ('execution_lane', 'verification_depths'):
+                if name in metadata:
+                    entry[name] = metadata[name]
+            return entry
+
+        try:
+            module = import_module_file(module_name, file_path)
+        except Exception as e:
+            entry['error'] = f"Error loading {os.path.basename(file_path)}: {e}"
+            return entry
+
+        if hasattr(module, 'form_fields') and hasattr(module, 'authenticate'):
+            entry['module_description'] = getattr(module, 'module_description', module_name)
+            entry['form_fields'] = module.form_fields
+            for name in ('execution_lane', 'verification_depths'):
+                if hasattr(module, name):
+                    entry[name] = getattr(module, name)
+            # Module is already executed - keep it so a later check is free
+            self._loaded[module_name] = module
+        else:
+            entry['error'] = f"Warning: {os.path.basename(file_path)} missing 'form_fields' or 'authenticate'"
+        return entry
+
+    def refresh(self):
+        """
+        Bring the manifest up to date with the modules directory.
+
+        Returns:
+            list: Error/warning messages for modules that could not be used
+        """
+        stored = self._read_manifest()
+        entries = {}
+        messages = []
+        changed = False
+
+        for filename in sorted(os.listdir(self.modules_dir)):
+            if not filename.endswith('.py') or filename == '__init__.py':
+                continue
+            module_name = filename[:-3]
+            file_path = os.path.join(self.modules_dir, filename)
+            try:
+                stat = os.stat(file_path)
+            except OSError as e:
+                messages.append(f"Error loading {filename}: {e}")
+                continue
+
+            entry = stored.get(module_name)
+            if entry and entry.get('mtime') == stat.st_mtime and entry.get('size') == stat.st_size:
+                entries[module_name] = entry
+            else:
+                digest = _file_digest(file_path)
+                if entry and entry.get('sha256') == digest:
+                    # Touched but unchanged - only the stat info is stale
+                    entry = dict(entry, mtime=stat.st_mtime, size=stat.st_size)
+                else:
+                    entry = self._build_entry(module_name, file_path, stat, digest)
+                entries[module_name] = entry
+                changed = True
+
+            if 'error' in entry:
+                messages.append(entry['error'])
+
+        if changed or set(entries) != set(stored):
+            self.entries = entries
+            self._write_manifest()
+        self.entries = entries
+        return messages
+
+    def available(self):
+        """
+        Return (module_name, entry) pairs for usable modules.
+
+        Returns:
+            list: [(module_name, entry), ...] excluding modules with errors
+        """
+        return [(name, entry) for name, entry in self.entries.items() if 'error' not in entry]
+
+    def load_module(self, module_name):
+        """
+        Import a module on demand, caching the result.
+
+        Args:
+            module_name (str): Module name from the manifest
+
+        Returns:
+            module: The imported module
+
+        Raises:
+            KeyError: If the module is not in the manifest
+            Exception: Anything raised while executing the module
+        """
+        with self._lock:
+            module = self._loaded.get(module_name)
+            if module is not None:
+                return module
+            if module_name not in self.entries:
+                raise KeyError(module_name)
+            file_path = os.path.join(self.modules_dir, module_name + '.py')
+            module = import_module_file(module_name, file_path)
+            self._loaded[module_name] = module
+            return module
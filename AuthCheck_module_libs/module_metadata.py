@@ -0,0 +1,146 @@
+# AuthCheck static module metadata extraction
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import ast
+import re
+
+
+# Module-level assignments read from the source without executing it
+# (execution_lane and verification_depths are optional, see
+# process_lane.module_lane and auth_utils.verification_depth)
+METADATA_NAMES = ('module_description', 'form_fields', 'execution_lane', 'verification_depths')
+
+# Import statements anywhere in a module, including inside functions
+_IMPORT = re.compile(
+    rb'^[ \t]*(?:import[ \t]+([A-Za-z_]\w*)|from[ \t]+([A-Za-z_]\w*)[\w.]*[ \t]+import\b)',
+    re.MULTILINE,
+)
+
+# Top-level lines allowed after the metadata block for the fast path
+_TOP_LEVEL_DEF = re.compile(rb'^(?:async\s+def|def|class)\s+(\w+)|^@')
+
+
+def _split_header(source):
+    """
+    Split a module's source into the part before its first top-level def.
+
+    Modules keep their metadata at the top followed only by function
+    definitions, so parsing the header alone is enough and much cheaper
+    than parsing the whole file.
+
+    Args:
+        source (bytes): Module source
+
+    Returns:
+        tuple: (header: bytes, definition_names: set) or None if anything
+               other than definitions follows the header
+    """
+    match = re.search(rb'^(?:async\s+def|def|class)\s', source, re.MULTILINE)
+    if match is None:
+        return None
+
+    names = set()
+    for line in source[match.start():].splitlines():
+        if not line or line[:1] in (b' ', b'\t', b'#') or not line.strip():
+            continue
+        definition = _TOP_LEVEL_DEF.match(line)
+        if definition is None:
+            return None
+        if definition.group(1):
+            names.add(definition.group(1).decode('ascii', 'replace'))
+    return source[:match.start()], names
+
+
+def extract_metadata(file_path):
+    """
+    Read module_description and form_fields from a module's source.
+
+    The values are evaluated with ast.literal_eval, so no module code is run.
+
+    Args:
+        file_path (str): Path to the module file
+
+    Returns:
+        dict: {'module_description': ..., 'form_fields': ...[, 'execution_lane': ...,
+              'verification_depths': ...]} or None if the
+              metadata is not a plain literal (the caller should import the
+              module instead)
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            source = f.read()
+    except OSError:
+        return None
+
+    header = _split_header(source)
+    if header is not None:
+        source, definitions = header
+    else:
+        definitions = set()
+
+    try:
+        tree = ast.parse(source, filename=file_path)
+    except (SyntaxError, ValueError):
+        return None
+
+    metadata = {}
+    has_authenticate = 'authenticate' in definitions
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if isinstance(node, ast.FunctionDef) and node.name == 'authenticate':
+                has_authenticate = True
+            continue
+
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id in METADATA_NAMES):
+            try:
+                metadata[node.targets[0].id] = ast.literal_eval(node.value)
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                return None
+            continue
+
+        # Any other top-level statement touching the metadata (augmented
+        # assignment, .append(), conditional definitions...) means the
+        # literal alone is not the final value
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and child.id in METADATA_NAMES:
+                return None
+
+    if not has_authenticate or 'form_fields' not in metadata:
+        return None
+    if not isinstance(metadata['form_fields'], list):
+        return None
+    if not isinstance(metadata.get('module_description', ''), str):
+        return None
+    return metadata
+
+
+def extract_imports(file_path):
+    """
+    List the top-level packages a module imports, without running it.
+
+    Modules import their client libraries inside authenticate(), so every
+    line is scanned, not just the header.
+
+    Args:
+        file_path (str): Path to the module file
+
+    Returns:
+        list: Sorted package names (e.g. ['paramiko', 'socket'])
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            source = f.read()
+    except OSError:
+        return []
+    names = set()
+    for plain, dotted in _IMPORT.findall(source):
+        names.add((plain or dotted).decode('ascii'))
+    return sorted(names)
@@ -0,0 +1,314 @@
+# AuthCheck process lane for native-driver modules
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Some modules call native client libraries (Oracle, SAP RFC, Siemens S7,
+# IBM MQ, 3270 emulators) that hold the GIL for long stretches, leak state
+# or can crash the interpreter. ProcessLane runs their authenticate() in a
+# small pool of worker processes instead: modules stay imported in a worker
+# between calls, each call has a deadline, and a worker that hangs, crashes
+# or has served max_calls checks is replaced.
+#
+# Workers are started as 'python process_lane.py --worker' and connect back
+# over a multiprocessing connection, so the host application's __main__ is
+# never re-imported.
+
+import os
+import queue
+import secrets
+import subprocess
+import sys
+import threading
+import time
+
+
+# Imports that send a module to the process lane unless it says otherwise
+NATIVE_DRIVER_IMPORTS = {
+    'oracledb', 'cx_Oracle', 'pyrfc', 'snap7', 'pymqi', 'py3270',
+    'ibm_db', 'pyodbc', 'jaydebeapi', 'jpype',
+}
+
+LANE_THREAD = 'thread'
+LANE_PROCESS = 'process'
+
+DEFAULT_WORKERS = 2
+DEFAULT_DEADLINE = 60.0   # Seconds a check may run before its worker is killed
+DEFAULT_MAX_CALLS = 500   # Checks served before a worker is recycled (leaky drivers)
+CONNECT_TIMEOUT = 30.0    # Seconds a new worker has to connect back
+
+
+def module_lane(entry):
+    """
+    Return the lane a module should run in.
+
+    A module chooses explicitly with a literal `execution_lane = "process"`
+    (or "thread"); otherwise modules importing a native driver go to the
+    process lane.
+
+    Args:
+        entry (dict): Manifest entry
+
+    Returns:
+        str: LANE_PROCESS or LANE_THREAD
+    """
+    lane = entry.get('execution_lane')
+    if lane in (LANE_PROCESS, LANE_THREAD):
+        return lane
+    if NATIVE_DRIVER_IMPORTS.intersection(entry.get('imports', ())):
+        return LANE_PROCESS
+    return LANE_THREAD
+
+
+class WorkerStartError(RuntimeError):
+    """A worker process exited or did not connect back in time."""
+
+
+class _Worker:
+    """One worker process and its connection."""
+
+    def __init__(self, modules_dir, timeout=CONNECT_TIMEOUT):
+        """
+        Start a worker and wait for it to connect back.
+
+        Args:
+            modules_dir (str): Path to the AuthCheck_modules directory
+            timeout (float): Seconds the worker has to connect
+
+        Raises:
+            WorkerStartError: If the worker exits or does not connect within
+                timeout (the process is killed and reaped)
+        """
+        import select
+        from multiprocessing.connection import Listener
+
+        authkey = secrets.token_bytes(32)
+        # Named pipes (the Windows default) cannot be select()ed; use TCP there
+        family = 'AF_INET' if sys.platform == 'win32' else None
+        with Listener(family=family, authkey=authkey) as listener:
+            env = dict(os.environ, AUTHCHECK_LANE_KEY=authkey.hex())
+            self.process = subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), '--worker', str(listener.address),
+                 os.path.abspath(modules_dir)],
+                stdin=subprocess.DEVNULL, env=env,
+            )
+            try:
+                # accept() itself cannot time out, so wait for the connection
+                # first, noticing a worker that exits before connecting
+                sock = listener._listener._socket
+                expires = time.monotonic() + timeout
+                while True:
+                    remaining = expires - time.monotonic()
+                    if remaining <= 0:
+                        raise WorkerStartError(f"Worker process did not connect within {timeout:g}s")
+                    if select.select([sock], [], [], min(remaining, 0.1))[0]:
+                        break
+                    if self.process.poll() is not None:
+                        raise WorkerStartError(
+                            f"Worker process exited (exit code {self.process.returncode}) before connecting")
+                self.conn = listener.accept()
+            except BaseException:
+                if self.process.poll() is None:
+                    self.process.kill()
+                self.process.wait()
+                raise
+        self.calls = 0
+
+    def kill(self):
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+    def stop(self):
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+            self.process.wait(timeout=2)
+        except Exception:
+            pass
+        self.kill()
+
+
+class LaneModule:
+    """Stand-in for a module whose authenticate() runs in a ProcessLane."""
+
+    def __init__(self, lane, module_name):
+        self.lane = lane
+        self.module_name = module_name
+
+    def authenticate(self, form_data):
+        return self.lane.call(self.module_name, form_data)
+
+
+class ProcessLane:
+    """
+    Pool of worker processes that run module authenticate() calls.
+
+    call() may be used from any number of threads; at most `workers` calls
+    run at once and the rest wait for a free worker.
+    """
+
+    def __init__(self, modules_dir, workers=DEFAULT_WORKERS, deadline=DEFAULT_DEADLINE,
+                 max_calls=DEFAULT_MAX_CALLS):
+        """
+        Args:
+            modules_dir (str): Path to the AuthCheck_modules directory
+            workers (int): Worker processes (started on first use)
+            deadline (float): Default seconds a call may take
+            max_calls (int): Calls a worker serves before it is replaced
+        """
+        self.modules_dir = modules_dir
+        self.deadline = deadline
+        self.max_calls = max_calls
+        self._slots = queue.Queue()
+        for _ in range(workers):
+            self._slots.put(None)  # None = not started yet
+        self._workers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.restarts = 0
+
+    def call(self, module_name, form_data, deadline=None):
+        """
+        Run a module's authenticate(form_data) in a worker process.
+
+        Args:
+            module_name (str): Module in modules_dir
+            form_data (dict): Form field values (must be picklable)
+            deadline (float): Seconds to wait, including waiting for a free
+                worker (defaults to the time left on the calling thread's
+                check deadline, else the lane's deadline)
+
+        Returns:
+            tuple: (success: bool, message: str)
+
+        Raises:
+            RuntimeError: If the lane is closed or authenticate() raised in
+                the worker
+        """
+        if self._closed:
+            raise RuntimeError("Process lane is closed")
+        if deadline is None:
+            from auth_utils import deadline_remaining
+            remaining = deadline_remaining()
+            deadline = self.deadline if remaining is None else max(remaining, 0.0)
+        # The deadline covers waiting for a free worker too
+        expires = time.monotonic() + deadline
+        try:
+            worker = self._slots.get(timeout=deadline)
+        except queue.Empty:
+            return False, f"Check timed out after {deadline:g}s waiting for a free worker process"
+        try:
+            # Nothing is started or sent once the time is used up, so an
+            # abandoned check never keeps a worker busy
+            remaining = expires - time.monotonic()
+            if remaining <= 0:
+                return False, f"Check timed out after {deadline:g}s waiting for a free worker process"
+
+            if worker is None:
+                try:
+                    worker = _Worker(self.modules_dir, min(CONNECT_TIMEOUT, remaining))
+                except WorkerStartError as e:
+                    with self._lock:
+                        self.restarts += 1
+                    return False, f"{e} - a new worker is started on the next check"
+                with self._lock:
+                    self._workers.add(worker)
+                remaining = expires - time.monotonic()
+                if remaining <= 0:
+                    return False, f"Check timed out after {deadline:g}s starting a worker process"
+
+            try:
+                worker.conn.send((module_name, form_data))
+                ready = worker.conn.poll(remaining)
+                reply = worker.conn.recv() if ready else None
+            except (EOFError, OSError):
+                ready, reply = True, None
+
+            if reply is None:
+                self._discard(worker)
+                exit_code = worker.process.returncode
+                worker = None
+                if not ready:
+                    return False, f"Check timed out after {deadline:g}s (worker process restarted)"
+                return False, f"Worker process died (exit code {exit_code}) - restarted"
+
+            worker.calls += 1
+            if self.max_calls and worker.calls >= self.max_calls:
+                self._discard(worker, graceful=True)
+                worker = None
+
+            status, value = reply
+            if status == 'error':
+                raise RuntimeError(value)
+            return value
+        finally:
+            self._slots.put(worker)
+
+    def module(self, module_name):
+        """Return an object whose authenticate() runs module_name in this lane."""
+        return LaneModule(self, module_name)
+
+    def _discard(self, worker, graceful=False):
+        with self._lock:
+            self._workers.discard(worker)
+            if not graceful:
+                self.restarts += 1
+        if graceful:
+            worker.stop()
+        else:
+            worker.kill()
+
+    def close(self):
+        """Stop all worker processes."""
+        self._closed = True
+        with self._lock:
+            workers, self._workers = self._workers, set()
+        for worker in workers:
+            worker.stop()
+
+
+def _worker_main(address, modules_dir):
+    """Serve (module_name, form_data) requests until told to stop."""
+    from multiprocessing.connection import Client
+    from module_manifest import import_module_file
+
+    conn = Client(address, authkey=bytes.fromhex(os.environ.pop('AUTHCHECK_LANE_KEY')))
+    modules = {}
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        module_name, form_data = request
+        try:
+            module = modules.get(module_name)
+            if module is None:
+                module = modules[module_name] = import_module_file(
+                    module_name, os.path.join(modules_dir, module_name + '.py'))
+            success, message = module.authenticate(form_data)
+            reply = ('ok', (bool(success), str(message)))
+        except Exception as e:
+            reply = ('error', f"{type(e).__name__}: {e}")
+        conn.send(reply)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 and sys.argv[1] == '--worker':
+        address = sys.argv[2]
+        if address.startswith('('):
+            import ast
+            address = ast.literal_eval(address)  # AF_INET (host, port)
+        _worker_main(address, sys.argv[3])
+    else:
+        print("process_lane.py is started by ProcessLane; it is not a command line tool", file=sys.stderr)
+        sys.exit(2)
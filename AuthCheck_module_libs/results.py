@@ -0,0 +1,328 @@
+# AuthCheck result records and result store
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AuthResult is a compact record of one check. ResultStore appends results
+# to an SQLite database in WAL mode, committing in batches, and streams them
+# back out with a cursor, so millions of rows never have to fit in memory.
+#
+# Usage (export):
+#   python results.py results.db --outcome success --format csv > hits.csv
+
+import argparse
+import csv
+import json
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+
+# Outcome classes
+OUTCOME_SUCCESS = 'success'
+OUTCOME_DENIED = 'denied'                          # Credentials rejected
+OUTCOME_FAILED = 'failed'                          # Failed for another reason
+OUTCOME_TIMEOUT = 'timeout'
+OUTCOME_UNREACHABLE = 'unreachable'
+OUTCOME_INVALID_INPUT = 'invalid_input'            # Required field missing
+OUTCOME_MISSING_DEPENDENCY = 'missing_dependency'  # Client library not installed
+OUTCOME_ERROR = 'error'                            # authenticate() raised
+
+OUTCOMES = (OUTCOME_SUCCESS, OUTCOME_DENIED, OUTCOME_FAILED, OUTCOME_TIMEOUT, OUTCOME_UNREACHABLE,
+            OUTCOME_INVALID_INPUT, OUTCOME_MISSING_DEPENDENCY, OUTCOME_ERROR)
+
+# Checked in order against a failure message; first match wins
+_OUTCOME_PATTERNS = (
+    (OUTCOME_MISSING_DEPENDENCY, re.compile(r'(package|library|module) not installed|pip install|No module named', re.I)),
+    (OUTCOME_INVALID_INPUT, re.compile(r'\bis required\b|\bare required\b', re.I)),
+    (OUTCOME_TIMEOUT, re.compile(r'timed? ?out|timeout|deadline', re.I)),
+    (OUTCOME_UNREACHABLE, re.compile(
+        r'connection refused|cannot connect|could not connect|failed to connect|unable to connect|'
+        r'no route to host|unreachable|name or service not known|getaddrinfo|nodename nor servname|'
+        r'connection (error|failed|reset)|no response from', re.I)),
+    (OUTCOME_DENIED, re.compile(
+        r'auth\w* failed|invalid (credentials|password|username|token|api key|key)|unauthori[sz]ed|'
+        r'forbidden|access denied|permission denied|login failed|bad credentials|\b40[13]\b|'
+        r'could not authenticate|incorrect', re.I)),
+)
+
+# Form fields that identify the target and account of a check, in order of
+# preference (the batch runner fills the same fields)
+TARGET_FIELDS = ('host', 'hosts', 'server', 'servers', 'address', 'url',
+                 'base_url', 'api_url', 'server_url', 'endpoint')
+USERNAME_FIELDS = ('username', 'user', 'bind_dn', 'email', 'account',
+                   'access_key_id', 'client_id')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    module TEXT NOT NULL,
+    target TEXT,
+    username TEXT,
+    outcome TEXT NOT NULL,
+    latency REAL,
+    message TEXT,
+    phases TEXT
+);
+CREATE INDEX IF NOT EXISTS results_module ON results (module);
+CREATE INDEX IF NOT EXISTS results_target ON results (target);
+CREATE INDEX IF NOT EXISTS results_outcome ON results (outcome);
+"""
+
+_COLUMNS = ('timestamp', 'module', 'target', 'username', 'outcome', 'latency', 'message', 'phases')
+
+
+def classify(success, message, raised=False):
+    """
+    Return the outcome class of a check.
+
+    Args:
+        success (bool): Value returned by authenticate()
+        message (str): Message returned (or exception text)
+        raised (bool): True if authenticate() raised
+
+    Returns:
+        str: One of OUTCOMES
+    """
+    if success and not raised:
+        return OUTCOME_SUCCESS
+    message = str(message)
+    for outcome, pattern in _OUTCOME_PATTERNS:
+        if pattern.search(message):
+            return outcome
+    return OUTCOME_ERROR if raised else OUTCOME_FAILED
+
+
+def form_identity(form_data):
+    """
+    Return (target, username) for a check from its form data.
+
+    The target is the first target-like field, with ':port' appended when
+    the form has a port and the field is not a URL.
+    """
+    target = ''
+    for field in TARGET_FIELDS:
+        value = form_data.get(field)
+        if value:
+            target = str(value).strip()
+            break
+    port = str(form_data.get('port', '') or '').strip()
+    if target and port and '://' not in target:
+        target = f"{target}:{port}"
+    username = None
+    for field in USERNAME_FIELDS:
+        value = form_data.get(field)
+        if value:
+            username = str(value).strip()
+            break
+    return target, username
+
+
+class AuthResult:
+    """One check's result."""
+
+    __slots__ = _COLUMNS
+
+    def __init__(self, module, target, username, outcome, latency, message, timestamp=None, phases=None):
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.module = module
+        self.target = target
+        self.username = username
+        self.outcome = outcome
+        self.latency = latency
+        self.message = message
+        self.phases = phases  # {phase: seconds} from tracing.Trace, if traced
+
+    @property
+    def success(self):
+        return self.outcome == OUTCOME_SUCCESS
+
+    def as_row(self):
+        """Return the values in column order."""
+        return (self.timestamp, self.module, self.target, self.username,
+                self.outcome, self.latency, self.message,
+                json.dumps(self.phases) if self.phases else None)
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a result from a row in column order."""
+        timestamp, module, target, username, outcome, latency, message, phases = row
+        return cls(module, target, username, outcome, latency, message, timestamp,
+                   json.loads(phases) if phases else None)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in _COLUMNS}
+
+    def __repr__(self):
+        return (f"AuthResult({self.module!r}, {self.target!r}, {self.username!r}, "
+                f"{self.outcome!r}, {self.latency!r})")
+
+
+class ResultStore:
+    """
+    Append-only SQLite store of AuthResults.
+
+    Results are buffered and committed in batches; add() may be called from
+    any thread. Queries stream rows from a cursor.
+    """
+
+    def __init__(self, path, batch_size=500, flush_interval=1.0):
+        """
+        Args:
+            path (str): Database file (created if missing)
+            batch_size (int): Results buffered before a commit
+            flush_interval (float): Seconds after which add() commits anyway
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(results)")}
+        if 'phases' not in columns:
+            # Databases written before phase timings were recorded
+            self._conn.execute("ALTER TABLE results ADD COLUMN phases TEXT")
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def add(self, result):
+        """Buffer a result, committing when the batch is full or old enough."""
+        with self._lock:
+            self._buffer.append(result.as_row())
+            if (len(self._buffer) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush_locked()
+
+    def flush(self):
+        """Commit buffered results."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._buffer:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO results ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    self._buffer,
+                )
+            self._buffer = []
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _where(module=None, target=None, username=None, outcome=None, since=None):
+        clauses, params = [], []
+        for column, value in (('module', module), ('target', target),
+                              ('username', username), ('outcome', outcome)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+    def query(self, module=None, target=None, username=None, outcome=None, since=None, limit=None):
+        """
+        Stream stored results, oldest first.
+
+        Yields:
+            AuthResult
+        """
+        self.flush()
+        where, params = self._where(module, target, username, outcome, since)
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM results{where} ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        # A separate connection keeps a long iteration from blocking add()
+        conn = sqlite3.connect(self.path)
+        try:
+            for row in conn.execute(sql, params):
+                yield AuthResult.from_row(row)
+        finally:
+            conn.close()
+
+    def count(self, module=None, target=None, username=None, outcome=None, since=None):
+        """Return the number of stored results matching the filters."""
+        self.flush()
+        where, params = self._where(module, target, username, outcome, since)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM results{where}", params).fetchone()[0]
+
+    def outcome_counts(self):
+        """Return {outcome: count} over all stored results."""
+        self.flush()
+        with self._lock:
+            return dict(self._conn.execute("SELECT outcome, COUNT(*) FROM results GROUP BY outcome"))
+
+    def close(self):
+        """Commit buffered results and close the database."""
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+
+def export(store, out, fmt='jsonl', **filters):
+    """
+    Write stored results to a file object.
+
+    Args:
+        store (ResultStore): Store to read
+        out: Text file object
+        fmt (str): 'jsonl' or 'csv'
+        **filters: Passed to ResultStore.query()
+
+    Returns:
+        int: Number of results written
+    """
+    count = 0
+    if fmt == 'csv':
+        writer = csv.writer(out)
+        writer.writerow(_COLUMNS)
+        for result in store.query(**filters):
+            writer.writerow(result.as_row())
+            count += 1
+    else:
+        for result in store.query(**filters):
+            out.write(json.dumps(result.to_dict()) + '\n')
+            count += 1
+    return count
+
+
+def main(argv=None):
+    """Query or export a result database."""
+    parser = argparse.ArgumentParser(description="Query or export AuthCheck results.")
+    parser.add_argument('database', help="Result database")
+    parser.add_argument('--module')
+    parser.add_argument('--target')
+    parser.add_argument('--username')
+    parser.add_argument('--outcome', choices=OUTCOMES)
+    parser.add_argument('--limit', type=int)
+    parser.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl')
+    parser.add_argument('--summary', action='store_true', help="Print counts per outcome only")
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.database)
+    try:
+        if args.summary:
+            for outcome, count in sorted(store.outcome_counts().items()):
+                print(f"{outcome:<20} {count}")
+            return 0
+        export(store, sys.stdout, args.format, module=args.module, target=args.target,
+               username=args.username, outcome=args.outcome, limit=args.limit)
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,253 @@
+# AuthCheck politeness scheduler
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Decides which queued job may start next so that a sweep never hammers one
+# host or locks out an account:
+#   - at most max_per_host checks run against a host at once
+#   - at most max_per_account checks run for one (host, username) at once
+#   - attempts against a host start at least min_spacing seconds apart
+#   - failed attempts per account stay under the module's lockout budget
+#     (attempts per window); a success clears the account's failures
+# A sweep job (several credentials over one connection) counts as one check
+# on its host but holds and is charged to every account it tries.
+# Hosts are served round-robin, so while one host is paced, idle worker
+# slots are filled with work for other hosts.
+
+import time
+from collections import OrderedDict, deque
+
+
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_MAX_PER_ACCOUNT = 1
+DEFAULT_MIN_SPACING = 0.0
+DEFAULT_LOOKAHEAD = 4096
+
+# {module: (failed attempts allowed, window in seconds)} for modules whose
+# backends lock accounts. Kept below the vendors' default thresholds.
+DEFAULT_LOCKOUT_BUDGETS = {
+    'LDAP': (3, 1800),
+    'SMB': (3, 1800),
+    'Azure_AD': (5, 600),
+    'Okta': (5, 1800),
+    'OneLogin': (5, 1800),
+    'JumpCloud': (5, 1800),
+    'PingIdentity': (5, 1800),
+    'Auth0': (5, 1800),
+    'Keycloak': (5, 900),
+    'CyberArk': (3, 1800),
+}
+
+
+def parse_budget(text):
+    """
+    Parse 'MODULE=ATTEMPTS/SECONDS' into (module, (attempts, seconds)).
+
+    Raises:
+        ValueError: If the text is malformed
+    """
+    try:
+        module, budget = text.split('=', 1)
+        attempts, window = budget.split('/', 1)
+        return module.strip(), (int(attempts), float(window))
+    except ValueError:
+        raise ValueError(f"Lockout budget must look like MODULE=ATTEMPTS/SECONDS, got '{text}'")
+
+
+class Scheduler:
+    """
+    Per-host and per-account pacing for batch checks.
+
+    Not thread-safe: add(), next_job(), finished() and finished_sweep() are called from the
+    single thread that dispatches jobs.
+    """
+
+    def __init__(self, max_per_host=DEFAULT_MAX_PER_HOST, max_per_account=DEFAULT_MAX_PER_ACCOUNT,
+                 min_spacing=DEFAULT_MIN_SPACING, lockout_budgets=None,
+                 lookahead=DEFAULT_LOOKAHEAD, clock=time.monotonic):
+        """
+        Args:
+            max_per_host (int): Concurrent checks per host
+            max_per_account (int): Concurrent checks per (host, username)
+            min_spacing (float): Seconds between attempt starts on one host
+            lockout_budgets (dict): {module: (attempts, window_seconds)};
+                defaults to DEFAULT_LOCKOUT_BUDGETS
+            lookahead (int): Jobs to queue ahead looking for a ready host
+            clock (callable): Monotonic time source
+        """
+        self.max_per_host = max_per_host
+        self.max_per_account = max_per_account
+        self.min_spacing = min_spacing
+        self.lockout_budgets = DEFAULT_LOCKOUT_BUDGETS if lockout_budgets is None else lockout_budgets
+        self.lookahead = lookahead
+        self.clock = clock
+        # {host: OrderedDict({username: deque(jobs)})}, both in round-robin order
+        self._queues = OrderedDict()
+        self._host_active = {}
+        self._host_next = {}
+        self._account_active = {}
+        self._failures = {}  # {(host, username): deque(failure times)}
+        self.pending = 0
+
+    def wants_more(self):
+        """Return True while the scheduler has room to look further ahead."""
+        return self.pending < self.lookahead
+
+    def add(self, job, host):
+        """Queue a job against a host."""
+        accounts = self._queues.get(host)
+        if accounts is None:
+            accounts = self._queues[host] = OrderedDict()
+        queue = accounts.get(job['username'])
+        if queue is None:
+            queue = accounts[job['username']] = deque()
+        queue.append(job)
+        self.pending += 1
+
+    def _account_delay(self, host, username, module, now):
+        """
+        Return 0 if the account may start an attempt now, the seconds until
+        its lockout budget frees up, or None if it is busy.
+        """
+        if username is None:
+            # Bare secrets (tokens, community strings) have no account to lock
+            return 0
+        key = (host, username)
+        active = self._account_active.get(key, 0)
+        if active >= self.max_per_account:
+            return None
+        budget = self.lockout_budgets.get(module)
+        if budget is None:
+            return 0
+        attempts, window = budget
+        failures = self._failures.get(key, ())
+        while failures and now - failures[0] >= window:
+            failures.popleft()
+        if not failures:
+            self._failures.pop(key, None)
+        over = len(failures) + active - attempts + 1
+        if over <= 0:
+            return 0
+        if over <= len(failures):
+            # Ready once enough old failures have aged out of the window
+            return max(window - (now - failures[over - 1]), 0.001)
+        # Remaining budget is held by attempts still running
+        return None
+
+    def next_job(self):
+        """
+        Take the next job that may start now.
+
+        Returns:
+            tuple: (job, host, None) if a job may start, otherwise
+                (None, None, delay) where delay is the seconds until a paced
+                job becomes ready, or None if only a running check finishing
+                (or nothing at all) can free one
+        """
+        now = self.clock()
+        delay = None
+        for host in list(self._queues):
+            if self._host_active.get(host, 0) >= self.max_per_host:
+                continue
+            host_wait = self._host_next.get(host, 0) - now
+            if host_wait > 0:
+                delay = host_wait if delay is None else min(delay, host_wait)
+                continue
+            accounts = self._queues[host]
+            for username in list(accounts):
+                queue = accounts[username]
+                account_wait = self._job_delay(host, queue[0], now)
+                if account_wait is None:
+                    continue
+                if account_wait > 0:
+                    delay = account_wait if delay is None else min(delay, account_wait)
+                    continue
+                job = queue.popleft()
+                if queue:
+                    accounts.move_to_end(username)
+                else:
+                    del accounts[username]
+                if accounts:
+                    self._queues.move_to_end(host)
+                else:
+                    del self._queues[host]
+                self.pending -= 1
+                self._started(host, job, now)
+                return job, host, None
+        return None, None, delay
+
+    def _job_delay(self, host, job, now):
+        """_account_delay() for every account a job tries; a sweep waits for all of them."""
+        if 'sweep' not in job:
+            return self._account_delay(host, job['username'], job['module'], now)
+        delay = 0
+        for username in {sweep_job['username'] for sweep_job in job['sweep']}:
+            account_wait = self._account_delay(host, username, job['module'], now)
+            if account_wait is None:
+                return None
+            delay = max(delay, account_wait)
+        return delay
+
+    def _started(self, host, job, now):
+        self._host_active[host] = self._host_active.get(host, 0) + 1
+        self._host_next[host] = now + self.min_spacing
+        for sweep_job in job.get('sweep', (job,)):
+            username = sweep_job['username']
+            if username is not None:
+                key = (host, username)
+                self._account_active[key] = self._account_active.get(key, 0) + 1
+
+    def finished(self, job, host, result):
+        """
+        Record a finished job.
+
+        Args:
+            job (dict): Job returned by next_job()
+            host (str): Host returned with it
+            result (dict): Result with a 'status' of success/failed/error
+        """
+        self._host_finished(host)
+        self._account_finished(job, host, result)
+
+    def finished_sweep(self, sweep, host, pairs):
+        """
+        Record a finished sweep job, charging each credential to its account.
+
+        Args:
+            sweep (dict): Sweep job returned by next_job()
+            host (str): Host returned with it
+            pairs (list): (job, result) for every credential in the sweep
+        """
+        self._host_finished(host)
+        for job, result in pairs:
+            self._account_finished(job, host, result)
+
+    def _host_finished(self, host):
+        active = self._host_active[host] - 1
+        if active:
+            self._host_active[host] = active
+        else:
+            del self._host_active[host]
+            if host not in self._queues:
+                self._host_next.pop(host, None)
+
+    def _account_finished(self, job, host, result):
+        username = job['username']
+        if username is None:
+            return
+        key = (host, username)
+        active = self._account_active[key] - 1
+        if active:
+            self._account_active[key] = active
+        else:
+            del self._account_active[key]
+
+        if result['status'] == 'success':
+            self._failures.pop(key, None)
+        elif job['module'] in self.lockout_budgets:
+            # Errors count too - a timeout may still have reached the backend
+            self._failures.setdefault(key, deque()).append(self.clock())
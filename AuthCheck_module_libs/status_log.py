@@ -0,0 +1,111 @@
+# AuthCheck status log spill file
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# The GUI status window only keeps the most recent lines; everything it
+# shows is also appended here, in a size-capped set of rotating files that
+# can be searched without loading them into memory.
+
+import os
+import threading
+
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUPS = 4
+
+
+class RotatingLog:
+    """
+    Append-only text log rotated by size: path, path.1, ... path.N.
+
+    Safe to use from several threads.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, backups=DEFAULT_BACKUPS):
+        """
+        Args:
+            path (str): Current log file
+            max_bytes (int): Size at which the file is rotated
+            backups (int): Rotated files kept (the oldest is deleted)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8', errors='replace')
+        return self._file
+
+    def _rotate(self):
+        """Shift path -> path.1 -> ... and start a new file. Caller holds the lock."""
+        self._file.close()
+        self._file = None
+        for i in range(self.backups, 0, -1):
+            source = self.path if i == 1 else f"{self.path}.{i - 1}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i}")
+        if self.backups < 1:
+            os.remove(self.path)
+
+    def write(self, text):
+        """
+        Append text (one or more lines) to the log.
+
+        Raises:
+            OSError: If the log cannot be written
+        """
+        with self._lock:
+            f = self._open()
+            f.write(text if text.endswith('\n') else text + '\n')
+            f.flush()
+            if f.tell() >= self.max_bytes:
+                self._rotate()
+
+    def files(self):
+        """Return existing log files, oldest first."""
+        candidates = [f"{self.path}.{i}" for i in range(self.backups, 0, -1)] + [self.path]
+        return [path for path in candidates if os.path.exists(path)]
+
+    def search(self, text, limit=500):
+        """
+        Find lines containing text (case-insensitive), oldest first.
+
+        Args:
+            text (str): Text to look for
+            limit (int): Keep at most this many of the newest matches
+
+        Returns:
+            tuple: (matches: list of str, total: int)
+        """
+        from collections import deque
+
+        needle = text.lower()
+        matches = deque(maxlen=limit)
+        total = 0
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            paths = self.files()
+        for path in paths:
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    for line in f:
+                        if needle in line.lower():
+                            matches.append(line.rstrip('\n'))
+                            total += 1
+            except OSError:
+                continue
+        return list(matches), total
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,246 @@
+# AuthCheck per-phase check timing
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Splits the time of a check into phases: DNS lookups, TCP connects, TLS
+# handshakes, the login itself (auth) and anything a module does after the
+# login succeeded (post_auth). After install(), name resolution, socket
+# connects and TLS handshakes made on a thread with an active Trace are
+# timed; time not spent in those is application time. It counts as auth
+# until the check is marked as authenticated - by the module calling
+# mark_authenticated(), or by the HTTP pool after the first 2xx/3xx response
+# to a request carrying credentials - and as post_auth afterwards.
+# LatencyStats aggregates percentiles per module and per host from a
+# bounded sample of checks.
+
+import contextlib
+import math
+import random
+import socket
+import ssl
+import threading
+import time
+
+
+PHASES = ('dns', 'connect', 'tls', 'auth', 'post_auth', 'total')
+NETWORK_PHASES = ('dns', 'connect', 'tls')
+PERCENTILES = (50, 95, 99)
+DEFAULT_MAX_SAMPLES = 2048  # Checks kept per module or host for percentiles
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+
+
+class Trace:
+    """Phase timings of one check."""
+
+    def __init__(self):
+        self.start = None
+        self.end = None
+        self.authenticated_at = None
+        self.network = {phase: 0.0 for phase in NETWORK_PHASES}
+        self._network_after_auth = 0.0
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Time the check run inside the block on this thread."""
+        previous = getattr(_local, 'trace', None)
+        _local.trace = self
+        self.start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.end = time.perf_counter()
+            _local.trace = previous
+
+    def add(self, phase, seconds):
+        """Add time spent in a network phase."""
+        self.network[phase] += seconds
+        if self.authenticated_at is not None:
+            self._network_after_auth += seconds
+
+    def mark_authenticated(self):
+        """Start counting application time as post_auth."""
+        if self.authenticated_at is None:
+            self.authenticated_at = time.perf_counter()
+
+    def phases(self):
+        """
+        Return the phase timings in seconds.
+
+        Returns:
+            dict: {phase: seconds} for every name in PHASES
+        """
+        if self.start is None:
+            return {}
+        end = self.end if self.end is not None else time.perf_counter()
+        total = end - self.start
+        network = sum(self.network.values())
+        if self.authenticated_at is None:
+            auth, post_auth = total - network, 0.0
+        else:
+            auth = (self.authenticated_at - self.start) - (network - self._network_after_auth)
+            post_auth = (end - self.authenticated_at) - self._network_after_auth
+        result = {phase: round(seconds, 4) for phase, seconds in self.network.items()}
+        result['auth'] = round(max(auth, 0.0), 4)
+        result['post_auth'] = round(max(post_auth, 0.0), 4)
+        result['total'] = round(total, 4)
+        return result
+
+
+def active_trace():
+    """Return the Trace active on this thread, or None."""
+    return getattr(_local, 'trace', None)
+
+
+def mark_authenticated():
+    """
+    Mark the current check's credentials as proven.
+
+    Modules call this after the login step, so that follow-up requests
+    (account details, inventory, logout) are reported as post_auth.
+    """
+    trace = active_trace()
+    if trace is not None:
+        trace.mark_authenticated()
+
+
+@contextlib.contextmanager
+def _timed(phase):
+    trace = active_trace()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(phase, time.perf_counter() - start)
+
+
+def install():
+    """
+    Time name resolution, socket connects and TLS handshakes.
+
+    Wraps socket.getaddrinfo(), socket.socket.connect() and
+    ssl.SSLSocket.do_handshake(). Threads without an active Trace are
+    unaffected. Safe to call repeatedly.
+    """
+    global _installed
+    import auth_utils
+
+    with _install_lock:
+        if _installed:
+            return
+
+        original_getaddrinfo = socket.getaddrinfo
+
+        def getaddrinfo(*args, **kwargs):
+            with _timed('dns'):
+                return original_getaddrinfo(*args, **kwargs)
+
+        original_handshake = ssl.SSLSocket.do_handshake
+
+        def do_handshake(self, *args, **kwargs):
+            with _timed('tls'):
+                return original_handshake(self, *args, **kwargs)
+
+        socket.getaddrinfo = getaddrinfo
+        # connect() is timed by auth_utils' socket.socket subclass, which
+        # also enforces check deadlines
+        auth_utils.install_connect_timer(lambda: _timed('connect'))
+        ssl.SSLSocket.do_handshake = do_handshake
+        _installed = True
+
+
+def percentile(sorted_values, pct):
+    """Return the pct-th percentile (nearest rank) of a sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LatencyStats:
+    """
+    Phase percentiles per module and per host.
+
+    Each key keeps a uniform random sample of at most max_samples checks
+    (reservoir sampling), so memory stays bounded on long sweeps. Safe to
+    use from several threads.
+    """
+
+    def __init__(self, max_samples=DEFAULT_MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._groups = {'module': {}, 'host': {}}  # {group: {key: [count, samples]}}
+        self._lock = threading.Lock()
+
+    def add(self, module, host, phases):
+        """Record one check's phase timings."""
+        if not phases:
+            return
+        with self._lock:
+            for group, key in (('module', module), ('host', host)):
+                if not key:
+                    continue
+                entry = self._groups[group].setdefault(key, [0, []])
+                entry[0] += 1
+                samples = entry[1]
+                if len(samples) < self.max_samples:
+                    samples.append(phases)
+                else:
+                    slot = random.randrange(entry[0])
+                    if slot < self.max_samples:
+                        samples[slot] = phases
+
+    def summary(self, group='module'):
+        """
+        Return percentiles for every key of a group.
+
+        Args:
+            group (str): 'module' or 'host'
+
+        Returns:
+            dict: {key: {'count': int, phase: {50: s, 95: s, 99: s}, ...}}
+        """
+        with self._lock:
+            entries = {key: (count, list(samples)) for key, (count, samples) in self._groups[group].items()}
+        summary = {}
+        for key, (count, samples) in entries.items():
+            row = {'count': count}
+            for phase in PHASES:
+                values = sorted(sample.get(phase, 0.0) for sample in samples)
+                row[phase] = {pct: percentile(values, pct) for pct in PERCENTILES}
+            summary[key] = row
+        return summary
+
+    def format_table(self, group='module', limit=None, sort_by='total'):
+        """
+        Format a summary as a text table, slowest p95 first.
+
+        Args:
+            group (str): 'module' or 'host'
+            limit (int): Only the slowest keys
+            sort_by (str): Phase whose p95 orders the rows
+
+        Returns:
+            str: Table with p50/p95/p99 in milliseconds per phase
+        """
+        summary = self.summary(group)
+        keys = sorted(summary, key=lambda key: summary[key][sort_by][95], reverse=True)
+        if limit is not None:
+            keys = keys[:limit]
+        width = max([len(group)] + [len(str(key)) for key in keys])
+        header = f"{group:<{width}} {'checks':>7} " + ' '.join(f"{phase + ' p50/p95/p99 ms':>26}" for phase in PHASES)
+        lines = [header]
+        for key in keys:
+            row = summary[key]
+            cells = ' '.join(
+                f"{'/'.join(f'{row[phase][pct] * 1000:.0f}' for pct in PERCENTILES):>26}" for phase in PHASES)
+            lines.append(f"{str(key):<{width}} {row['count']:>7} {cells}")
+        return '\n'.join(lines)
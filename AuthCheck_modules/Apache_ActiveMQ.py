@@ -51,7 +51,6 @@ def authenticate(form_data):
         # We'll test using socket connection and protocol handshake
         try:
             import socket
-            import ssl as ssl_module
         except ImportError:
             return False, "socket/ssl modules not available"
         
@@ -63,10 +62,8 @@ def authenticate(form_data):
             sock.settimeout(10)
             
             if use_ssl:
-                context = ssl_module.create_default_context()
-                if not verify_ssl:
-                    context.check_hostname = False
-                    context.verify_mode = ssl_module.CERT_NONE
+                from auth_utils import create_ssl_context
+                context = create_ssl_context(verify_cert=verify_ssl)
                 sock = context.wrap_socket(sock, server_hostname=host)
             
             sock.connect((host, port))
@@ -190,10 +187,8 @@ def authenticate(form_data):
             
             ssl_options = None
             if use_ssl:
-                import ssl
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE if not verify_ssl else ssl.CERT_REQUIRED
+                from auth_utils import create_ssl_context
+                context = create_ssl_context(verify_cert=verify_ssl, check_hostname=False)
                 ssl_options = pika.SSLOptions(context, host)
             
             parameters = pika.ConnectionParameters(
@@ -57,14 +57,13 @@ def authenticate(form_data):
         
         ssl_options = None
         if use_ssl:
-            import ssl
-            ssl_context = ssl.create_default_context()
-            if ssl_ca:
-                ssl_context.load_verify_locations(ssl_ca)
-            if ssl_cert and ssl_key:
-                ssl_context.load_cert_chain(ssl_cert, ssl_key)
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            from auth_utils import create_ssl_context
+            ssl_context = create_ssl_context(
+                verify_cert=False,
+                ca_file=ssl_ca or None,
+                cert_file=ssl_cert if ssl_cert and ssl_key else None,
+                key_file=ssl_key if ssl_cert and ssl_key else None,
+            )
             ssl_options = {'ssl_context': ssl_context}
         
         cluster = Cluster(
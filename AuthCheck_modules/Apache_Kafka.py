@@ -26,11 +26,15 @@ form_fields = [
     {"name": "hints", "type": "readonly", "label": "Hints", "default": "PLAINTEXT: 9092, SSL/SASL_SSL: 9093. admin / admin-secret"},
 ]
 
+verification_depths = ["auth-only", "identity", "full"]
+
 
 def authenticate(form_data):
     """
     Attempt to authenticate to Apache Kafka using kafka-python or confluent-kafka.
     """
+    from auth_utils import DEPTH_AUTH_ONLY, DEPTH_FULL, verification_depth
+    
     bootstrap_servers = form_data.get('bootstrap_servers', '').strip()
     client_library = form_data.get('client_library', 'kafka-python')
     security_protocol = form_data.get('security_protocol', 'PLAINTEXT')
@@ -40,6 +44,7 @@ def authenticate(form_data):
     ssl_cafile = form_data.get('ssl_cafile', '').strip() or None
     ssl_certfile = form_data.get('ssl_certfile', '').strip() or None
     ssl_keyfile = form_data.get('ssl_keyfile', '').strip() or None
+    depth = verification_depth(form_data)
     
     if not bootstrap_servers:
         return False, "Bootstrap servers is required"
@@ -125,8 +130,17 @@ def authenticate(form_data):
             # Use AdminClient for better metadata
             try:
                 admin = KafkaAdminClient(**config)
+                # Connecting to the bootstrap broker already ran the SASL/SSL handshake
+                if depth == DEPTH_AUTH_ONLY:
+                    admin.close()
+                    return True, f"Successfully authenticated to Kafka cluster at {bootstrap_servers}"
+                
                 cluster_metadata = admin.describe_cluster()
                 broker_count = len(cluster_metadata.get('brokers', []))
+                if depth != DEPTH_FULL:
+                    admin.close()
+                    return True, f"Successfully authenticated to Kafka cluster at {bootstrap_servers}\nBrokers: {broker_count}"
+                
                 topics = admin.list_topics()
                 admin.close()
                 
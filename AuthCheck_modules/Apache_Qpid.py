@@ -65,10 +65,8 @@ def authenticate(form_data):
         
         ssl_options = None
         if use_ssl:
-            import ssl
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
+            from auth_utils import create_ssl_context
+            context = create_ssl_context(verify_cert=False)
             ssl_options = pika.SSLOptions(context, host)
         
         parameters = pika.ConnectionParameters(
@@ -12,29 +12,23 @@ form_fields = [
     {"name": "hints", "type": "readonly", "label": "Hints", "default": "CoAP port 5683, CoAPs (DTLS) port 5684. No standard auth."}
 ]
 
-def authenticate(form_data):
-    """Test CoAP connection."""
+async def authenticate_async(form_data):
+    """Test CoAP connection (coroutine, for a shared event loop)."""
     try:
         from aiocoap import Context, Message, GET
-        import asyncio
         
         host = form_data.get("host", "localhost")
         port = form_data.get("port", "5683")
         path = form_data.get("path", "/.well-known/core")
         
-        async def coap_request():
-            context = await Context.create_client_context()
-            
+        context = await Context.create_client_context()
+        try:
             uri = f"coap://{host}:{port}{path}"
             request = Message(code=GET, uri=uri)
             
             response = await context.request(request).response
-            return response
-        
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        response = loop.run_until_complete(coap_request())
-        loop.close()
+        finally:
+            await context.shutdown()
         
         if response.code.is_successful():
             return True, f"CoAP connection successful to {host}:{port}"
@@ -46,3 +40,14 @@ def authenticate(form_data):
     except Exception as e:
         return False, f"CoAP error: {str(e)}"
 
+
+def authenticate(form_data):
+    """Test CoAP connection."""
+    import asyncio
+    
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(authenticate_async(form_data))
+    finally:
+        loop.close()
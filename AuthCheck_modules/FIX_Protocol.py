@@ -18,7 +18,6 @@ def authenticate(form_data):
     """Test FIX Protocol logon."""
     try:
         import socket
-        import ssl
         import time
         
         host = form_data.get("host", "localhost")
@@ -50,7 +49,8 @@ def authenticate(form_data):
         sock.settimeout(10)
         
         if use_ssl:
-            context = ssl.create_default_context()
+            from auth_utils import create_ssl_context
+            context = create_ssl_context()
             sock = context.wrap_socket(sock, server_hostname=host)
         
         sock.connect((host, port))
@@ -21,6 +21,12 @@ form_fields = [
     {"name": "hints", "type": "readonly", "label": "Hints", "default": "FTP: 21, FTPS Implicit: 990, SFTP: 22. anonymous / anonymous@"},
 ]
 
+# Failed logins each server allowed on one control connection before it
+# hung up (vsftpd max_login_fails, ProFTPD MaxLoginAttempts...), learned
+# by authenticate_sweep(): {(host, port): attempts}. The largest count seen
+# wins, so a connection dropped early (idle timeout) does not lower it.
+_login_limits = {}
+
 
 def authenticate(form_data):
     """
@@ -61,22 +67,8 @@ def authenticate(form_data):
             }
             
             if private_key:
-                try:
-                    pkey = paramiko.RSAKey.from_private_key_file(
-                        private_key, 
-                        password=key_passphrase if key_passphrase else None
-                    )
-                except:
-                    try:
-                        pkey = paramiko.Ed25519Key.from_private_key_file(
-                            private_key,
-                            password=key_passphrase if key_passphrase else None
-                        )
-                    except:
-                        pkey = paramiko.ECDSAKey.from_private_key_file(
-                            private_key,
-                            password=key_passphrase if key_passphrase else None
-                        )
+                from key_loader import load_private_key
+                pkey = load_private_key(private_key, key_passphrase if key_passphrase else None)
                 connect_kwargs['pkey'] = pkey
             else:
                 connect_kwargs['password'] = password
@@ -98,43 +90,130 @@ def authenticate(form_data):
             return False, f"SFTP error: {e}"
     
     else:  # FTP/FTPS
+        sweep = authenticate_sweep([form_data])
         try:
-            from ftplib import FTP, FTP_TLS
-        except ImportError:
-            return False, "ftplib not available"
-        
+            return next(sweep)
+        finally:
+            sweep.close()
+
+
+def _ftp_connect(protocol, host, port_num):
+    """Open a control connection, with TLS set up for FTPS."""
+    from ftplib import FTP, FTP_TLS
+    
+    if protocol == "FTPS (Implicit)":
+        from auth_utils import create_ssl_context
+        context = create_ssl_context(verify_cert=False)
+        ftp = FTP_TLS(context=context)
+        ftp.connect(host, port_num, timeout=10)
+    elif protocol == "FTPS (Explicit)":
+        ftp = FTP_TLS()
+        ftp.connect(host, port_num, timeout=10)
+        ftp.auth()
+        ftp.prot_p()
+    else:
+        ftp = FTP()
+        ftp.connect(host, port_num, timeout=10)
+    return ftp
+
+
+def _ftp_close(ftp):
+    """Close a control connection without waiting for the server."""
+    if ftp is not None:
         try:
-            port_num = int(port) if port else 21
-            
-            if protocol == "FTPS (Implicit)":
-                import ssl
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
-                ftp = FTP_TLS(context=context)
-                ftp.connect(host, port_num, timeout=10)
-            elif protocol == "FTPS (Explicit)":
-                ftp = FTP_TLS()
-                ftp.connect(host, port_num, timeout=10)
-                ftp.auth()
-                ftp.prot_p()
-            else:
-                ftp = FTP()
-                ftp.connect(host, port_num, timeout=10)
-            
-            ftp.login(username, password)
-            
-            # Get welcome message and current directory
-            welcome = ftp.getwelcome()
-            pwd = ftp.pwd()
-            
-            ftp.quit()
+            ftp.close()
+        except Exception:
+            pass
+    return None
+
+
+def authenticate_sweep(attempts):
+    """
+    Try several credentials, reusing one FTP control connection where possible.
+    
+    Most servers accept another USER/PASS after a 530, so successive
+    attempts against the same server share one control connection (and,
+    for FTPS, one TLS handshake). When the server hangs up after too many
+    failures, the attempt is retried once on a new connection and the
+    number of failures it allowed is remembered for that server, so later
+    connections are replaced just before the limit. SFTP attempts run one
+    connection each, as in authenticate().
+    
+    Args:
+        attempts (iterable): Form data dicts, one per attempt
+        
+    Yields:
+        tuple: (success: bool, message: str) for each attempt, in order
+    """
+    try:
+        from ftplib import error_perm, error_temp
+    except ImportError:
+        for _ in attempts:
+            yield False, "ftplib not available"
+        return
+    
+    ftp = None
+    ftp_key = None
+    failures = 0  # Failed logins on the current connection
+    try:
+        for form_data in attempts:
+            host = form_data.get('host', '').strip()
+            port = form_data.get('port', '').strip()
+            protocol = form_data.get('protocol', 'FTP')
+            username = form_data.get('username', '').strip()
+            password = form_data.get('password', '')
             
-            return True, f"Successfully authenticated to {protocol} at {host}:{port_num}\nDirectory: {pwd}\n{welcome}"
+            if protocol == "SFTP" or not host or not username:
+                yield authenticate(form_data)
+                continue
             
-        except Exception as e:
-            error_msg = str(e)
-            if "530" in error_msg or "Login" in error_msg:
-                return False, f"Authentication failed: {e}"
-            return False, f"FTP error: {e}"
-
+            try:
+                port_num = int(port) if port else 21
+                server = (host, port_num)
+                key = (protocol, host, port_num)
+                limit = _login_limits.get(server)
+                if ftp is not None and (key != ftp_key or (limit is not None and failures >= limit)):
+                    ftp = _ftp_close(ftp)
+                
+                # Reconnect once if the server dropped the connection
+                for retry in (False, True):
+                    reused = ftp is not None
+                    if ftp is None:
+                        ftp = _ftp_connect(protocol, host, port_num)
+                        ftp_key = key
+                        failures = 0
+                    try:
+                        ftp.login(username, password)
+                        break
+                    except error_perm as e:
+                        if str(e).startswith('530'):
+                            failures += 1
+                        raise
+                    except (EOFError, OSError, error_temp):
+                        # A hang-up or 421 on a connection that already had
+                        # failures: the server's limit, not an answer to this attempt
+                        if retry or not reused:
+                            raise
+                        _login_limits[server] = max(failures, _login_limits.get(server, 0))
+                        ftp = _ftp_close(ftp)
+                
+                # Get welcome message and current directory
+                welcome = ftp.getwelcome()
+                pwd = ftp.pwd()
+                
+                ftp.quit()
+                ftp = None
+                
+                yield True, f"Successfully authenticated to {protocol} at {host}:{port_num}\nDirectory: {pwd}\n{welcome}"
+                
+            except Exception as e:
+                # After a 530 the connection takes the next USER/PASS
+                if not str(e).startswith('530'):
+                    ftp = _ftp_close(ftp)
+                error_msg = str(e)
+                if "530" in error_msg or "Login" in error_msg:
+                    yield False, f"Authentication failed: {e}"
+                else:
+                    yield False, f"FTP error: {e}"
+    finally:
+        _ftp_close(ftp)
@@ -17,7 +17,6 @@ def authenticate(form_data):
     """Test IMS Connect authentication."""
     try:
         import socket
-        import ssl
         
         host = form_data.get("host", "")
         port = int(form_data.get("port", 9999))
@@ -29,9 +28,8 @@ def authenticate(form_data):
         sock.settimeout(30)
         
         if use_ssl:
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
+            from auth_utils import create_ssl_context
+            context = create_ssl_context(verify_cert=False)
             sock = context.wrap_socket(sock, server_hostname=host)
         
         sock.connect((host, port))
@@ -8,6 +8,9 @@
 
 module_description = "IBM MQ (MQ)"
 
+# Native driver - run in a worker process (see process_lane.py)
+execution_lane = "process"
+
 form_fields = [
     {"name": "host", "type": "text", "label": "Host", "default": "localhost"},
     {"name": "port", "type": "text", "label": "Port", "default": "1414",
@@ -24,134 +24,218 @@ form_fields = [
     {"name": "hints", "type": "readonly", "label": "Hints", "default": "LDAPS: 636, LDAP: 389. cn=admin,dc=example,dc=com / admin"},
 ]
 
+verification_depths = ["auth-only", "identity", "full"]
 
-def authenticate(form_data):
+
+# rootDSE and schema are read once per server and reused for this long
+SERVER_INFO_TTL = 300.0
+SERVER_INFO_CACHE_SIZE = 16  # AD schemas run to megabytes
+
+# {(host, port, use_ssl): (expires, DsaInfo, SchemaInfo)}, oldest first; only
+# single dict operations are used on it, so threads need no lock
+_server_info_cache = {}
+
+
+def _attach_server_info(server, conn, cache_key):
+    """Give the server its rootDSE and schema, from the cache or read over conn."""
+    import time
+    
+    now = time.monotonic()
+    cached = _server_info_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        server.attach_dsa_info(cached[1])
+        server.attach_schema_info(cached[2])
+        return
+    
+    server.get_info_from_server(conn)
+    _server_info_cache.pop(cache_key, None)
+    _server_info_cache[cache_key] = (now + SERVER_INFO_TTL, server.info, server.schema)
+    for stale in list(_server_info_cache)[:-SERVER_INFO_CACHE_SIZE]:
+        _server_info_cache.pop(stale, None)
+
+
+def authenticate_sweep(attempts):
     """
-    Attempt to authenticate to LDAP/Active Directory.
+    Try several credentials, rebinding on one LDAP connection where possible.
+    
+    Successive attempts against the same server share one connection, so
+    the TCP connect and the LDAPS/StartTLS handshake happen once and each
+    credential costs a single bind. A new connection is opened when the
+    server settings change or the server drops the connection.
     
     Args:
-        form_data (dict): Form field values
+        attempts (iterable): Form data dicts, one per attempt
         
-    Returns:
-        tuple: (success: bool, message: str)
+    Yields:
+        tuple: (success: bool, message: str) for each attempt, in order
     """
     try:
         import ldap3
-        from ldap3 import Server, Connection, ALL, NTLM, SASL, KERBEROS
+        from ldap3 import Server, Connection, ALL, NTLM, SASL, SIMPLE, KERBEROS
         from ldap3.core.exceptions import LDAPException, LDAPBindError
     except ImportError:
-        return False, "ldap3 package not installed. Run: pip install ldap3"
-    
-    host = form_data.get('host', '').strip()
-    port = form_data.get('port', '').strip()
-    use_ssl = form_data.get('use_ssl', False)
-    use_starttls = form_data.get('use_starttls', False)
-    bind_type = form_data.get('bind_type', 'Simple')
-    bind_dn = form_data.get('bind_dn', '').strip()
-    password = form_data.get('password', '')
-    base_dn = form_data.get('base_dn', '').strip()
-    verify_cert = form_data.get('verify_cert', False)
-    ca_cert = form_data.get('ca_cert', '').strip()
-    
-    if not host:
-        return False, "Server is required"
-    if not bind_dn:
-        return False, "Bind DN / Username is required"
+        for _ in attempts:
+            yield False, "ldap3 package not installed. Run: pip install ldap3"
+        return
+    from auth_utils import DEPTH_FULL, DEPTH_IDENTITY, verification_depth
     
+    conn = None
+    conn_key = None
     try:
-        # Determine port
-        if port:
-            port_num = int(port)
-        else:
-            port_num = 636 if use_ssl else 389
-        
-        # Setup TLS if needed
-        tls_config = None
-        if use_ssl or use_starttls:
-            from ldap3 import Tls
-            import ssl as ssl_module
+        for form_data in attempts:
+            host = form_data.get('host', '').strip()
+            port = form_data.get('port', '').strip()
+            use_ssl = form_data.get('use_ssl', False)
+            use_starttls = form_data.get('use_starttls', False)
+            bind_type = form_data.get('bind_type', 'Simple')
+            bind_dn = form_data.get('bind_dn', '').strip()
+            password = form_data.get('password', '')
+            base_dn = form_data.get('base_dn', '').strip()
+            verify_cert = form_data.get('verify_cert', False)
+            ca_cert = form_data.get('ca_cert', '').strip()
+            depth = verification_depth(form_data)
             
-            tls_config = Tls(
-                validate=ssl_module.CERT_REQUIRED if verify_cert else ssl_module.CERT_NONE,
-                ca_certs_file=ca_cert if ca_cert else None,
-            )
-        
-        # Create server object
-        server = Server(
-            host,
-            port=port_num,
-            use_ssl=use_ssl,
-            get_info=ALL,
-            tls=tls_config,
-            connect_timeout=10
-        )
-        
-        # Setup authentication
-        auth_method = None
-        if bind_type == "NTLM":
-            auth_method = NTLM
-        elif bind_type == "Kerberos (GSSAPI)":
-            auth_method = SASL
-            sasl_mechanism = KERBEROS
-        
-        # Create connection
-        if bind_type == "Kerberos (GSSAPI)":
-            conn = Connection(
-                server,
-                authentication=SASL,
-                sasl_mechanism=KERBEROS,
-                auto_bind=False
-            )
-        elif bind_type == "NTLM":
-            conn = Connection(
-                server,
-                user=bind_dn,
-                password=password,
-                authentication=NTLM,
-                auto_bind=False
-            )
-        else:  # Simple
-            conn = Connection(
-                server,
-                user=bind_dn,
-                password=password,
-                auto_bind=False
-            )
-        
-        # StartTLS if requested
-        if use_starttls and not use_ssl:
-            conn.open()
-            if not conn.start_tls():
-                return False, "StartTLS failed"
-        
-        # Attempt bind
-        if not conn.bind():
-            return False, f"Bind failed: {conn.result}"
-        
-        # Get server info
-        server_info = []
-        if server.info:
-            if hasattr(server.info, 'vendor_name') and server.info.vendor_name:
-                server_info.append(f"Vendor: {server.info.vendor_name}")
-            if hasattr(server.info, 'vendor_version') and server.info.vendor_version:
-                server_info.append(f"Version: {server.info.vendor_version}")
-        
-        # Try a search if base_dn provided
-        search_result = ""
-        if base_dn:
-            conn.search(base_dn, '(objectClass=*)', attributes=['*'], size_limit=1)
-            if conn.entries:
-                search_result = f"\nSearch test: Found {len(conn.entries)} entry in {base_dn}"
-        
-        conn.unbind()
-        
-        info_str = "\n".join(server_info) if server_info else ""
-        return True, f"Successfully authenticated to LDAP server at {host}:{port_num}\n{info_str}{search_result}"
-        
-    except LDAPBindError as e:
-        return False, f"LDAP bind error: {e}"
-    except LDAPException as e:
-        return False, f"LDAP error: {e}"
-    except Exception as e:
-        return False, f"Error: {e}"
+            if not host:
+                yield False, "Server is required"
+                continue
+            if not bind_dn:
+                yield False, "Bind DN / Username is required"
+                continue
+            
+            try:
+                # Determine port
+                if port:
+                    port_num = int(port)
+                else:
+                    port_num = 636 if use_ssl else 389
+                
+                key = (host, port_num, use_ssl, use_starttls, verify_cert, ca_cert)
+                if conn is not None and (key != conn_key or conn.closed):
+                    conn = _discard(conn)
+                
+                # Reconnect once if the server dropped the connection
+                for retry in (False, True):
+                    reused = conn is not None
+                    if conn is None:
+                        # Setup TLS if needed
+                        tls_config = None
+                        if use_ssl or use_starttls:
+                            # Shared TLS layer: cached context and session resumption
+                            from auth_utils import ldap3_tls
+                            
+                            tls_config = ldap3_tls(
+                                verify_cert=verify_cert,
+                                ca_file=ca_cert if ca_cert else None,
+                            )
+                        
+                        # rootDSE and schema are read on demand, see _attach_server_info()
+                        server = Server(
+                            host,
+                            port=port_num,
+                            use_ssl=use_ssl,
+                            get_info=ALL,
+                            tls=tls_config,
+                            connect_timeout=10
+                        )
+                        conn = Connection(server, auto_bind=False)
+                        conn_key = key
+                        
+                        # StartTLS if requested
+                        if use_starttls and not use_ssl:
+                            conn.open(read_server_info=False)
+                            if not conn.start_tls(read_server_info=False):
+                                conn = _discard(conn)
+                                break
+                    
+                    try:
+                        if bind_type == "Kerberos (GSSAPI)":
+                            bound = conn.rebind(authentication=SASL, sasl_mechanism=KERBEROS,
+                                                read_server_info=False)
+                        else:
+                            bound = conn.rebind(user=bind_dn, password=password,
+                                                authentication=NTLM if bind_type == "NTLM" else SIMPLE,
+                                                read_server_info=False)
+                        break
+                    except LDAPException:
+                        # A rejected bind returns False; only a connection
+                        # the server has since closed is worth a second try
+                        if retry or not reused or not conn.closed:
+                            raise
+                        conn = _discard(conn)
+                
+                if conn is None:
+                    yield False, "StartTLS failed"
+                    continue
+                
+                if not bound:
+                    yield False, f"Bind failed: {conn.result}"
+                    continue
+                
+                server = conn.server
+                if depth != DEPTH_FULL:
+                    identity = ""
+                    if depth == DEPTH_IDENTITY:
+                        # RFC 4532 "Who am I?" names the account the server bound
+                        whoami = conn.extend.standard.who_am_i()
+                        if whoami:
+                            identity = f"\nBound as: {whoami}"
+                    yield True, f"Successfully authenticated to LDAP server at {host}:{port_num}{identity}"
+                    continue
+                
+                # Get server info
+                _attach_server_info(server, conn, (host.lower(), port_num, use_ssl))
+                server_info = []
+                if server.info:
+                    if hasattr(server.info, 'vendor_name') and server.info.vendor_name:
+                        server_info.append(f"Vendor: {server.info.vendor_name}")
+                    if hasattr(server.info, 'vendor_version') and server.info.vendor_version:
+                        server_info.append(f"Version: {server.info.vendor_version}")
+                
+                # Try a search if base_dn provided
+                search_result = ""
+                if base_dn:
+                    conn.search(base_dn, '(objectClass=*)', attributes=['*'], size_limit=1)
+                    if conn.entries:
+                        search_result = f"\nSearch test: Found {len(conn.entries)} entry in {base_dn}"
+                
+                info_str = "\n".join(server_info) if server_info else ""
+                yield True, f"Successfully authenticated to LDAP server at {host}:{port_num}\n{info_str}{search_result}"
+                
+            except LDAPBindError as e:
+                conn = _discard(conn)
+                yield False, f"LDAP bind error: {e}"
+            except LDAPException as e:
+                conn = _discard(conn)
+                yield False, f"LDAP error: {e}"
+            except Exception as e:
+                conn = _discard(conn)
+                yield False, f"Error: {e}"
+    finally:
+        _discard(conn)
+
+
+def _discard(conn):
+    """Close a connection, ignoring errors; returns None."""
+    if conn is not None:
+        try:
+            conn.unbind()
+        except Exception:
+            pass
+    return None
 
+
+def authenticate(form_data):
+    """
+    Attempt to authenticate to LDAP/Active Directory.
+    
+    Args:
+        form_data (dict): Form field values
+        
+    Returns:
+        tuple: (success: bool, message: str)
+    """
+    sweep = authenticate_sweep([form_data])
+    try:
+        return next(sweep)
+    finally:
+        sweep.close()
@@ -19,6 +19,8 @@ form_fields = [
     {"name": "hints", "type": "readonly", "label": "Hints", "default": "TLS: 11212, Non-TLS: 11211. SASL: memcached / memcached"},
 ]
 
+verification_depths = ["auth-only", "identity", "full"]
+
 
 def authenticate(form_data):
     """
@@ -29,6 +31,7 @@ def authenticate(form_data):
         from pymemcache.client.hash import HashClient
     except ImportError:
         return False, "pymemcache package not installed. Run: pip install pymemcache"
+    from auth_utils import DEPTH_FULL, verification_depth
     
     host = form_data.get('host', '').strip()
     port = form_data.get('port', '').strip()
@@ -36,6 +39,7 @@ def authenticate(form_data):
     use_sasl = form_data.get('use_sasl', False)
     username = form_data.get('username', '').strip()
     password = form_data.get('password', '')
+    depth = verification_depth(form_data)
     
     if not host:
         return False, "Host is required"
@@ -49,14 +53,18 @@ def authenticate(form_data):
         }
         
         if use_tls:
-            import ssl
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            from auth_utils import create_ssl_context
+            ssl_context = create_ssl_context(verify_cert=False)
             client_kwargs['tls_context'] = ssl_context
         
         client = Client((host, port_num), **client_kwargs)
         
+        if depth != DEPTH_FULL:
+            # "version" is the cheapest command that needs an accepted connection
+            version = client.version().decode()
+            client.close()
+            return True, f"Successfully connected to Memcached {version}"
+        
         # Get stats to verify connection
         stats = client.stats()
         
@@ -21,79 +21,118 @@ form_fields = [
 ]
 
 
-def authenticate(form_data):
+def _read_form(form_data):
     """
-    Attempt to authenticate to Memphis.
+    Read the form values used by both authenticate() and authenticate_async().
+    
+    Returns:
+        tuple: (fields: dict, error: str or None)
+    """
+    fields = {
+        'host': form_data.get('host', '').strip(),
+        'port': form_data.get('port', '').strip(),
+        'http_port': form_data.get('http_port', '').strip(),
+        'protocol': form_data.get('protocol', 'Memphis SDK'),
+        'username': form_data.get('username', '').strip(),
+        'password': form_data.get('password', ''),
+        'account_id': form_data.get('account_id', '1').strip(),
+    }
+    if not fields['host']:
+        return fields, "Host is required"
+    return fields, None
+
+
+def _authenticate_rest(fields):
+    """
+    Attempt to authenticate to the Memphis REST API.
     """
-    host = form_data.get('host', '').strip()
-    port = form_data.get('port', '').strip()
-    http_port = form_data.get('http_port', '').strip()
-    protocol = form_data.get('protocol', 'Memphis SDK')
-    username = form_data.get('username', '').strip()
-    password = form_data.get('password', '')
-    account_id = form_data.get('account_id', '1').strip()
+    try:
+        import requests
+    except ImportError:
+        return False, "requests package not installed"
     
-    if not host:
-        return False, "Host is required"
+    host = fields['host']
+    http_port = fields['http_port']
+    url = f"http://{host}:{http_port}/api/auth/authenticate"
     
-    if protocol == "REST API":
-        try:
-            import requests
-        except ImportError:
-            return False, "requests package not installed"
+    try:
+        response = requests.post(url, json={
+            "username": fields['username'],
+            "password": fields['password']
+        }, timeout=10)
         
-        url = f"http://{host}:{http_port}/api/auth/authenticate"
-        
-        try:
-            response = requests.post(url, json={
-                "username": username,
-                "password": password
-            }, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return True, f"Successfully authenticated to Memphis at {host}:{http_port}"
-            elif response.status_code == 401:
-                return False, "Authentication failed: Invalid credentials"
-            else:
-                return False, f"REST API returned status {response.status_code}"
-        except Exception as e:
-            return False, f"REST API error: {e}"
+        if response.status_code == 200:
+            data = response.json()
+            return True, f"Successfully authenticated to Memphis at {host}:{http_port}"
+        elif response.status_code == 401:
+            return False, "Authentication failed: Invalid credentials"
+        else:
+            return False, f"REST API returned status {response.status_code}"
+    except Exception as e:
+        return False, f"REST API error: {e}"
+
+
+async def authenticate_async(form_data):
+    """
+    Attempt to authenticate to Memphis (coroutine, for a shared event loop).
+    """
+    import asyncio
     
-    else:  # Memphis SDK
-        try:
-            from memphis import Memphis
-            import asyncio
-        except ImportError:
-            return False, "memphis-py package not installed. Run: pip install memphis-py"
-        
-        async def connect_memphis():
-            memphis = Memphis()
-            await memphis.connect(
-                host=host,
-                username=username,
-                password=password,
-                account_id=int(account_id),
-                port=int(port),
-                reconnect=False,
-                max_reconnect=1,
-                connection_timeout=10
-            )
-            await memphis.close()
-            return True
-        
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(connect_memphis())
-                return True, f"Successfully authenticated to Memphis at {host}:{port}"
-            finally:
-                loop.close()
-                
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "authentication" in error_msg or "credentials" in error_msg:
-                return False, f"Authentication failed: {e}"
-            return False, f"Memphis error: {e}"
+    fields, error = _read_form(form_data)
+    if error:
+        return False, error
+    
+    if fields['protocol'] == "REST API":
+        # Blocking requests call - run it on the loop's executor
+        return await asyncio.to_thread(_authenticate_rest, fields)
+    
+    # Memphis SDK
+    try:
+        from memphis import Memphis
+    except ImportError:
+        return False, "memphis-py package not installed. Run: pip install memphis-py"
+    
+    host = fields['host']
+    port = fields['port']
+    try:
+        memphis = Memphis()
+        await memphis.connect(
+            host=host,
+            username=fields['username'],
+            password=fields['password'],
+            account_id=int(fields['account_id']),
+            port=int(port),
+            reconnect=False,
+            max_reconnect=1,
+            connection_timeout=10
+        )
+        await memphis.close()
+        return True, f"Successfully authenticated to Memphis at {host}:{port}"
+            
+    except Exception as e:
+        error_msg = str(e).lower()
+        if "authentication" in error_msg or "credentials" in error_msg:
+            return False, f"Authentication failed: {e}"
+        return False, f"Memphis error: {e}"
+
 
+def authenticate(form_data):
+    """
+    Attempt to authenticate to Memphis.
+    """
+    import asyncio
+    
+    fields, error = _read_form(form_data)
+    if error:
+        return False, error
+    
+    if fields['protocol'] == "REST API":
+        # No event loop needed for the blocking REST call
+        return _authenticate_rest(fields)
+    
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(authenticate_async(form_data))
+    finally:
+        loop.close()
@@ -83,10 +83,8 @@ def authenticate(form_data):
         sock.settimeout(10)
         
         if use_ssl:
-            import ssl
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
+            from auth_utils import create_ssl_context
+            context = create_ssl_context(verify_cert=False)
             sock = context.wrap_socket(sock, server_hostname=host)
         
         sock.connect((host, port))
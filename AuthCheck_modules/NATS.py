@@ -22,13 +22,12 @@ form_fields = [
 ]
 
 
-def authenticate(form_data):
+async def authenticate_async(form_data):
     """
-    Attempt to authenticate to NATS.
+    Attempt to authenticate to NATS (coroutine, for a shared event loop).
     """
     try:
         import nats
-        import asyncio
     except ImportError:
         return False, "nats-py package not installed. Run: pip install nats-py"
     
@@ -44,48 +43,35 @@ def authenticate(form_data):
     if not servers:
         return False, "Servers is required"
     
-    async def connect_nats():
-        connect_kwargs = {
-            'servers': servers.split(','),
-            'connect_timeout': 10,
-            'max_reconnect_attempts': 1,
-        }
-        
-        if auth_type == "Username/Password" and username:
-            connect_kwargs['user'] = username
-            connect_kwargs['password'] = password
-        elif auth_type == "Token" and token:
-            connect_kwargs['token'] = token
-        elif auth_type == "NKey" and nkey_seed:
-            connect_kwargs['nkeys_seed'] = nkey_seed
-        elif auth_type == "JWT/Creds" and creds_file:
-            connect_kwargs['user_credentials'] = creds_file
-        
+    connect_kwargs = {
+        'servers': servers.split(','),
+        'connect_timeout': 10,
+        'max_reconnect_attempts': 1,
+    }
+    
+    if auth_type == "Username/Password" and username:
+        connect_kwargs['user'] = username
+        connect_kwargs['password'] = password
+    elif auth_type == "Token" and token:
+        connect_kwargs['token'] = token
+    elif auth_type == "NKey" and nkey_seed:
+        connect_kwargs['nkeys_seed'] = nkey_seed
+    elif auth_type == "JWT/Creds" and creds_file:
+        connect_kwargs['user_credentials'] = creds_file
+    
+    try:
         if tls_ca:
-            import ssl
-            ssl_ctx = ssl.create_default_context()
-            ssl_ctx.load_verify_locations(tls_ca)
+            from auth_utils import create_ssl_context
+            ssl_ctx = create_ssl_context(ca_file=tls_ca)
             connect_kwargs['tls'] = ssl_ctx
         
         nc = await nats.connect(**connect_kwargs)
         
-        server_info = {
-            'server_id': nc.connected_server_id,
-            'server_name': nc._server_info.get('server_name', 'unknown'),
-            'version': nc._server_info.get('version', 'unknown'),
-        }
+        server_name = nc._server_info.get('server_name', 'unknown')
+        version = nc._server_info.get('version', 'unknown')
         
         await nc.close()
-        return server_info
-    
-    try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            info = loop.run_until_complete(connect_nats())
-            return True, f"Successfully connected to NATS {info['version']}\nServer: {info['server_name']}"
-        finally:
-            loop.close()
+        return True, f"Successfully connected to NATS {version}\nServer: {server_name}"
             
     except Exception as e:
         error_msg = str(e)
@@ -93,3 +79,16 @@ def authenticate(form_data):
             return False, f"Authentication failed: {e}"
         return False, f"NATS error: {e}"
 
+
+def authenticate(form_data):
+    """
+    Attempt to authenticate to NATS.
+    """
+    import asyncio
+    
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(authenticate_async(form_data))
+    finally:
+        loop.close()
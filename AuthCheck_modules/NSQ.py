@@ -69,16 +69,14 @@ def authenticate(form_data):
             return False, f"NSQ HTTP error: {e}"
     else:
         import socket
-        import ssl
         
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(10)
             
             if use_tls:
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
+                from auth_utils import create_ssl_context
+                context = create_ssl_context(verify_cert=False)
                 sock = context.wrap_socket(sock, server_hostname=host)
             
             sock.connect((host, int(nsqd_tcp_port)))
@@ -52,14 +52,13 @@ def authenticate(form_data):
         
         ssl_options = None
         if use_ssl:
-            import ssl
-            context = ssl.create_default_context()
-            if ssl_ca:
-                context.load_verify_locations(ssl_ca)
-            if ssl_cert and ssl_key:
-                context.load_cert_chain(ssl_cert, ssl_key)
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
+            from auth_utils import create_ssl_context
+            context = create_ssl_context(
+                verify_cert=False,
+                ca_file=ssl_ca or None,
+                cert_file=ssl_cert if ssl_cert and ssl_key else None,
+                key_file=ssl_key if ssl_cert and ssl_key else None,
+            )
             ssl_options = pika.SSLOptions(context, host)
         
         parameters = pika.ConnectionParameters(
@@ -23,6 +23,8 @@ form_fields = [
     {"name": "hints", "type": "readonly", "label": "Hints", "default": "TLS: 6380, Non-TLS: 6379. Default: no auth, ACL: default / (empty)"},
 ]
 
+verification_depths = ["auth-only", "identity", "full"]
+
 
 def authenticate(form_data):
     """
@@ -38,6 +40,7 @@ def authenticate(form_data):
         import redis
     except ImportError:
         return False, "redis package not installed. Run: pip install redis"
+    from auth_utils import DEPTH_AUTH_ONLY, verification_depth
     
     host = form_data.get('host', '').strip()
     port = form_data.get('port', '').strip()
@@ -49,6 +52,7 @@ def authenticate(form_data):
     ssl_certfile = form_data.get('ssl_certfile', '').strip() or None
     ssl_keyfile = form_data.get('ssl_keyfile', '').strip() or None
     ssl_ca_certs = form_data.get('ssl_ca_certs', '').strip() or None
+    depth = verification_depth(form_data)
     
     if not host:
         return False, "Host is required"
@@ -90,6 +94,10 @@ def authenticate(form_data):
         response = r.ping()
         
         if response:
+            if depth == DEPTH_AUTH_ONLY:
+                r.close()
+                return True, f"Successfully authenticated to Redis at {host}:{port} (db: {db_num})"
+            
             # Get some server info
             info = r.info('server')
             redis_version = info.get('redis_version', 'unknown')
@@ -8,6 +8,9 @@
 
 module_description = "SAP ERP/S4HANA (ERP)"
 
+# Native driver - run in a worker process (see process_lane.py)
+execution_lane = "process"
+
 form_fields = [
     {"name": "host", "type": "text", "label": "SAP Host"},
     {"name": "system_number", "type": "text", "label": "System Number", "default": "00"},
@@ -68,10 +68,8 @@ Content-Length: 0\r
         else:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             if transport == 'TLS':
-                import ssl
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
+                from auth_utils import create_ssl_context
+                context = create_ssl_context(verify_cert=False)
                 sock = context.wrap_socket(sock, server_hostname=host)
         
         sock.settimeout(10)
@@ -18,120 +18,204 @@ form_fields = [
     {"name": "private_key", "type": "file", "label": "Private Key File", "filter": "Key Files (*.pem *.key id_rsa id_ed25519);;All Files (*)"},
     {"name": "known_hosts", "type": "file", "label": "Known Hosts File", "filter": "Known Hosts (known_hosts);;All Files (*)"},
     {"name": "verify_host_key", "type": "checkbox", "label": "Verify Host Key"},
+    {"name": "run_test_command", "type": "checkbox", "label": "Run Test Command After Login", "default": True},
     {"name": "hints", "type": "readonly", "label": "Hints", "default": "root / root, admin / admin, ubuntu / ubuntu, ec2-user / (key)"},
 ]
 
+# SSH servers disconnect when the username changes on a connection, so the
+# batch runner gives each authenticate_sweep() call a single username
+sweep_per_username = True
 
-def authenticate(form_data):
+
+def _open_transport(paramiko, host, port_num, verify_host_key, known_hosts):
     """
-    Attempt to authenticate via SSH.
-    
-    Args:
-        form_data (dict): Form field values
-        
+    Connect and finish key exchange, without authenticating.
+
     Returns:
-        tuple: (success: bool, message: str)
+        paramiko.Transport: Connected transport
     """
+    import socket
+
+    sock = socket.create_connection((host, port_num), timeout=10)
+    transport = paramiko.Transport(sock)
     try:
-        import paramiko
-    except ImportError:
-        return False, "paramiko package not installed. Run: pip install paramiko"
-    
-    host = form_data.get('host', '').strip()
-    port = form_data.get('port', '').strip()
-    username = form_data.get('username', '').strip()
-    auth_type = form_data.get('auth_type', 'Password')
-    password = form_data.get('password', '')
-    private_key_path = form_data.get('private_key', '').strip()
-    known_hosts = form_data.get('known_hosts', '').strip()
-    verify_host_key = form_data.get('verify_host_key', False)
-    
-    if not host:
-        return False, "Host is required"
-    if not username:
-        return False, "Username is required"
-    
-    try:
-        client = paramiko.SSHClient()
-        
+        transport.start_client(timeout=10)
+
         # Host key verification
         if verify_host_key:
+            host_keys = paramiko.HostKeys()
             if known_hosts:
-                client.load_host_keys(known_hosts)
+                host_keys.load(known_hosts)
             else:
-                client.load_system_host_keys()
-            client.set_missing_host_key_policy(paramiko.RejectPolicy())
-        else:
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        
-        port_num = int(port) if port else 22
-        
-        # Prepare authentication
-        connect_kwargs = {
-            'hostname': host,
-            'port': port_num,
-            'username': username,
-            'timeout': 10,
-            'allow_agent': False,
-            'look_for_keys': False,
-        }
-        
-        if auth_type == "Password":
-            connect_kwargs['password'] = password
-        elif auth_type == "Private Key":
-            if not private_key_path:
-                return False, "Private key file is required for key-based authentication"
-            # Try to load the key
-            try:
-                pkey = paramiko.RSAKey.from_private_key_file(private_key_path)
-            except paramiko.ssh_exception.PasswordRequiredException:
-                return False, "Private key requires a passphrase - use 'Private Key + Password'"
-            except:
+                import os
+                system_known_hosts = os.path.expanduser('~/.ssh/known_hosts')
+                if os.path.exists(system_known_hosts):
+                    host_keys.load(system_known_hosts)
+            server_key = transport.get_remote_server_key()
+            lookup = host if port_num == 22 else f"[{host}]:{port_num}"
+            if not host_keys.check(lookup, server_key):
+                raise paramiko.SSHException(f"Server '{lookup}' not found in known_hosts")
+    except BaseException:
+        transport.close()
+        raise
+    return transport
+
+
+def _run_test_command(transport):
+    """Run a simple command on an authenticated transport and return its output."""
+    channel = transport.open_session(timeout=10)
+    try:
+        channel.settimeout(10)
+        channel.exec_command('echo "auth_test"')
+        output = b''
+        while True:
+            chunk = channel.recv(4096)
+            if not chunk:
+                break
+            output += chunk
+        return output.decode(errors='replace').strip()
+    finally:
+        channel.close()
+
+
+def authenticate_sweep(attempts):
+    """
+    Try several credentials, reusing one SSH connection where possible.
+
+    Successive attempts against the same server share one transport, so
+    the TCP connect and key exchange happen once instead of per attempt.
+    A new connection is opened when the target or username changes (servers
+    refuse a second username on one connection), after a successful login,
+    or when the server has closed a reused connection (e.g. after
+    MaxAuthTries).
+
+    Args:
+        attempts (iterable): Form data dicts, one per attempt
+
+    Yields:
+        tuple: (success: bool, message: str) for each attempt, in order
+    """
+    try:
+        import paramiko
+    except ImportError:
+        for _ in attempts:
+            yield False, "paramiko package not installed. Run: pip install paramiko"
+        return
+
+    transport = None
+    transport_key = None
+    try:
+        for form_data in attempts:
+            host = form_data.get('host', '').strip()
+            port = form_data.get('port', '').strip()
+            username = form_data.get('username', '').strip()
+            auth_type = form_data.get('auth_type', 'Password')
+            password = form_data.get('password', '')
+            private_key_path = form_data.get('private_key', '').strip()
+            known_hosts = form_data.get('known_hosts', '').strip()
+            verify_host_key = form_data.get('verify_host_key', False)
+            run_test_command = form_data.get('run_test_command', True)
+
+            if not host:
+                yield False, "Host is required"
+                continue
+            if not username:
+                yield False, "Username is required"
+                continue
+
+            # Prepare authentication
+            pkey = None
+            if auth_type in ("Private Key", "Private Key + Password"):
+                if not private_key_path:
+                    if auth_type == "Private Key":
+                        yield False, "Private key file is required for key-based authentication"
+                    else:
+                        yield False, "Private key file is required"
+                    continue
                 try:
-                    pkey = paramiko.Ed25519Key.from_private_key_file(private_key_path)
-                except:
-                    try:
-                        pkey = paramiko.ECDSAKey.from_private_key_file(private_key_path)
-                    except:
-                        pkey = paramiko.DSSKey.from_private_key_file(private_key_path)
-            connect_kwargs['pkey'] = pkey
-        elif auth_type == "Private Key + Password":
-            if not private_key_path:
-                return False, "Private key file is required"
+                    from key_loader import load_private_key
+                    pkey = load_private_key(private_key_path,
+                                            password if auth_type == "Private Key + Password" else None)
+                except paramiko.ssh_exception.PasswordRequiredException:
+                    yield False, "Private key requires a passphrase - use 'Private Key + Password'"
+                    continue
+                except Exception as e:
+                    yield False, f"Error: {e}"
+                    continue
+
             try:
-                pkey = paramiko.RSAKey.from_private_key_file(private_key_path, password=password)
-            except:
-                try:
-                    pkey = paramiko.Ed25519Key.from_private_key_file(private_key_path, password=password)
-                except:
+                port_num = int(port) if port else 22
+                key = (host, port_num, verify_host_key, known_hosts, username)
+                if transport is not None and (key != transport_key or not transport.is_active()):
+                    transport.close()
+                    transport = None
+
+                # A reused connection the server closed in the meantime (after
+                # MaxAuthTries) never evaluated this attempt, so it is sent
+                # again once on a new connection. A new connection that drops
+                # during auth is reported - retrying it could cost the
+                # account a second failed attempt.
+                for retry in ((False, True) if transport is not None else (True,)):
+                    if transport is None:
+                        transport = _open_transport(paramiko, host, port_num, verify_host_key, known_hosts)
+                        transport_key = key
                     try:
-                        pkey = paramiko.ECDSAKey.from_private_key_file(private_key_path, password=password)
-                    except:
-                        pkey = paramiko.DSSKey.from_private_key_file(private_key_path, password=password)
-            connect_kwargs['pkey'] = pkey
-        
-        # Connect
-        client.connect(**connect_kwargs)
-        
-        # Get some info
-        transport = client.get_transport()
-        remote_version = transport.remote_version if transport else "unknown"
-        
-        # Run a simple command to verify
-        stdin, stdout, stderr = client.exec_command('echo "auth_test"')
-        output = stdout.read().decode().strip()
-        
-        client.close()
-        
-        if output == "auth_test":
-            return True, f"Successfully authenticated to SSH server at {host}:{port_num}\nServer version: {remote_version}"
-        else:
-            return True, f"Authenticated but command test gave unexpected output: {output}"
-            
-    except paramiko.AuthenticationException:
-        return False, "Authentication failed: Invalid credentials"
-    except paramiko.SSHException as e:
-        return False, f"SSH error: {e}"
-    except Exception as e:
-        return False, f"Error: {e}"
+                        if pkey is not None:
+                            transport.auth_publickey(username, pkey)
+                        else:
+                            transport.auth_password(username, password)
+                        break
+                    except (paramiko.SSHException, EOFError, OSError):
+                        # paramiko reports a disconnect during auth as a
+                        # failed login; only a live transport gave an answer
+                        if transport.is_active() or retry:
+                            raise
+                        transport.close()
+                        transport = None
+
+                remote_version = transport.remote_version or "unknown"
+
+                # Run a simple command to verify
+                output = _run_test_command(transport) if run_test_command else None
+
+                # An authenticated connection cannot be reused for another login
+                transport.close()
+                transport = None
+
+                if output is None or output == "auth_test":
+                    yield True, f"Successfully authenticated to SSH server at {host}:{port_num}\nServer version: {remote_version}"
+                else:
+                    yield True, f"Authenticated but command test gave unexpected output: {output}"
 
+            except paramiko.AuthenticationException:
+                yield False, "Authentication failed: Invalid credentials"
+            except paramiko.SSHException as e:
+                if transport is not None:
+                    transport.close()
+                    transport = None
+                yield False, f"SSH error: {e}"
+            except Exception as e:
+                if transport is not None:
+                    transport.close()
+                    transport = None
+                yield False, f"Error: {e}"
+    finally:
+        if transport is not None:
+            transport.close()
+
+
+def authenticate(form_data):
+    """
+    Attempt to authenticate via SSH.
+
+    Args:
+        form_data (dict): Form field values
+
+    Returns:
+        tuple: (success: bool, message: str)
+    """
+    sweep = authenticate_sweep([form_data])
+    try:
+        return next(sweep)
+    finally:
+        sweep.close()
@@ -47,10 +47,8 @@ def authenticate(form_data):
             cluster_args['auth_provider'] = auth_provider
         
         if use_ssl:
-            import ssl
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            from auth_utils import create_ssl_context
+            ssl_context = create_ssl_context(verify_cert=False)
             cluster_args['ssl_context'] = ssl_context
         
         cluster = Cluster(**cluster_args)
@@ -2,6 +2,9 @@
 
 module_description = "Siemens S7 PLC (ICS)"
 
+# Native driver - run in a worker process (see process_lane.py)
+execution_lane = "process"
+
 form_fields = [
     {"name": "host", "type": "text", "label": "PLC Host", "default": "192.168.0.1"},
     {"name": "port", "type": "text", "label": "Port", "default": "102"},
@@ -20,6 +20,8 @@ form_fields = [
     {"name": "hints", "type": "readonly", "label": "Hints", "default": "admin / (set during setup). HTTP: 5000, HTTPS: 5001"},
 ]
 
+verification_depths = ["auth-only", "identity", "full"]
+
 
 def authenticate(form_data):
     """
@@ -29,6 +31,7 @@ def authenticate(form_data):
         import requests
     except ImportError:
         return False, "requests package not installed"
+    from auth_utils import DEPTH_AUTH_ONLY, verification_depth
     
     host = form_data.get('host', '').strip()
     port = form_data.get('port', '5001').strip()
@@ -37,6 +40,7 @@ def authenticate(form_data):
     password = form_data.get('password', '')
     otp_code = form_data.get('otp_code', '').strip()
     verify_ssl = form_data.get('verify_ssl', False)
+    depth = verification_depth(form_data)
     
     if not host:
         return False, "Host is required"
@@ -73,6 +77,10 @@ def authenticate(form_data):
             if data.get("success"):
                 sid = data.get("data", {}).get("sid")
                 
+                # The sid proves the credentials; the session times out on its own
+                if depth == DEPTH_AUTH_ONLY:
+                    return True, f"Successfully authenticated to Synology DSM at {host}:{port}"
+                
                 # Get DSM info
                 info_url = f"{base_url}/webapi/entry.cgi"
                 info_params = {
@@ -2,6 +2,9 @@
 
 module_description = "IBM TSO/ISPF (Mainframe)"
 
+# Native driver - run in a worker process (see process_lane.py)
+execution_lane = "process"
+
 form_fields = [
     {"name": "host", "type": "text", "label": "z/OS Host", "default": ""},
     {"name": "port", "type": "text", "label": "TN3270 Port", "default": "23",
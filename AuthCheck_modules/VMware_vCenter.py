@@ -16,6 +16,8 @@ form_fields = [
     {"name": "hints", "type": "readonly", "label": "Hints", "default": "administrator@vsphere.local / (set during install). Port 443 for vSphere API."},
 ]
 
+verification_depths = ["auth-only", "identity", "full"]
+
 
 def authenticate(form_data):
     """Attempt to authenticate to VMware vCenter."""
@@ -23,11 +25,13 @@ def authenticate(form_data):
         import requests
     except ImportError:
         return False, "requests package not installed"
+    from auth_utils import DEPTH_AUTH_ONLY, DEPTH_IDENTITY, verification_depth
     
     host = form_data.get('host', '').strip()
     username = form_data.get('username', '').strip()
     password = form_data.get('password', '')
     verify_ssl = form_data.get('verify_ssl', False)
+    depth = verification_depth(form_data)
     
     if not host:
         return False, "vCenter Host is required"
@@ -50,9 +54,22 @@ def authenticate(form_data):
         if response.status_code == 201:
             session_token = response.json()
             
+            # The session token proves the credentials; it times out on its own
+            if depth == DEPTH_AUTH_ONLY:
+                return True, f"Successfully authenticated to vCenter\nUser: {username}"
+            
             # Get vCenter info
             headers = {'vmware-api-session-id': session_token}
             
+            if depth == DEPTH_IDENTITY:
+                # Whom the session belongs to
+                session_user = username
+                whoami_resp = session.get(auth_url, headers=headers, timeout=10)
+                if whoami_resp.status_code == 200 and isinstance(whoami_resp.json(), dict):
+                    session_user = whoami_resp.json().get('user', username)
+                session.delete(auth_url, headers=headers, timeout=5)
+                return True, f"Successfully authenticated to vCenter\nUser: {session_user}"
+            
             # Get system info
             about_resp = session.get(f"{host}/api/vcenter/system/config/global/info",
                                     headers=headers, timeout=10)
@@ -15,7 +15,6 @@ def authenticate(form_data):
     """Test VTAM connectivity."""
     try:
         import socket
-        import ssl
         
         host = form_data.get("host", "")
         port = int(form_data.get("port", 23))
@@ -25,9 +24,8 @@ def authenticate(form_data):
         sock.settimeout(30)
         
         if use_ssl:
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
+            from auth_utils import create_ssl_context
+            context = create_ssl_context(verify_cert=False)
             sock = context.wrap_socket(sock, server_hostname=host)
         
         sock.connect((host, port))
@@ -0,0 +1,56 @@
+# AuthCheck tests - check deadlines on sockets
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import socket
+import ssl
+import time
+
+import pytest
+
+import auth_utils
+
+
+@pytest.fixture
+def listener():
+    server = socket.create_server(('127.0.0.1', 0))
+    try:
+        yield server.getsockname()
+    finally:
+        server.close()
+
+
+def _wrap_unconnected():
+    """Wrap a socket before connect(), the way ldap3 does."""
+    context = ssl.create_default_context()
+    return context.wrap_socket(socket.socket(), server_hostname='localhost', do_handshake_on_connect=False)
+
+
+def test_socket_wrapped_before_connect_is_capped(listener):
+    auth_utils.install_socket_deadlines()
+    with auth_utils.check_deadline(0.5):
+        sock = _wrap_unconnected()
+        try:
+            assert isinstance(sock, auth_utils.CheckSSLSocket)
+            sock.settimeout(30)
+            assert sock.gettimeout() <= 0.5
+            sock.connect(listener)
+            assert sock.gettimeout() <= 0.5
+        finally:
+            sock.close()
+
+
+def test_socket_wrapped_before_connect_stops_at_deadline(listener):
+    auth_utils.install_socket_deadlines()
+    with auth_utils.check_deadline(0.05):
+        sock = _wrap_unconnected()
+        try:
+            time.sleep(0.1)
+            with pytest.raises(auth_utils.DeadlineExceeded):
+                sock.connect(listener)
+        finally:
+            sock.close()
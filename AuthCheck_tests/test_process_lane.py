@@ -0,0 +1,63 @@
+# AuthCheck tests - process lane worker start-up
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import stat
+import sys
+import time
+
+import pytest
+
+import process_lane
+
+
+@pytest.fixture
+def modules_dir(tmp_path):
+    (tmp_path / 'Echo.py').write_text("def authenticate(form_data):\n    return True, 'ok'\n")
+    return str(tmp_path)
+
+
+def _fake_interpreter(tmp_path, body):
+    """Write a shell script to stand in for sys.executable."""
+    script = tmp_path / 'fake_python'
+    script.write_text(f"#!/bin/sh\n{body}\n")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="uses a shell script as the interpreter")
+def test_worker_that_exits_fails_fast_and_lane_recovers(tmp_path, modules_dir, monkeypatch):
+    lane = process_lane.ProcessLane(modules_dir, workers=1)
+    try:
+        with monkeypatch.context() as patch:
+            patch.setattr(sys, 'executable', _fake_interpreter(tmp_path, 'exit 3'))
+            start = time.monotonic()
+            success, message = lane.call('Echo', {}, deadline=5)
+            assert time.monotonic() - start < 5
+        assert not success
+        assert 'exit code 3' in message
+
+        # The slot was returned: a real worker starts on the next call
+        assert lane.call('Echo', {}, deadline=30) == (True, 'ok')
+    finally:
+        lane.close()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="uses a shell script as the interpreter")
+def test_worker_that_never_connects_stops_at_deadline(tmp_path, modules_dir, monkeypatch):
+    monkeypatch.setattr(sys, 'executable', _fake_interpreter(tmp_path, 'exec sleep 30'))
+    lane = process_lane.ProcessLane(modules_dir, workers=1)
+    try:
+        start = time.monotonic()
+        success, message = lane.call('Echo', {}, deadline=1.0)
+        elapsed = time.monotonic() - start
+        assert not success
+        assert 'did not connect' in message
+        assert elapsed < 3
+        assert lane._slots.qsize() == 1
+    finally:
+        lane.close()
@@ -0,0 +1,100 @@
+# AuthCheck tests - scheduler lockout budgets
+# Copyright (C) 2025 Garland Glessner - gglessner@gmail.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import pytest
+
+import scheduler
+
+
+class FakeClock:
+    """Monotonic clock the test moves by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _job(username, password, module='LDAP'):
+    return {'module': module, 'target': 'h1', 'username': username, 'secret': password}
+
+
+def _sweep(*jobs):
+    return {'module': jobs[0]['module'], 'target': 'h1', 'username': None, 'sweep': list(jobs)}
+
+
+def _run(sched, status):
+    """Start the next job and finish it with a status; return the job."""
+    job, host, delay = sched.next_job()
+    assert job is not None, f"no job ready (delay {delay})"
+    sched.finished(job, host, {'status': status})
+    return job
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_failures_pace_account_until_window_passes(clock):
+    sched = scheduler.Scheduler(lockout_budgets={'LDAP': (2, 60)}, clock=clock)
+    for password in ('a', 'b', 'c'):
+        sched.add(_job('alice', password), 'h1')
+
+    _run(sched, 'failed')
+    clock.now += 10
+    _run(sched, 'failed')
+
+    # Budget spent: the third attempt waits until the first failure ages out
+    job, _, delay = sched.next_job()
+    assert job is None
+    assert delay == pytest.approx(50)
+
+    clock.now += 49
+    assert sched.next_job()[0] is None
+    clock.now += 1
+    assert _run(sched, 'failed')['secret'] == 'c'
+
+
+def test_success_clears_failures(clock):
+    sched = scheduler.Scheduler(lockout_budgets={'LDAP': (2, 60)}, clock=clock)
+    for password in ('a', 'b', 'c', 'd'):
+        sched.add(_job('alice', password), 'h1')
+
+    _run(sched, 'failed')
+    _run(sched, 'success')
+    _run(sched, 'failed')
+    # Only one failure since the success, so the budget still has room
+    assert _run(sched, 'failed')['secret'] == 'd'
+
+
+def test_modules_without_budget_are_not_paced(clock):
+    sched = scheduler.Scheduler(lockout_budgets={'LDAP': (1, 60)}, clock=clock)
+    for password in ('a', 'b', 'c'):
+        sched.add(_job('alice', password, module='FTP'), 'h1')
+    for _ in range(3):
+        _run(sched, 'failed')
+
+
+def test_sweep_is_charged_per_account(clock):
+    sched = scheduler.Scheduler(lockout_budgets={'LDAP': (1, 60)}, clock=clock)
+    alice, bob = _job('alice', 'a'), _job('bob', 'a')
+    sched.add(_sweep(alice, bob), 'h1')
+    sched.add(_job('alice', 'b'), 'h1')
+    sched.add(_job('bob', 'b'), 'h1')
+
+    sweep, host, _ = sched.next_job()
+    assert sweep['sweep'] == [alice, bob]
+    sched.finished_sweep(sweep, host, [(alice, {'status': 'failed'}), (bob, {'status': 'success'})])
+
+    # alice's failure spent her budget; bob's success left his untouched
+    assert _run(sched, 'failed')['username'] == 'bob'
+    job, _, delay = sched.next_job()
+    assert job is None
+    assert delay == pytest.approx(60)